@@ -0,0 +1,76 @@
+"""
+Active-time battles with many combatants: every fighter's gauge drains through the engine tick systems.
+The player is made unkillable and never acts, so the battle keeps going for the whole run while
+a consumer stands in for the UI and takes events off the engine queue.
+Ticks are counted from the moment the battle registers its tick systems, after the enemies were spawned.
+Usage: python -m benchmarks.atb_battle [seconds]
+"""
+import sys
+import time
+import asyncio
+
+from benchmarks.bootstrap import init_globals
+
+
+async def consume(queue, counts: dict) -> None:
+    while True:
+        event = await queue.get()
+        name = type(event).__name__
+        counts[name] = counts.get(name, 0) + 1
+
+
+async def measure(combatants: int, rate: float, seconds: float) -> None:
+    from engine.engine import GameEngine
+    from engine.battle_resolver import BattleResolver
+    from engine.components.living_entity_components import StatsComponent
+    from events.event_queue import EventQueue
+    from global_state.consts import ENGINE_TO_UI_QUEUE_SIZE, UI_TO_ENGINE_QUEUE_SIZE
+    from global_state.game_consts import PlayerClass
+
+    engine_to_ui = EventQueue(ENGINE_TO_UI_QUEUE_SIZE, "engine_to_ui")
+    engine = GameEngine(EventQueue(UI_TO_ENGINE_QUEUE_SIZE, "ui_to_engine"), engine_to_ui, owns_config=False, owns_process=False)
+    engine.scheduler.get_rate = lambda: rate
+    engine.initialize_world()
+    engine.create_player("Bench", PlayerClass.WARRIOR)
+    stats: StatsComponent = engine.world.get_component(engine.player_id, StatsComponent)
+    stats.health = stats.max_health = 10**9
+
+    resolver = engine.battle_resolver = BattleResolver(engine, engine.world, engine.player_id, engine.entity_factory)
+    counts = {}
+    consumer = asyncio.create_task(consume(engine_to_ui, counts))
+    battle = asyncio.create_task(resolver.run_realtime_battle(combatants - 1))
+    engine.resume()
+    ticks = asyncio.create_task(engine.scheduler.run())
+
+    # The scheduler sleeps until the battle registers its tick systems, the window starts there
+    while not engine.scheduler.snapshot()["systems"]:
+        await asyncio.sleep(0.001)
+    start_ticks, start_dropped, start = engine.scheduler.tick_count, engine.scheduler.dropped_ticks, time.perf_counter()
+    await asyncio.sleep(seconds)
+    elapsed = time.perf_counter() - start
+    ticked, dropped = engine.scheduler.tick_count - start_ticks, engine.scheduler.dropped_ticks - start_dropped
+    engine.scheduler.stop()
+    await ticks
+    battle.cancel()
+    await battle
+    consumer.cancel()
+
+    snapshot = engine.scheduler.snapshot()
+    expected = rate * elapsed
+    print(
+        f"{combatants:4d} combatants @ {rate:3.0f} Hz: {ticked / expected:6.1%} of ticks, "
+        f"{dropped} dropped, tick p50 {snapshot['tick_duration']['p50'] * 1000:5.2f} ms "
+        f"p99 {snapshot['tick_duration']['p99'] * 1000:5.2f} ms, "
+        f"{counts.get('BattleLogEvent', 0) / seconds:7.1f} log events/s"
+    )
+
+
+def main(seconds: float) -> None:
+    init_globals()
+    for combatants in (3, 100, 500):
+        for rate in (20, 100):
+            asyncio.run(measure(combatants, rate, seconds))
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
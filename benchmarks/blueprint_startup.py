@@ -0,0 +1,68 @@
+"""
+Cold vs warm EntityFactory startup on a generated enemy roster.
+Usage: python -m benchmarks.blueprint_startup [enemy_count]
+"""
+import os
+import sys
+import time
+import tempfile
+
+import yaml
+
+from benchmarks.bootstrap import init_globals
+from engine.consts import DataPaths
+
+
+def write_roster(path: str, amount: int) -> None:
+    abilities = [
+        [{"id": "basic_attack"}],
+        [{"id": "basic_attack"}, {"id": "battle_cry", "scope": "SELF", "bonus": 0.3, "ap_cost": 3, "turns": 2}],
+        [{"id": "basic_attack"}, {"id": "player_heal", "scope": "ALLIES", "value": 15, "ap_cost": 2}],
+    ]
+    roster = {
+        100 + i: {
+            "name": f"enemy_{i}",
+            "health": 30 + i % 50,
+            "attack": 5 + i % 7,
+            "speed": 90 + i % 50,
+            "probability": round(0.1 + (i % 10) / 10, 2),
+            "abilities": abilities[i % len(abilities)]
+        }
+        for i in range(amount)
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(roster, f)
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(amount: int) -> None:
+    init_globals()
+    from engine.entity_factory import EntityFactory
+    from engine.blueprints.blueprint_cache import SafeLoader
+
+    player_filepath = os.path.join(DataPaths.DATA_FOLDER.value, DataPaths.PLAYER_CLASSES.value)
+    with tempfile.TemporaryDirectory() as tmp:
+        enemy_filepath = os.path.join(tmp, "enemies.yaml")
+        cache_filepath = os.path.join(tmp, "blueprints.cache")
+        write_roster(enemy_filepath, amount)
+
+        no_cache = timed(lambda: EntityFactory(enemy_filepath, player_filepath))
+        cold = timed(lambda: EntityFactory(enemy_filepath, player_filepath, cache_filepath))
+        warm = timed(lambda: EntityFactory(enemy_filepath, player_filepath, cache_filepath))
+        os.utime(enemy_filepath)
+        touched = timed(lambda: EntityFactory(enemy_filepath, player_filepath, cache_filepath))
+
+    print(f"Roster: {amount} enemies, loader: {SafeLoader.__name__}")
+    print(f"  no cache         {no_cache * 1000:9.1f} ms")
+    print(f"  cold (build+save){cold * 1000:9.1f} ms")
+    print(f"  warm             {warm * 1000:9.1f} ms  ({no_cache / warm:.1f}x)")
+    print(f"  touched (rehash) {touched * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,7 @@
+"""Shared setup for benchmark scripts. Run them from the repository root, e.g. `python -m benchmarks.blueprint_startup`"""
+from global_state.context import create_context
+
+
+def init_globals(log_level: str = "WARNING") -> None:
+    """Sets up the process session the same way Client does, without starting the UI or the engine"""
+    create_context(log_level, keep_log=True, process_default=True)
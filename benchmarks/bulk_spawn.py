@@ -0,0 +1,41 @@
+"""
+Wave spawning: one create_entity call per enemy vs a single create_entities call.
+Usage: python -m benchmarks.bulk_spawn [wave_size]
+"""
+import os
+import sys
+import time
+
+from benchmarks.bootstrap import init_globals
+from engine.consts import DataPaths
+
+
+def main(amount: int) -> None:
+    init_globals()
+    from engine.entity_factory import EntityFactory
+    from engine.world import World
+
+    enemy_filepath = os.path.join(DataPaths.DATA_FOLDER.value, DataPaths.ENEMIES.value)
+    player_filepath = os.path.join(DataPaths.DATA_FOLDER.value, DataPaths.PLAYER_CLASSES.value)
+    factory = EntityFactory(enemy_filepath, player_filepath)
+
+    print(f"Wave size: {amount}")
+    for blueprint in factory._enemy_blueprints.values():
+        world = World()
+        factory.ability_factory.create_singletons(world)
+        start = time.perf_counter()
+        for _ in range(amount):
+            factory.create_entity(world, blueprint)
+        single = time.perf_counter() - start
+
+        world = World()
+        factory.ability_factory.create_singletons(world)
+        start = time.perf_counter()
+        factory.create_entities(world, blueprint, amount)
+        bulk = time.perf_counter() - start
+
+        print(f"  {blueprint.name_key:<18} single {single / amount * 1e6:7.2f} us/entity   bulk {bulk / amount * 1e6:7.2f} us/entity")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,81 @@
+"""
+Throughput and latency of the engine <-> UI binary protocol.
+Usage: python -m benchmarks.engine_protocol [amount]
+"""
+import sys
+import time
+import statistics
+import multiprocessing
+from multiprocessing.connection import Connection
+
+
+def make_events() -> list:
+    from events.events import BattleLogEvent, StatsChangeEvent, EntityDeathEvent, StartPlayerTurnEvent
+    from events.event_containers import EntityContainer, AbilityContainer
+    from global_state.game_consts import Scope
+    from util import wrap_key
+
+    entity = EntityContainer(4, "entities.goblin", 32, 50, 1, 3, 5)
+    ability = AbilityContainer(1, -1, Scope.ENEMIES, "abilities.basic_attack", "abilities.basic_attack_tooltip", {"AP": -1}, True)
+    return [
+        BattleLogEvent("entities.health_reminder", {"NAME": wrap_key("entities.goblin"), "HEALTH": 32}),
+        StatsChangeEvent([entity, entity]),
+        EntityDeathEvent(4),
+        StartPlayerTurnEvent(0, [ability, ability, ability]),
+    ]
+
+
+def echo(conn: Connection) -> None:
+    """Child side: decodes every message and sends it back re-encoded, like the engine bridge would"""
+    from events.codec import EventCodec
+    codec = EventCodec()
+    while True:
+        try:
+            data = conn.recv_bytes()
+        except EOFError:
+            return
+        conn.send_bytes(codec.encode_many(codec.decode_many(data)))
+
+
+def main(amount: int) -> None:
+    from events.codec import EventCodec
+    codec = EventCodec()
+    events = make_events()
+
+    print(f"Codec, {amount} events per type")
+    for event in events:
+        start = time.perf_counter()
+        for _ in range(amount):
+            codec.decode(codec.encode(event))
+        elapsed = time.perf_counter() - start
+        print(f"  {type(event).__name__:<22} {len(codec.encode(event)):4d} B  {amount / elapsed:10.0f} events/s (encode+decode)")
+
+    parent_conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=echo, args=(child_conn,), daemon=True)
+    process.start()
+
+    latencies = []
+    for i in range(amount):
+        start = time.perf_counter()
+        parent_conn.send_bytes(codec.encode_many([events[i % len(events)]]))
+        codec.decode_many(parent_conn.recv_bytes())
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"Pipe round trip, single event: p50 {statistics.median(latencies) * 1e6:.0f} us, p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.0f} us")
+
+    for batch_size in (1, 16, 128):
+        batch = [events[i % len(events)] for i in range(batch_size)]
+        batches = max(1, amount // batch_size)
+        start = time.perf_counter()
+        for _ in range(batches):
+            parent_conn.send_bytes(codec.encode_many(batch))
+            codec.decode_many(parent_conn.recv_bytes())
+        elapsed = time.perf_counter() - start
+        print(f"Pipe echo, batches of {batch_size:3d}: {batches * batch_size / elapsed:10.0f} events/s")
+
+    parent_conn.close()
+    process.join(timeout=1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,51 @@
+"""
+Cost of routing one event: a chain of match class patterns vs EventBus's dispatch dictionary.
+Usage: python -m benchmarks.event_dispatch [type_count]
+"""
+import sys
+import timeit
+from dataclasses import make_dataclass
+
+from events.events import Event
+from events.event_bus import EventBus
+
+
+def make_match_router(event_types: list[type], handler) -> callable:
+    """Builds the equivalent of the old process_events match statement with one case per type"""
+    namespace = {cls.__name__: cls for cls in event_types}
+    namespace["handler"] = handler
+    cases = "\n".join(f"        case {cls.__name__}():\n            handler(event)" for cls in event_types)
+    source = f"def route(event):\n    match event:\n{cases}\n        case _:\n            pass\n"
+    exec(source, namespace)
+    return namespace["route"]
+
+
+def main(type_count: int) -> None:
+    event_types = [make_dataclass(f"SyntheticEvent{i}", [("value", int)], bases=(Event,), frozen=True, slots=True) for i in range(type_count)]
+    handled = []
+    handler = handled.append
+
+    route = make_match_router(event_types, handler)
+    bus = EventBus()
+    for cls in event_types:
+        bus.subscribe(cls, handler)
+
+    samples = {
+        "first type": [event_types[0](1)],
+        "middle type": [event_types[type_count // 2](1)],
+        "last type": [event_types[-1](1)],
+        "uniform mix": [cls(1) for cls in event_types],
+    }
+    number = 200000
+    print(f"{type_count} event types, ns per event")
+    for name, events in samples.items():
+        loops = max(1, number // len(events))
+        match_time = timeit.timeit(lambda: [route(e) for e in events], number=loops) / (loops * len(events))
+        bus_time = timeit.timeit(lambda: [bus.dispatch(e) for e in events], number=loops) / (loops * len(events))
+        batch_time = timeit.timeit(lambda: bus.dispatch_many(events), number=loops) / (loops * len(events))
+        handled.clear()
+        print(f"  {name:<12} match {match_time * 1e9:7.0f}   bus.dispatch {bus_time * 1e9:7.0f}   bus.dispatch_many {batch_time * 1e9:7.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 60)
@@ -0,0 +1,86 @@
+"""
+How busy the client is while nothing happens: CPU usage and event loop wakeups per second on the
+title screen and on the battle screen while the player's turn waits for input.
+Runs the whole client in-process with a pipe for input and no terminal output.
+Usage: python -m benchmarks.idle_wakeups [seconds]
+"""
+import sys
+import time
+import asyncio
+
+from benchmarks.bootstrap import init_globals
+
+
+def context_switches() -> int:
+    try:
+        with open("/proc/self/status") as file:
+            return sum(int(line.split()[1]) for line in file if "ctxt_switches" in line)
+    except OSError:
+        return 0
+
+
+async def measure(label: str, seconds: float) -> None:
+    loop = asyncio.get_running_loop()
+    selector = loop._selector
+    wakeups = 0
+    select = selector.select
+
+    def counting_select(timeout=None):
+        nonlocal wakeups
+        wakeups += 1
+        return select(timeout)
+
+    selector.select = counting_select
+    cpu, wall, switches = time.process_time(), time.perf_counter(), context_switches()
+    await asyncio.sleep(seconds)
+    cpu, wall, switches = time.process_time() - cpu, time.perf_counter() - wall, context_switches() - switches
+    selector.select = select
+    print(f"{label:<28} CPU {cpu / wall:6.2%}  wakeups {wakeups / wall:7.1f}/s  context switches {switches / wall:7.1f}/s")
+
+
+async def wait_until(condition, timeout: float = 30.0) -> None:
+    end = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > end:
+            raise TimeoutError("The client never got there")
+        await asyncio.sleep(0.1)
+
+
+async def run(seconds: float) -> None:
+    from prompt_toolkit.application import create_app_session
+    from prompt_toolkit.input import create_pipe_input
+    from prompt_toolkit.output import DummyOutput
+    from global_state.client import Client
+    from ui.layouts import BattleScreen
+
+    settle = 1.0
+    with create_pipe_input() as pipe, create_app_session(input=pipe, output=DummyOutput()):
+        client = Client(["client"])
+        # The benchmark plays turn-based, ATB keeps the engine ticking on purpose
+        client.config.main.battle_mode = "turns"
+        task = asyncio.create_task(client.run())
+        await asyncio.sleep(settle)
+        await measure("title screen", seconds)
+
+        # New game, keep the default name and class
+        for keys in ("\r", "\r", "Bob\r", "\x1b[B", "\x1b[B", "\r"):
+            pipe.send_text(keys)
+            await asyncio.sleep(0.3)
+        await wait_until(lambda: isinstance(client.ui.battle_screen, BattleScreen) and client.engine.battle_resolver.is_player_turn)
+        battle_log = client.ui.battle_screen.battle_log
+        await wait_until(lambda: not battle_log.backlog() and not battle_log.writing)
+        await asyncio.sleep(settle)
+        await measure("battle screen, player turn", seconds)
+
+        client.ui.app.exit()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def main(seconds: float) -> None:
+    init_globals()
+    asyncio.run(run(seconds))
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
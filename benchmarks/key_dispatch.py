@@ -0,0 +1,84 @@
+"""
+Cost of handling one key press, redraw excluded: arrow keys are fed straight to the key processor
+of a running UiController on the title and settings screens, and through the target list of a
+battle screen with 3 and 200 combatants. Allocations are counted in a second
+pass with tracemalloc.
+Usage: python -m benchmarks.key_dispatch [presses]
+"""
+import sys
+import time
+import asyncio
+import tracemalloc
+
+from benchmarks.bootstrap import init_globals
+
+
+def press(app, keys: list) -> None:
+    for key in keys:
+        app.key_processor.feed(key)
+        app.key_processor.process_keys()
+
+
+def start_targeting(ui, combatants: int) -> None:
+    from events.events import StartBattleEvent
+    from events.event_containers import EntityContainer, AbilityContainer
+    from global_state.game_consts import Scope
+
+    heroes = [EntityContainer(0, "unloc.player", 100, 100, 3, 3, 5)]
+    enemies = [EntityContainer(i, "entities.goblin", 30, 30, 1, 3, 5) for i in range(1, combatants)]
+    ui.event_parser.start_battle(StartBattleEvent(heroes, enemies))
+    ability = AbilityContainer(1, -1, Scope.ENEMIES, "abilities.basic_attack", "abilities.basic_attack_tooltip", {"AP": -1}, True)
+    ui.battle_screen.prepare_action(ability)
+
+
+async def measure(label: str, presses: int, combatants: int = 0) -> None:
+    from prompt_toolkit.application import create_app_session
+    from prompt_toolkit.input import create_pipe_input
+    from prompt_toolkit.keys import Keys
+    from prompt_toolkit.key_binding.key_processor import KeyPress
+    from prompt_toolkit.output import DummyOutput
+    from events.event_queue import EventQueue
+    from ui.ui_controller import UiController
+    from ui.layouts.settings_screen import SettingsScreen
+
+    with create_pipe_input() as pipe, create_app_session(input=pipe, output=DummyOutput()):
+        ui = UiController(EventQueue(), EventQueue())
+        app_task = asyncio.create_task(ui.run_app())
+        await asyncio.sleep(0.1)
+        if label == "settings":
+            ui.switch_screen(SettingsScreen(ui, ui.current_screen, in_game=False))
+        if combatants:
+            start_targeting(ui, combatants)
+        keys = [KeyPress(Keys.Down), KeyPress(Keys.Up)] * (presses // 2)
+        press(ui.app, keys[:20])
+
+        start = time.perf_counter()
+        press(ui.app, keys)
+        elapsed = time.perf_counter() - start
+
+        allocated = 0
+        tracemalloc.start()
+        for key in keys[:200]:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            press(ui.app, [key])
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+
+        if ui.battle_screen:
+            ui.battle_screen.cleanup()
+        ui.app.exit()
+        await asyncio.gather(app_task, return_exceptions=True)
+    print(f"{label:<20} {elapsed / len(keys) * 1e6:8.1f} us/key press  {allocated / 200 / 1024:7.1f} KiB allocated/key press")
+
+
+def main(presses: int) -> None:
+    init_globals()
+    for label in ("title", "settings"):
+        asyncio.run(measure(label, presses))
+    for combatants in (3, 200):
+        asyncio.run(measure(f"battle targets, {combatants}", presses, combatants))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
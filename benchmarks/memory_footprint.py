@@ -0,0 +1,62 @@
+"""
+tracemalloc footprint of spawned entities and of engine events.
+Usage: python -m benchmarks.memory_footprint [amount]
+"""
+import os
+import sys
+import tracemalloc
+
+from benchmarks.bootstrap import init_globals
+from engine.consts import DataPaths
+
+
+def measure(func) -> int:
+    """Returns bytes still allocated by func's result once it returns"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main(amount: int) -> None:
+    init_globals()
+    from engine.entity_factory import EntityFactory
+    from engine.world import World
+    from engine.systems.battle_systems import subscribe_for_fight
+    from engine.systems.wrappers import wrap_entity
+    from events.events import BattleLogEvent, StatsChangeEvent, EntityDeathEvent, EndPlayerTurnEvent
+
+    enemy_filepath = os.path.join(DataPaths.DATA_FOLDER.value, DataPaths.ENEMIES.value)
+    player_filepath = os.path.join(DataPaths.DATA_FOLDER.value, DataPaths.PLAYER_CLASSES.value)
+    factory = EntityFactory(enemy_filepath, player_filepath)
+
+    print(f"Amount: {amount}")
+    for blueprint in factory._enemy_blueprints.values():
+        def spawn():
+            world = World()
+            factory.ability_factory.create_singletons(world)
+            ids = [factory.create_entity(world, blueprint) for _ in range(amount)]
+            subscribe_for_fight(world, *ids)
+            return world
+        print(f"  entity {blueprint.name_key:<28} {measure(spawn) / amount:8.1f} B")
+
+    world = World()
+    factory.ability_factory.create_singletons(world)
+    entity_id = factory.create_entity(world, factory._enemy_blueprints[100])
+    container = wrap_entity(world, entity_id)
+    events = {
+        "BattleLogEvent": lambda: [BattleLogEvent("entities.health_reminder", {"HEALTH": i}) for i in range(amount)],
+        "StatsChangeEvent (1 entity)": lambda: [StatsChangeEvent([container]) for _ in range(amount)],
+        "EntityDeathEvent": lambda: [EntityDeathEvent(i) for i in range(amount)],
+        "EndPlayerTurnEvent": lambda: [EndPlayerTurnEvent() for _ in range(amount)],
+        "EntityContainer": lambda: [wrap_entity(world, entity_id) for _ in range(amount)],
+    }
+    for name, func in events.items():
+        print(f"  event  {name:<28} {measure(func) / amount:8.1f} B")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,99 @@
+"""
+What the terminal gets: CPU usage, redraws and bytes written per second with the whole client running
+in-process behind a real VT100 output, idle on the title screen and during an active-time battle where
+the player never acts. Event-driven redraw runs against the old fixed refresh_interval.
+Bytes are also given as a share of a slow SSH link, above 100% the link falls behind the screen.
+Usage: python -m benchmarks.redraw_bandwidth [seconds]
+"""
+import sys
+import time
+import asyncio
+
+from benchmarks.bootstrap import init_globals
+
+LINK_KBITS = 256 # A slow SSH link
+COLUMNS, ROWS = 80, 24
+
+
+class ByteCounter:
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data: str) -> int:
+        self.written += len(data.encode("utf-8"))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+async def wait_until(condition, timeout: float = 30.0) -> None:
+    end = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > end:
+            raise TimeoutError("The client never got there")
+        await asyncio.sleep(0.1)
+
+
+async def measure(label: str, client, sink: ByteCounter, seconds: float) -> None:
+    renders = 0
+
+    def count_render(_):
+        nonlocal renders
+        renders += 1
+
+    client.ui.app.after_render += count_render
+    sink.written = 0
+    cpu, wall = time.process_time(), time.perf_counter()
+    await asyncio.sleep(seconds)
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    client.ui.app.after_render -= count_render
+    rate = sink.written / wall
+    print(
+        f"{label:<34} CPU {cpu / wall:6.2%}  {renders / wall:5.1f} redraws/s  {rate / 1024:7.2f} KiB/s  "
+        f"{rate * 8 / (LINK_KBITS * 1000):6.1%} of {LINK_KBITS} kbit/s"
+    )
+
+
+async def run(fixed_refresh: bool, seconds: float) -> None:
+    from prompt_toolkit.application import create_app_session
+    from prompt_toolkit.data_structures import Size
+    from prompt_toolkit.input import create_pipe_input
+    from prompt_toolkit.output.vt100 import Vt100_Output
+    from global_state.client import Client
+    from ui.layouts import BattleScreen
+
+    mode = "fixed refresh" if fixed_refresh else "event-driven"
+    sink = ByteCounter()
+    output = Vt100_Output(sink, lambda: Size(rows=ROWS, columns=COLUMNS), term="xterm", enable_cpr=False)
+    with create_pipe_input() as pipe, create_app_session(input=pipe, output=output):
+        client = Client(["client"])
+        client.config.main.battle_mode = "atb"
+        if fixed_refresh:
+            # How UiController set up the Application before: a redraw every period, no coalescing
+            client.ui.app.refresh_interval = 1 / client.ui.refresh_rate
+            client.ui.app.min_redraw_interval = None
+        task = asyncio.create_task(client.run())
+        await asyncio.sleep(1.0)
+        await measure(f"{mode}, title screen", client, sink, seconds)
+
+        # New game, keep the default name and class
+        for keys in ("\r", "\r", "Bob\r", "\x1b[B", "\x1b[B", "\r"):
+            pipe.send_text(keys)
+            await asyncio.sleep(0.3)
+        await wait_until(lambda: isinstance(client.ui.battle_screen, BattleScreen))
+        await measure(f"{mode}, battle", client, sink, seconds)
+
+        client.ui.app.exit()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def main(seconds: float) -> None:
+    init_globals()
+    for fixed_refresh in (False, True):
+        asyncio.run(run(fixed_refresh, seconds))
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
@@ -0,0 +1,142 @@
+"""
+Load test for the telnet game server. Starts server.py in a child process, connects simulated
+telnet clients, then measures server memory per session and the input latency: time from sending
+a key on the title menu until the redraw it causes starts arriving.
+Usage: python -m benchmarks.server_load [sessions ...] [--refresh-rate fps] (default: 100 500 sessions, config refresh rate).
+Memory is read from /proc, Linux only.
+"""
+import sys
+import time
+import random
+import asyncio
+import statistics
+import multiprocessing
+from typing import Optional
+
+IAC, SB, SE, WILL = b"\xff", b"\xfa", b"\xf0", b"\xfb"
+NAWS, TTYPE, IS = b"\x1f", b"\x18", b"\x00"
+KEYS = (b"\x1b[B", b"\x1b[A") # Down and up, every press moves the menu selection
+ALTERNATE_SCREEN = b"\x1b[?1049h" # Sent with the first frame of a full screen app
+IDLE_FRAME = b"\x1b[0m" # What a periodic refresh sends when nothing changed
+
+HOST = "127.0.0.1"
+PORT = 2424
+ROUNDS = 20
+READ_TIMEOUT = 10.0 # A round that takes longer counts as timed out, an overloaded server would stall the run otherwise
+
+
+def run_server(port: int, refresh_rate: Optional[str]) -> None:
+    import logging
+    import server
+    # Clients hang up without a goodbye, prompt_toolkit warns about every write to a closed socket
+    logging.getLogger("prompt_toolkit").setLevel(logging.ERROR)
+    argv = ["server.py", "--port", str(port), "--log", "WARNING", "--keep-log"]
+    if refresh_rate:
+        argv += ["--refresh-rate", refresh_rate]
+    server.main(argv)
+
+
+def rss(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as file:
+        for line in file:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+class SimulatedClient:
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.timeouts = 0
+
+    async def connect(self) -> None:
+        self.reader, self.writer = await asyncio.open_connection(HOST, PORT)
+        # Answer the negotiation up front, the server waits for the terminal type before starting the app
+        self.writer.write(IAC + WILL + NAWS + IAC + SB + NAWS + b"\x00\x78\x00\x28" + IAC + SE)
+        self.writer.write(IAC + WILL + TTYPE + IAC + SB + TTYPE + IS + b"xterm" + IAC + SE)
+        await self.writer.drain()
+
+    async def wait_first_frame(self) -> None:
+        while ALTERNATE_SCREEN not in await self.reader.read(65536):
+            pass
+
+    async def _drain(self, duration: float = 0.05) -> None:
+        # Drops whatever is still arriving from the previous redraw. Idle refreshes never stop, so this is timed
+        deadline = time.perf_counter() + duration
+        while (remaining := deadline - time.perf_counter()) > 0:
+            try:
+                await asyncio.wait_for(self.reader.read(65536), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    async def _wait_redraw(self) -> None:
+        while not (await self.reader.read(65536)).replace(IDLE_FRAME, b""):
+            pass
+
+    async def play(self, rounds: int) -> None:
+        for i in range(rounds):
+            await asyncio.sleep(random.uniform(0.2, 0.6)) # Think time
+            await self._drain()
+            start = time.perf_counter()
+            self.writer.write(KEYS[i % 2])
+            await self.writer.drain()
+            try:
+                await asyncio.wait_for(self._wait_redraw(), READ_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                continue
+            self.latencies.append(time.perf_counter() - start)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+async def measure(sessions: int, server_pid: int) -> None:
+    baseline = rss(server_pid)
+    clients = [SimulatedClient() for _ in range(sessions)]
+    # Timed from the first connect: sessions are set up while the others are still connecting
+    start = time.perf_counter()
+    for client in clients:
+        await client.connect()
+    await asyncio.gather(*(client.wait_first_frame() for client in clients))
+    startup = time.perf_counter() - start
+    await asyncio.sleep(2)
+    per_session = (rss(server_pid) - baseline) / sessions
+
+    await asyncio.gather(*(client.play(ROUNDS) for client in clients))
+    latencies = sorted(latency for client in clients for latency in client.latencies)
+    timeouts = sum(client.timeouts for client in clients)
+    for client in clients:
+        client.close()
+    await asyncio.sleep(2) # Sessions shut down before the next run
+
+    result = f"{sessions:5d} sessions: {per_session / 1024:6.0f} KiB per session, all first frames after {startup:5.1f} s"
+    if latencies:
+        result += (
+            f", input latency p50 {statistics.median(latencies) * 1000:7.1f} ms, "
+            f"p99 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000:7.1f} ms"
+        )
+    if timeouts:
+        result += f", {timeouts}/{sessions * ROUNDS} inputs timed out after {READ_TIMEOUT:.0f} s"
+    print(result)
+
+
+def main(session_counts: list[int], refresh_rate: Optional[str] = None) -> None:
+    process = multiprocessing.Process(target=run_server, args=(PORT, refresh_rate), daemon=True)
+    process.start()
+    time.sleep(2)
+    try:
+        for sessions in session_counts:
+            asyncio.run(measure(sessions, process.pid))
+    finally:
+        process.terminate()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    refresh_rate = None
+    if "--refresh-rate" in args:
+        i = args.index("--refresh-rate")
+        refresh_rate = args[i + 1]
+        del args[i:i + 2]
+    main([int(arg) for arg in args] or [100, 500], refresh_rate)
@@ -0,0 +1,75 @@
+"""
+parse_text against the markup renderer it replaced: str.replace per key and color tag, then ANSI,
+which prompt_toolkit parses again into one fragment per character. Times include that conversion
+since every control does it on render.
+Usage: python -m benchmarks.text_markup [iterations]
+"""
+import sys
+import time
+
+from benchmarks.bootstrap import init_globals
+
+LEGACY_COLORS = {
+    "[reset]": "\033[0m",
+    "[red]": "\033[31m",
+    "[green]": "\033[32m",
+    "[yellow]": "\033[33m",
+    "[blue]": "\033[34m",
+    "[bold]": "\033[1m",
+    "[underline]": "\033[4m",
+}
+
+SAMPLES = [
+    ("menu item", "> [green]Start a new game <[reset]", None),
+    ("tooltip", "Press [log_key] to open the log, [quit_key] to leave, [arr_up]/[arr_down] to move", None),
+    ("battle log", "{NAME} has {HEALTH} health left!", {"NAME": "Goblin", "HEALTH": 12}),
+    ("stats", "[bold]{NAME}[reset] HP [red]{HEALTH}/{MAX_HEALTH}[reset] AP [blue]{AP}/{MAX_AP}[reset]",
+     {"NAME": "Orc", "HEALTH": 40, "MAX_HEALTH": 55, "AP": 2, "MAX_AP": 3}),
+]
+
+
+def legacy_parse_text(raw_text, format_template=None):
+    from prompt_toolkit import ANSI
+    from util.text_renderer import KEY_ALIAS
+    import globals as g
+
+    if format_template:
+        resolved = {k: v() if callable(v) else v for k, v in format_template.items()}
+        raw_text = raw_text.format(**resolved)
+    for key_tag, key_val in g.config.keys.get_all_values().items():
+        display_val = KEY_ALIAS.get(key_val.lower(), key_val).upper()
+        raw_text = raw_text.replace(f"[{key_tag}]", display_val)
+    for tag, code in LEGACY_COLORS.items():
+        raw_text = raw_text.replace(tag, code)
+    return ANSI(raw_text)
+
+
+def timed(function, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int) -> None:
+    init_globals()
+    from prompt_toolkit.formatted_text import to_formatted_text
+    from util import parse_text
+    from util.text_renderer import _render
+
+    print(f"{'':<12} {'legacy':>10} {'cold':>10} {'cached':>10}   us per call")
+    for label, text, template in SAMPLES:
+        legacy = timed(lambda: to_formatted_text(legacy_parse_text(text, template)), iterations)
+
+        def cold():
+            _render.cache_clear()
+            return to_formatted_text(parse_text(text, format_template=template))
+
+        cold_time = timed(cold, iterations)
+        cached = timed(lambda: to_formatted_text(parse_text(text, format_template=template)), iterations)
+        fragments = len(to_formatted_text(legacy_parse_text(text, template)))
+        print(f"{label:<12} {legacy:10.2f} {cold_time:10.2f} {cached:10.2f}   ({fragments} -> {len(parse_text(text, format_template=template))} fragments)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
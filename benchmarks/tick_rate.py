@@ -0,0 +1,75 @@
+"""
+Checks that the engine tick rate is met under load. Every rate runs for a few seconds with tick systems
+that burn part of the step, while another coroutine keeps the loop busy with random bursts of work.
+The old relative-sleep loop runs under the same load for comparison.
+Usage: python -m benchmarks.tick_rate [seconds]
+"""
+import sys
+import time
+import random
+import asyncio
+
+
+def burn(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def noisy_neighbour(stop: asyncio.Event) -> None:
+    """Stands in for UI rendering and event handling sharing the loop"""
+    while not stop.is_set():
+        burn(random.uniform(0, 0.004))
+        await asyncio.sleep(random.uniform(0, 0.01))
+
+
+async def legacy_loop(rate: float, seconds: float) -> int:
+    """GameEngine.tick before the scheduler: the next deadline is taken from the clock each time"""
+    ticks = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        next_tick = time.perf_counter()
+        ticks += 1
+        burn(0.2 / rate)
+        next_tick += 1 / rate
+        await asyncio.sleep(max(0, next_tick - time.perf_counter()))
+    return ticks
+
+
+async def measure(rate: float, seconds: float) -> None:
+    from engine.tick_scheduler import TickScheduler
+
+    stop = asyncio.Event()
+    neighbour = asyncio.create_task(noisy_neighbour(stop))
+
+    scheduler = TickScheduler(lambda: rate)
+    # Two systems sharing a fifth of the step
+    scheduler.register(lambda dt: burn(0.15 / rate), order=1, name="heavy")
+    scheduler.register(lambda dt: burn(0.05 / rate), order=0, name="light")
+    scheduler.resume()
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(seconds)
+    scheduler.stop()
+    await task
+    legacy_ticks = await legacy_loop(rate, seconds)
+
+    stop.set()
+    await neighbour
+
+    snapshot = scheduler.snapshot()
+    expected = rate * seconds
+    print(
+        f"{rate:5.0f} Hz: scheduler {snapshot['ticks'] / seconds:6.1f} ticks/s ({snapshot['ticks'] / expected:6.1%}), "
+        f"{snapshot['dropped_ticks']} dropped, jitter p50 {snapshot['jitter']['p50'] * 1000:5.1f} ms "
+        f"p99 {snapshot['jitter']['p99'] * 1000:5.1f} ms, tick p99 {snapshot['tick_duration']['p99'] * 1000:5.1f} ms | "
+        f"old loop {legacy_ticks / seconds:6.1f} ticks/s ({legacy_ticks / expected:6.1%})"
+    )
+
+
+def main(seconds: float) -> None:
+    for rate in (20, 60, 100):
+        asyncio.run(measure(rate, seconds))
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3.0)
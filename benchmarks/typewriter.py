@@ -0,0 +1,112 @@
+"""
+CPU time per battle log message, typewriter included: the frame-batched LogWindow against the old
+one-redraw-per-character typewriter. Both render through a real VT100 output into a byte counter.
+Messages are logged one at a time (normal typing speed) and as a burst (catch-up speed).
+Usage: python -m benchmarks.typewriter [messages]
+"""
+import sys
+import time
+import asyncio
+
+from benchmarks.bootstrap import init_globals
+
+MESSAGE = "entities.health_reminder"
+FRAME_RATE = 30.0 # The default refresh_rate
+
+
+class ByteCounter:
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data: str) -> int:
+        self.written += len(data.encode("utf-8"))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def legacy_log_window():
+    from prompt_toolkit.application import get_app
+    from prompt_toolkit.formatted_text import FormattedText
+    from ui.widgets import LogWindow
+
+    class LegacyLogWindow(LogWindow):
+        async def _typewrite(self, fragments):
+            """The typewriter before frame batching: a new FormattedText and a redraw per character"""
+            self.writing = True
+            self._written.clear()
+            app = get_app()
+            current_output_parts = []
+            self._typing = FormattedText([])
+            app.invalidate()
+            await asyncio.sleep(0.01)
+            for style, text_segment in fragments:
+                for char in text_segment:
+                    current_output_parts.append((style, char))
+                    self._typing = FormattedText(current_output_parts)
+                    app.invalidate()
+                    await asyncio.sleep(self.typewriter_delay if not self._log_queue.qsize() > 0 else self.fast_typeriter_delay)
+            await asyncio.sleep(self.pause_after)
+            self._typing = None
+            app.invalidate()
+            self.writing = False
+            self._written.set()
+
+    return LegacyLogWindow
+
+
+async def measure(label: str, window_class, messages: int, name_length: int, burst: bool) -> None:
+    from prompt_toolkit.application import Application
+    from prompt_toolkit.data_structures import Size
+    from prompt_toolkit.input import create_pipe_input
+    from prompt_toolkit.layout import Layout
+    from prompt_toolkit.output.vt100 import Vt100_Output
+    from events.events import BattleLogEvent
+
+    sink = ByteCounter()
+    output = Vt100_Output(sink, lambda: Size(rows=24, columns=80), term="xterm", enable_cpr=False)
+    with create_pipe_input() as pipe:
+        window = window_class("ui.battle_log", 10, pause_after=0, frame_rate=FRAME_RATE)
+        app = Application(layout=Layout(window.window), input=pipe, output=output)
+        renders = 0
+
+        def count_render(_):
+            nonlocal renders
+            renders += 1
+
+        app.after_render += count_render
+        app_task = asyncio.create_task(app.run_async())
+        await asyncio.sleep(0.2)
+
+        renders, sink.written = 0, 0
+        cpu, wall = time.process_time(), time.perf_counter()
+        for i in range(messages):
+            await window.log(BattleLogEvent(MESSAGE, {"NAME": "x" * name_length, "HEALTH": i}))
+            if not burst:
+                # One at a time runs at the normal speed, a burst at the catch-up one
+                await window._log_queue.join()
+        await window._log_queue.join()
+        cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+
+        window.cleanup()
+        app.exit()
+        await app_task
+    print(
+        f"{label:<10} {'burst' if burst else 'steady':<6} {name_length + 25:4d} chars: {cpu / messages * 1000:7.2f} ms CPU/message "
+        f"({cpu / wall:6.1%} of wall), {renders / messages:6.1f} redraws/message, {sink.written / messages / 1024:7.1f} KiB/message"
+    )
+
+
+def main(messages: int) -> None:
+    init_globals()
+    from ui.widgets import LogWindow
+
+    for burst in (False, True):
+        for name_length in (10, 100):
+            asyncio.run(measure("frames", LogWindow, messages, name_length, burst))
+            asyncio.run(measure("per char", legacy_log_window(), messages, name_length, burst))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,181 @@
+"""
+Headless rendering cost of the UI layouts. A UiController runs without an engine: key presses go in
+through a pipe, engine events are put straight on its queue, and every redraw is timed. prompt_toolkit's
+dummy output writes nothing, so the output is a VT100 writer into a byte counter instead.
+The title and settings screens are driven with arrow keys, the battle screen with a scripted battle:
+StartBattleEvent, then rounds of StatsChangeEvent and BattleLogEvent with an EntityDeathEvent now and then.
+Each event is given time to be drawn before the next one. Redraws are not throttled to the refresh rate,
+and the typewriter runs at full speed, so the times are render cost and not frame pacing.
+The terminal grows with the battle screen, which has a row per combatant and no scrolling:
+anything shorter only shows prompt_toolkit's "window too small" notice.
+Allocations are counted in a second pass with tracemalloc, which would skew the times.
+Usage: python -m benchmarks.ui_render [events]
+"""
+import sys
+import time
+import asyncio
+import tracemalloc
+from statistics import quantiles
+
+from benchmarks.bootstrap import init_globals
+
+COLUMNS, ROWS = 120, 40
+KEYS = ("\x1b[B", "\x1b[B", "\x1b[A", "\x1b[A") # Down, down, up, up
+
+
+class ByteCounter:
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data: str) -> int:
+        self.written += len(data.encode("utf-8"))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class FrameRecorder:
+    """Times every redraw of the app and the bytes it wrote"""
+    def __init__(self, app, sink: ByteCounter):
+        self.times: list[float] = []
+        self.sizes: list[int] = []
+        redraw = app._redraw
+
+        def timed_redraw(render_as_done: bool = False) -> None:
+            written, start = sink.written, time.perf_counter()
+            redraw(render_as_done)
+            self.times.append(time.perf_counter() - start)
+            self.sizes.append(sink.written - written)
+
+        app._redraw = timed_redraw
+
+    def reset(self) -> None:
+        self.times.clear()
+        self.sizes.clear()
+
+
+def battle_script(combatants: int, events: int) -> list:
+    from events.events import StartBattleEvent, StatsChangeEvent, BattleLogEvent, EntityDeathEvent
+    from events.event_containers import EntityContainer
+    from util import wrap_key
+
+    def entity(entity_id: int, health: int) -> EntityContainer:
+        key = "unloc.player" if entity_id == 0 else "entities.goblin"
+        return EntityContainer(entity_id, key, health, 1000, 1, 3, 5)
+
+    health = {entity_id: 1000 for entity_id in range(combatants)}
+    alive = list(range(1, combatants))
+    script = [StartBattleEvent([entity(0, 1000)], [entity(entity_id, 1000) for entity_id in alive])]
+    round_number = 0
+    while len(script) < events:
+        round_number += 1
+        target = alive[round_number % len(alive)]
+        health[target] -= 7
+        script.append(StatsChangeEvent([entity(0, health[0]), entity(target, health[target])]))
+        script.append(BattleLogEvent("entities.health_reminder", {"NAME": wrap_key("entities.goblin"), "HEALTH": health[target]}))
+        # Half of the enemies die over the battle, the last one never does
+        if round_number % 8 == 0 and len(alive) > max(1, (combatants - 1) // 2):
+            script.append(EntityDeathEvent(alive.pop(round_number % len(alive))))
+    return script[:events]
+
+
+async def settle(ui, queue) -> None:
+    """Waits until the event was dispatched, the typewriter is done and its frame is drawn"""
+    battle_log = ui.battle_screen.battle_log if ui.battle_screen else None
+    while not queue.empty() or ui.app.invalidated or (battle_log and (battle_log.backlog() or battle_log.writing)):
+        await asyncio.sleep(0)
+
+
+async def run_scenario(label: str, combatants: int, events: int, trace: bool) -> dict:
+    from prompt_toolkit.application import create_app_session
+    from prompt_toolkit.data_structures import Size
+    from prompt_toolkit.input import create_pipe_input
+    from prompt_toolkit.output.vt100 import Vt100_Output
+    from events.event_queue import EventQueue
+    from global_state.consts import ENGINE_TO_UI_QUEUE_SIZE, UI_TO_ENGINE_QUEUE_SIZE
+    from ui.ui_controller import UiController
+    from ui.layouts.settings_screen import SettingsScreen
+
+    sink = ByteCounter()
+    size = Size(rows=ROWS, columns=COLUMNS)
+    output = Vt100_Output(sink, lambda: size, term="xterm", enable_cpr=False)
+    engine_to_ui = EventQueue(ENGINE_TO_UI_QUEUE_SIZE, "engine_to_ui")
+    with create_pipe_input() as pipe, create_app_session(input=pipe, output=output):
+        ui = UiController(engine_to_ui, EventQueue(UI_TO_ENGINE_QUEUE_SIZE, "ui_to_engine"))
+        ui.app.min_redraw_interval = None
+        recorder = FrameRecorder(ui.app, sink)
+        app_task = asyncio.create_task(ui.run_app())
+        parser_task = asyncio.create_task(ui.event_parser.process_events())
+        await asyncio.sleep(0.2)
+
+        if label == "settings":
+            ui.switch_screen(SettingsScreen(ui, ui.current_screen, in_game=False))
+        if combatants:
+            script = battle_script(combatants, events + 1)
+            await engine_to_ui.put(script.pop(0))
+            await settle(ui, engine_to_ui)
+            size = Size(rows=max(ROWS, ui.layout.container.preferred_height(COLUMNS, 10**4).preferred), columns=COLUMNS)
+            ui.app._on_resize()
+            ui.battle_screen.battle_log.typewriter_delay = ui.battle_screen.battle_log.fast_typeriter_delay = 1e-9
+            ui.battle_screen.battle_log.pause_after = 0
+            ui.battle_screen.battle_log.frame_rate = 10000
+        await settle(ui, engine_to_ui)
+        recorder.reset()
+
+        allocated = 0
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        for i in range(events):
+            if trace:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+            if combatants:
+                await engine_to_ui.put(script[i])
+            else:
+                pipe.send_text(KEYS[i % len(KEYS)])
+                await asyncio.sleep(0.005) # Lets the input reader pick the key up
+            await settle(ui, engine_to_ui)
+            if trace:
+                allocated += tracemalloc.get_traced_memory()[1] - before
+        wall = time.perf_counter() - start
+        if trace:
+            tracemalloc.stop()
+
+        result = {"times": list(recorder.times), "sizes": list(recorder.sizes), "wall": wall, "allocated": allocated}
+        if ui.battle_screen:
+            ui.battle_screen.cleanup()
+        ui.app.exit()
+        parser_task.cancel()
+        await asyncio.gather(app_task, parser_task, return_exceptions=True)
+    return result
+
+
+def report(label: str, events: int, timed: dict, traced: dict) -> None:
+    times = sorted(t * 1000 for t in timed["times"])
+    frames = len(times)
+    if frames > 1:
+        cuts = quantiles(times, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = times[0] if times else 0.0
+    print(
+        f"{label:<16} {frames / events:5.1f} frames/event  frame p50 {p50:6.2f} ms  p95 {p95:6.2f} ms  p99 {p99:6.2f} ms  "
+        f"max {times[-1] if times else 0.0:6.2f} ms  {sum(timed['sizes']) / max(frames, 1):8.0f} bytes/frame  "
+        f"{traced['allocated'] / events / 1024:7.1f} KiB allocated/event"
+    )
+
+
+def main(events: int) -> None:
+    init_globals()
+    scenarios = [("title", 0), ("settings", 0), ("battle, 2", 2), ("battle, 20", 20), ("battle, 200", 200)]
+    print(f"{events} events per layout, {COLUMNS} columns")
+    for label, combatants in scenarios:
+        timed = asyncio.run(run_scenario(label, combatants, events, trace=False))
+        traced = asyncio.run(run_scenario(label, combatants, events, trace=True))
+        report(label, events, timed, traced)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
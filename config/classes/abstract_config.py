@@ -9,8 +9,10 @@ from ..option_classes import Option
 from global_state.consts import BASE_SETTINGS_PATH
 
 class AbstractConfig:
-    def __init__(self, path: str, option_dict: dict[str, Option]) -> None:
+    def __init__(self, path: str, option_dict: dict[str, Option], persistent: bool = True) -> None:
         super().__setattr__("path", f"{BASE_SETTINGS_PATH}/{path}")
+        # Not persistent: the file is only read, a missing one leaves the defaults in memory
+        super().__setattr__("persistent", persistent)
         super().__setattr__("option_dict", option_dict)
         # Initialize default values by iterating over our definitions
         for key, option in option_dict.items():
@@ -21,6 +23,9 @@ class AbstractConfig:
 
     def get_config_from_file(self):
         if not os.path.exists(self.path):
+            if not self.persistent:
+                g.logger.info(f"Config file {self.path} not found. Using default values.")
+                return
             g.logger.warning("Config file not found. Creating with default values.")
             self.save_config_to_file()
             return
@@ -47,6 +52,8 @@ class AbstractConfig:
 
     def save_config_to_file(self):
         """Saves the current configuration by iterating over definitions."""
+        if not self.persistent:
+            return
         try:
             with open(self.path, "w", encoding="utf-8") as f:
                 for key in self.option_dict:
@@ -16,10 +16,15 @@ class KeyController(AbstractConfig):
     enter_key: str
     quit_key: str
     tab_key: str
-    def __init__(self, path:str, option_dict: dict[str, KeyOption], banned_keybinds: set[str]):
+    reload_key: str
+    scroll_up: str
+    scroll_down: str
+    scroll_end: str
+    def __init__(self, path:str, option_dict: dict[str, KeyOption], banned_keybinds: set[str], persistent: bool = True):
         object.__setattr__(self, "_loading", True)
         object.__setattr__(self, "banned_keybinds", banned_keybinds)
-        super().__init__(path, option_dict)
+        object.__setattr__(self, "version", 0) # Bumped on every rebind, for anything built from the key map
+        super().__init__(path, option_dict, persistent)
         self._loading = False
 
     def get_all_values(self) -> dict[str, str]:
@@ -53,8 +58,9 @@ class KeyController(AbstractConfig):
             
             # If all checks pass, set the internal attribute and save
             object.__setattr__(self, f"_{name}", new_key)
+            object.__setattr__(self, "version", self.version + 1)
             g.logger.debug(f"KEY_CONFIG: Setting {name} as {new_key}")
-            invalidate_key_cache()
+            invalidate_key_cache(self)
 
         else:
             # Allow setting other, non-config attributes
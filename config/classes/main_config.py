@@ -7,8 +7,8 @@ from .abstract_config import AbstractConfig
 
 # --- Step 3: Refactor the Config class to be data-driven ---
 class MainConfig(AbstractConfig):
-    def __init__(self, path: str, option_dict: dict[str, ConfigOption]) -> None:
-        super().__init__(path, option_dict)
+    def __init__(self, path: str, option_dict: dict[str, ConfigOption], persistent: bool = True) -> None:
+        super().__init__(path, option_dict, persistent)
 
     def __setattr__(self, name: str, value: Any):
         """Dynamically sets and validates a config value. Call save() to save the changes to the config file"""
@@ -6,9 +6,11 @@ from config.options.key_config_options import KEY_CONFIG_DICT, BANNED_KEYBINDS
 from global_state.consts import MAIN_CONFIG_PATH, KEY_CONFIG_PATH
 
 class Config:
-    def __init__(self):
-        self.main = MainConfig(MAIN_CONFIG_PATH, MAIN_CONFIG_DICT)
-        self.keys = KeyController(KEY_CONFIG_PATH, KEY_CONFIG_DICT, BANNED_KEYBINDS)
+    def __init__(self, persistent: bool = True):
+        # A config that isn't persistent starts from the settings files but never writes them back
+        self.persistent = persistent
+        self.main = MainConfig(MAIN_CONFIG_PATH, MAIN_CONFIG_DICT, persistent)
+        self.keys = KeyController(KEY_CONFIG_PATH, KEY_CONFIG_DICT, BANNED_KEYBINDS, persistent)
         self.sections = [
             self.main,
             self.keys
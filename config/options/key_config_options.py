@@ -10,7 +10,11 @@ KEY_CONFIG_DICT = {
     "arr_left": KeyOption("left", True),
     "arr_right": KeyOption("right", True),
     "enter_key": KeyOption("c-m", True),
-    "tab_key": KeyOption("c-i", True)
+    "tab_key": KeyOption("c-i", True),
+    "reload_key": KeyOption("f5", True),
+    "scroll_up": KeyOption("pageup", True),
+    "scroll_down": KeyOption("pagedown", True),
+    "scroll_end": KeyOption("end", True)
 }
 
 BANNED_KEYBINDS = {
@@ -1,4 +1,4 @@
-from global_state.consts import LANGUAGES
+from global_state.consts import LANGUAGES, BATTLE_MODES
 
 from ..option_classes import ConfigOption
 
@@ -17,5 +17,10 @@ MAIN_CONFIG_DICT = {
         default="en",
         type=str,
         validator=lambda v: v if v in LANGUAGES else "en" # Ensures language is valid
+    ),
+    "battle_mode": ConfigOption(
+        default="turns",
+        type=str,
+        validator=lambda v: v if v in BATTLE_MODES else "turns"
     )
 }
\ No newline at end of file
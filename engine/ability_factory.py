@@ -1,6 +1,7 @@
 from engine.blueprints.entity_blueprint import AbilityBlueprint
 from engine.components.living_entity_components import AbilitiesComponent
 from engine.world import World
+from engine.actions.abstract_ability import AbstractAbility
 
 from global_state.consts import BASIC_ABILITY_MAP, UNIQUE_ABILITY_MAP
 
@@ -15,11 +16,20 @@ class AbilityFactory:
 
         self.singleton_ability_map = {
         }
+        # Unique abilities are interned per world by AbilityBlueprint.intern_key
+        self.unique_ability_map: dict[tuple, AbstractAbility] = {}
+        # Owners with the same ability list share one read-only AbilitiesComponent
+        self.abilities_component_map: dict[tuple, AbilitiesComponent] = {}
 
     def create_singletons(self, world: World):
         self.singleton_ability_map = {
             class_type: class_type(world.create_entity()) for class_type in BASIC_ABILITY_MAP.values()
         }
+        for ability in self.singleton_ability_map.values():
+            ability.freeze()
+        # Ability ids are entities of the previous world, nothing can be reused
+        self.unique_ability_map.clear()
+        self.abilities_component_map.clear()
 
     def get_ability_list(self, data: list[dict]):
         ability_list = []
@@ -44,16 +54,32 @@ class AbilityFactory:
         
         return ability_list
 
+    def get_unique_ability(self, world: World, ability_blueprint: AbilityBlueprint) -> AbstractAbility:
+        """Returns the shared instance for this blueprint's (type, data), creating it on first use"""
+        ability = self.unique_ability_map.get(ability_blueprint.intern_key)
+        if ability is None:
+            ability_id = world.create_entity()
+            ability = ability_blueprint.type(ability_id, ability_blueprint.data)
+            ability.freeze()
+            self.unique_ability_map[ability_blueprint.intern_key] = ability
+        return ability
+
     def make_abilities(self, world: World, ability_blueprint_list: list[AbilityBlueprint]):
+        component_key = tuple(ability_blueprint.intern_key for ability_blueprint in ability_blueprint_list)
+        component = self.abilities_component_map.get(component_key)
+        if component is not None:
+            return component
+
         ability_dict = {}
         for ability_blueprint in ability_blueprint_list:
-            if ability_blueprint.type in BASIC_ABILITY_MAP.values():
+            if ability_blueprint.type in self.singleton_ability_map:
                 ability_instance = self.singleton_ability_map[ability_blueprint.type]
-                ability_id = ability_instance.id
-                ability_dict[ability_id] = ability_instance
-            
             elif ability_blueprint.type in UNIQUE_ABILITY_MAP.values():
-                ability_id = world.create_entity()
-                ability_dict[ability_id] = ability_blueprint.type(ability_id, ability_blueprint.data)
-        
-        return AbilitiesComponent(ability_dict)
+                ability_instance = self.get_unique_ability(world, ability_blueprint)
+            else:
+                raise ValueError(f"Ability type {ability_blueprint.type} is not registered")
+            ability_dict[ability_instance.id] = ability_instance
+
+        component = AbilitiesComponent(ability_dict)
+        self.abilities_component_map[component_key] = component
+        return component
@@ -24,6 +24,16 @@ class AbstractAbility(ABC):
         self.tooltip_key: str = "abilities_tooltip.null"
         self.data_dict: dict = {}
 
+    def freeze(self) -> None:
+        """Called once the instance is shared between owners. Any later attribute write raises.
+        Per-owner state belongs in the owner's components (StatsComponent, BuffsComponent), not here"""
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{self.__class__.__name__} {self.id} is shared between entities and can't be modified")
+        object.__setattr__(self, name, value)
+
     @abstractmethod
     def to_dict(self) -> dict:
         return {
@@ -85,7 +95,7 @@ class AbstractAbility(ABC):
         raise NotImplementedError(f"Method 'execute' is not implemented in class {self.__class__.__name__}")
     
     def get_state_package(self, world: World, entity_id: int) -> AbilityContainer:
-        return AbilityContainer(self.id, self.ap, self.scope, self.key, self.tooltip_key, self.data_dict, self._is_available(world, entity_id))
+        return AbilityContainer(self.id, self.ap, self.scope, self.key, self.tooltip_key, dict(self.data_dict), self._is_available(world, entity_id))
     
     @abstractmethod
     def _is_available(self, world: World, entity_id: int, target_id: Optional[int] = None) -> bool:
@@ -58,7 +58,7 @@ class BasicAttack(AbstractAbility):
         return log
 
     def get_state_package(self, world: World, entity_id: int) -> AbilityContainer:
-        return AbilityContainer(self.id, self.ap, self.scope, self.key, self.tooltip_key, self.data_dict, self._is_available(world, entity_id))
+        return AbilityContainer(self.id, self.ap, self.scope, self.key, self.tooltip_key, dict(self.data_dict), self._is_available(world, entity_id))
 
     def _is_available(self, world: World, entity_id: int, target_id: Optional[int] = None):
         
@@ -19,6 +19,6 @@ def evaluate_target_vulnerability(world: World, caster, target, proportionality:
 
 def check_target_buffs(world: World, caster, target, proportionality: Proportionality, ability_id: int) -> float:
     buffs: BuffsComponent = world.get_component(target, BuffsComponent)
-    if ability_id in buffs.buff_dict.keys():
+    if (caster, ability_id) in buffs.buff_dict:
         return 0
     return 1
\ No newline at end of file
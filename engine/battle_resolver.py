@@ -1,16 +1,18 @@
 from __future__ import annotations
 from typing import List, TYPE_CHECKING
 import asyncio
+import time
 
 from .entity_factory import EntityFactory
 from .components.living_entity_components import IsPlayerComponent, InBattleComponent, LocalizationComponent, IsAliveComponent, StatsComponent, IsEnemyComponent, AbilitiesComponent
 from events.events import StartBattleEvent, StartPlayerTurnEvent, EndPlayerTurnEvent, BattleLogEvent, EntityDeathEvent, PlayerActionEvent, StatsChangeEvent, Event
-from global_state.game_consts import BattleResult
+from global_state.game_consts import BattleResult, Defaults
+from global_state.consts import LOG_BACKLOG_LIMIT
 if TYPE_CHECKING:
     from .engine import GameEngine
 
 from engine.world import World
-from .systems.battle_systems import process_deaths, clear_enemy_entities, subscribe_for_fight, start_turn, end_turn, get_valid_target_set, update_buffs
+from .systems.battle_systems import process_deaths, clear_enemy_entities, subscribe_for_fight, start_turn, end_turn, get_valid_target_set, update_buffs, drain_action_values, reset_action_value
 from .systems.wrappers import wrap_entity, wrap_entity_abilities
 
 from util import wrap_key
@@ -25,58 +27,55 @@ class BattleResolver:
         self.player_id = player_id
         self.player_input_attempts = 0
         self.is_player_turn = False
+        self._player_turn_over = asyncio.Event()
         self.log = []
 
     
 
-    async def run_battle(self, enemy_number: int):
-        try:
-            #Preparing
-            enemy_ids = self.entity_factory.generate_enemy_ids(self.world, enemy_number)
-            subscribe_for_fight(self.world, self.player_id, *enemy_ids)
+    async def _prepare_battle(self, enemy_number: int) -> list[int]:
+        enemy_ids = self.entity_factory.generate_enemy_ids(self.world, enemy_number)
+        subscribe_for_fight(self.world, self.player_id, *enemy_ids)
+
 
+        await self.engine.send(StartBattleEvent(
+            heroes = [wrap_entity(self.world, self.player_id)], 
+            enemies = [wrap_entity(self.world, enemy) for enemy in enemy_ids]
+            ))
+        await asyncio.sleep(0.2)
 
-            self.engine.send(StartBattleEvent(
-                heroes = [wrap_entity(self.world, self.player_id)], 
-                enemies = [wrap_entity(self.world, enemy) for enemy in enemy_ids]
-                ))
-            await asyncio.sleep(0.2)
+        #Sending flair for all enemies
+        for enemy_id in enemy_ids:
+            component: LocalizationComponent = self.world.get_component(enemy_id, LocalizationComponent)
+            flair = component.flair_key
+            await self.engine.send(BattleLogEvent(flair))
+        return enemy_ids
 
-            #Sending flair for all enemies
-            for enemy_id in enemy_ids:
-                component: LocalizationComponent = self.world.get_component(enemy_id, LocalizationComponent)
-                flair = component.flair_key
-                self.engine.send(BattleLogEvent(flair))
+    async def run_battle(self, enemy_number: int):
+        try:
+            #Preparing
+            await self._prepare_battle(enemy_number)
 
             #Battle loop
             while self.world.get_entities_with(IsAliveComponent, InBattleComponent, IsEnemyComponent) and self.world.get_component(self.player_id, IsAliveComponent):
                 #Log gets sent in the end of each loop
                 entity_id, action_value = start_turn(self.world)
-                buff_keys = update_buffs(self.world, entity_id)
-                name_component: LocalizationComponent = self.world.get_component(entity_id, LocalizationComponent)
-                if buff_keys:
-                    for key in buff_keys:
-                        self.engine.send(BattleLogEvent("abilities.buff_end", {"BUFF": wrap_key(key), "ENTITY_NAME": wrap_key(name_component.name_key)}))
+                for event in self._end_buffs(entity_id):
+                    await self.engine.send(event)
                 
                 #Player turn gets async treatment, we wait for it to finish
                 if self.world.get_component(entity_id, IsPlayerComponent):
                     self.is_player_turn = True
-                    self.engine.send(StartPlayerTurnEvent(entity_id, wrap_entity_abilities(self.world, entity_id)))
-                    while self.is_player_turn:
-                        await asyncio.sleep(0.05)
-                    self.engine.send(EndPlayerTurnEvent())
+                    self._player_turn_over.clear()
+                    await self.engine.send(StartPlayerTurnEvent(entity_id, wrap_entity_abilities(self.world, entity_id)))
+                    await self._player_turn_over.wait()
+                    await self.engine.send(EndPlayerTurnEvent())
 
                 #Attack player, maybe we'll get more logic in later
                 else:
                     await self.make_turn(entity_id)
 
                 #Death processing
-                dead_ids = process_deaths(self.world)
-                for id in dead_ids:
-                    
-                    name: LocalizationComponent = self.world.get_component(id, LocalizationComponent)
-                    self.log.append(EntityDeathEvent(id))
-                    self.log.append(BattleLogEvent("entities.dead_reminder", {"NAME": wrap_key(name.name_key)}))
+                self._process_deaths()
 
                 end_turn(self.world, entity_id, action_value)
 
@@ -89,6 +88,124 @@ class BattleResolver:
             g.logger.info("Battle coroutine was cancelled")
             clear_enemy_entities(self.world)
 
+        return self._finish_battle()
+
+    async def run_realtime_battle(self, enemy_number: int):
+        """Active-time battle: gauges drain every engine tick and whoever runs out acts right away.
+        The fighting happens in the tick systems below, this coroutine only forwards the log to the UI"""
+        systems = (
+            (self._drain_gauges, 0),
+            (self._act_on_ready, 10),
+            (self._run_decision_window, 20),
+            (self._resolve_deaths, 30)
+        )
+        self._ready: list[int] = []
+        self._player_deciding = False
+        self._decision_left = 0.0
+        self._battle_over = False
+        self._log_pending = asyncio.Event()
+        try:
+            await self._prepare_battle(enemy_number)
+            for system, order in systems:
+                self.engine.scheduler.register(system, order, name=f"battle{system.__name__}")
+
+            while not (self._battle_over and not self.log):
+                await self._log_pending.wait()
+                self._log_pending.clear()
+                # One at a time, so the backlog the gauges look at only shrinks once the UI took the event
+                while self.log:
+                    await self.engine.send(self.log.pop(0))
+        except asyncio.CancelledError:
+            g.logger.info("Battle coroutine was cancelled")
+        finally:
+            for system, _ in systems:
+                self.engine.scheduler.unregister(system)
+
+        return self._finish_battle()
+
+    def _drain_gauges(self, dt: float) -> None:
+        if self._battle_over or len(self.log) >= LOG_BACKLOG_LIMIT:
+            # The UI is behind, time stands still until it catches up
+            self._ready = []
+            return
+        self._ready = drain_action_values(self.world, Defaults.ATB_DRAIN_PER_SECOND.value * dt)
+
+    def _act_on_ready(self, dt: float) -> None:
+        # Crowds with the same speed run out together, whoever doesn't fit into the tick keeps
+        # an empty gauge and goes first next tick instead of the whole crowd stalling the loop
+        deadline = time.perf_counter() + dt * Defaults.ATB_ACTION_BUDGET.value
+        for entity_id in self._ready:
+            if self._battle_over:
+                break
+            if entity_id == self.player_id:
+                if not self._player_deciding:
+                    self._start_decision_window()
+                continue
+            if time.perf_counter() > deadline:
+                continue
+            if not self.world.has_component(entity_id, IsAliveComponent):
+                continue
+            self.log += self._end_buffs(entity_id)
+            self._act(entity_id)
+            reset_action_value(self.world, entity_id)
+            if self._process_deaths():
+                self._check_battle_over()
+        self._ready = []
+
+    def _start_decision_window(self) -> None:
+        self.log += self._end_buffs(self.player_id)
+        self.is_player_turn = True
+        self._player_deciding = True
+        self._decision_left = Defaults.ATB_DECISION_WINDOW.value
+        self.log.append(StartPlayerTurnEvent(self.player_id, wrap_entity_abilities(self.world, self.player_id)))
+
+    def _run_decision_window(self, dt: float) -> None:
+        if not self._player_deciding or len(self.log) >= LOG_BACKLOG_LIMIT:
+            return
+        if self.is_player_turn:
+            self._decision_left -= dt
+            if self._decision_left > 0:
+                return
+            #Too slow, the turn is lost
+            self._end_player_turn()
+            name: LocalizationComponent = self.world.get_component(self.player_id, LocalizationComponent)
+            self.log.append(BattleLogEvent("battle.turn_missed", {"NAME": wrap_key(name.name_key)}))
+        self._player_deciding = False
+        self.log.append(EndPlayerTurnEvent())
+        reset_action_value(self.world, self.player_id)
+
+    def _resolve_deaths(self, dt: float) -> None:
+        #Player actions land between ticks, their deaths get picked up here
+        if not self._battle_over and self._process_deaths():
+            self._check_battle_over()
+        if self.log or self._battle_over:
+            self._log_pending.set()
+
+    def _end_buffs(self, entity_id: int) -> list[BattleLogEvent]:
+        buff_keys = update_buffs(self.world, entity_id)
+        if not buff_keys:
+            return []
+        name_component: LocalizationComponent = self.world.get_component(entity_id, LocalizationComponent)
+        return [BattleLogEvent("abilities.buff_end", {"BUFF": wrap_key(key), "ENTITY_NAME": wrap_key(name_component.name_key)}) for key in buff_keys]
+
+    def _process_deaths(self) -> bool:
+        dead_ids = process_deaths(self.world)
+        for id in dead_ids:
+            
+            name: LocalizationComponent = self.world.get_component(id, LocalizationComponent)
+            self.log.append(EntityDeathEvent(id))
+            self.log.append(BattleLogEvent("entities.dead_reminder", {"NAME": wrap_key(name.name_key)}))
+        return bool(dead_ids)
+
+    def _check_battle_over(self) -> None:
+        self._battle_over = not self.world.get_entities_with(IsAliveComponent, InBattleComponent, IsEnemyComponent) or not self.world.get_component(self.player_id, IsAliveComponent)
+        if self._battle_over and self._player_deciding:
+            #Nothing left to decide, close the ability menu
+            self._end_player_turn()
+            self._player_deciding = False
+            self.log.append(EndPlayerTurnEvent())
+
+    def _finish_battle(self) -> BattleResult:
         #Finalizing the battle
         clear_enemy_entities(self.world)
         if self.world.get_component(self.player_id, IsAliveComponent):
@@ -97,6 +214,9 @@ class BattleResolver:
             return BattleResult.DEFEAT
 
     async def make_turn(self, entity_id):
+        self._act(entity_id)
+
+    def _act(self, entity_id):
         if not self.world.has_component(entity_id, IsAliveComponent):
             return
         if self.world.has_component(entity_id, IsPlayerComponent):
@@ -136,17 +256,21 @@ class BattleResolver:
             g.logger.warning(f"Player submitted ability with id {ability_id} for entity {entity_id}, but it doesn't exist for that entity. ")
             self.player_input_attempts += 1
             if self.player_input_attempts >= 3:
-                self.is_player_turn = False
+                self._end_player_turn()
                 self.player_input_attempts = 0
             return
         log = ability.execute(self.world, entity_id, target_id)
         self.log += log
+        self._end_player_turn()
+
+    def _end_player_turn(self) -> None:
         self.is_player_turn = False
+        self._player_turn_over.set()
     
     async def send_events(self, event_list: List[Event], delay: float = 0.02):
         for entry in event_list:
             g.logger.debug(f"Sending entry {entry}")
-            self.engine.send(entry)
+            await self.engine.send(entry)
             await asyncio.sleep(delay)
         
         
@@ -1,3 +1,4 @@
-from .entity_blueprint import EntityBlueprint
+from .entity_blueprint import EntityBlueprint, EntityTemplate
+from .blueprint_cache import BlueprintCache, load_yaml
 
-__all__ = [EntityBlueprint]
\ No newline at end of file
+__all__ = [EntityBlueprint, EntityTemplate, BlueprintCache, load_yaml]
@@ -0,0 +1,103 @@
+import os
+import pickle
+import hashlib
+from typing import Any, Optional
+
+import yaml
+
+import globals as g
+
+from global_state.consts import BASIC_ABILITY_MAP, UNIQUE_ABILITY_MAP
+
+# Use libyaml bindings when pyyaml was built with them, they are several times faster
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump whenever blueprint classes change shape, so stale pickles are never loaded
+CACHE_VERSION = 3
+
+
+def load_yaml(filepath: str) -> Any:
+    with open(filepath, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _hash_file(filepath: str) -> str:
+    with open(filepath, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class BlueprintCache:
+    """
+    Stores compiled blueprints next to their yaml sources.
+    An entry is valid while every source keeps its mtime, or at least its content hash,
+    and the registered ability set did not change.
+    """
+    def __init__(self, cache_filepath: str, source_filepaths: list[str]):
+        self.cache_filepath = cache_filepath
+        self.source_filepaths = source_filepaths
+
+    def _get_ability_names(self) -> tuple[str, ...]:
+        return tuple(sorted(BASIC_ABILITY_MAP)) + tuple(sorted(UNIQUE_ABILITY_MAP))
+
+    def _get_source_meta(self, filepath: str, known: Optional[tuple] = None) -> tuple[int, int, str]:
+        """Returns (mtime_ns, size, sha1). Hashing is skipped if mtime and size match the known entry."""
+        stat = os.stat(filepath)
+        if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            return known
+        return (stat.st_mtime_ns, stat.st_size, _hash_file(filepath))
+
+    def load(self) -> Optional[Any]:
+        """Returns the cached payload, or None if the cache is missing or stale."""
+        if not os.path.exists(self.cache_filepath):
+            return None
+        try:
+            with open(self.cache_filepath, "rb") as f:
+                cached: dict = pickle.load(f)
+        except Exception as e:
+            g.logger.warning(f"Failed to read blueprint cache {self.cache_filepath}: {e}")
+            return None
+
+        if cached.get("version") != CACHE_VERSION or cached.get("abilities") != self._get_ability_names():
+            return None
+
+        known_sources: dict = cached.get("sources", {})
+        touched = False
+        for filepath in self.source_filepaths:
+            known = known_sources.get(filepath)
+            if known is None:
+                return None
+            meta = self._get_source_meta(filepath, known)
+            if meta[2] != known[2]:
+                g.logger.debug(f"Blueprint source {filepath} changed, cache is stale")
+                return None
+            if meta != known:
+                # Same content with a new mtime (checkout, copy), refresh the stamp only
+                known_sources[filepath] = meta
+                touched = True
+
+        if touched:
+            self._write(cached)
+        g.logger.debug(f"Blueprints loaded from cache {self.cache_filepath}")
+        return cached["payload"]
+
+    def save(self, payload: Any) -> None:
+        try:
+            cached = {
+                "version": CACHE_VERSION,
+                "abilities": self._get_ability_names(),
+                "sources": {filepath: self._get_source_meta(filepath) for filepath in self.source_filepaths},
+                "payload": payload
+            }
+        except OSError as e:
+            g.logger.warning(f"Failed to stat blueprint sources: {e}")
+            return
+        self._write(cached)
+
+    def _write(self, cached: dict) -> None:
+        tmp_path = self.cache_filepath + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_filepath)
+        except Exception as e:
+            g.logger.warning(f"Failed to write blueprint cache {self.cache_filepath}: {e}")
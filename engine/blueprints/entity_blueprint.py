@@ -1,11 +1,26 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 from global_state.game_consts import EntityType
 from engine.actions.abstract_ability import AbstractAbility
+from engine.components.living_entity_components import LocalizationComponent
+
+def freeze_data(value: Any) -> Any:
+    """Recursively converts yaml data into a hashable equivalent"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze_data(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_data(v) for v in value)
+    return value
 
 @dataclass(frozen=True)
 class AbilityBlueprint:
     type: AbstractAbility
     data: dict
+    # (type, frozen data) - abilities with equal keys are shared between owners
+    intern_key: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "intern_key", (self.type, freeze_data(self.data)))
 
 @dataclass(frozen=True)
 class EntityBlueprint:
@@ -17,4 +32,11 @@ class EntityBlueprint:
     max_ap: int
     attack: int
     speed: int
-    abilities: list[AbilityBlueprint]
\ No newline at end of file
+    abilities: list[AbilityBlueprint]
+
+@dataclass(frozen=True)
+class EntityTemplate:
+    """Precomputed per-blueprint components, shared by every entity spawned from the blueprint"""
+    tags: tuple
+    localization: LocalizationComponent
+    stats: tuple
@@ -6,7 +6,19 @@ from engine.actions.abstract_ability import AbstractAbility
 
 import globals as g
 
-@dataclass
+class TagComponent:
+    """Base for zero-field marker components. Every call returns one shared instance per class"""
+    __slots__ = ()
+    _instances: dict[type, TagComponent] = {}
+
+    def __new__(cls):
+        instance = TagComponent._instances.get(cls)
+        if instance is None:
+            instance = super().__new__(cls)
+            TagComponent._instances[cls] = instance
+        return instance
+
+@dataclass(slots=True)
 class StatsComponent:
     health: int
     max_health: int
@@ -16,59 +28,61 @@ class StatsComponent:
     max_ap: int
     speed: int
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BuffsComponent:
-    buff_dict: dict[int, BuffContainer] = field(default_factory=dict)
+    # Keyed by (source id, ability id): abilities are shared between owners, so the id alone is not per caster
+    buff_dict: dict[tuple[int, int], BuffContainer] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class BuffContainer:
     buff_key: str
     turns_left: int
     buff_type: Stats
     buff_bonus: float
 
-@dataclass
+@dataclass(slots=True)
 class SpeedComponent:
     base_action_value: int
     action_value: int
 
-@dataclass
-class CanAttackComponent:
+@dataclass(frozen=True, slots=True)
+class CanAttackComponent(TagComponent):
     pass
 
-class CanHealComponent:
+@dataclass(frozen=True, slots=True)
+class CanHealComponent(TagComponent):
     pass
 
-@dataclass
-class IsPlayerComponent:
+@dataclass(frozen=True, slots=True)
+class IsPlayerComponent(TagComponent):
     pass
 
-@dataclass
-class IsEnemyComponent:
+@dataclass(frozen=True, slots=True)
+class IsEnemyComponent(TagComponent):
     pass
 
-@dataclass
-class IsAliveComponent:
+@dataclass(frozen=True, slots=True)
+class IsAliveComponent(TagComponent):
     pass
 
-@dataclass
-class IsDeadComponent:
+@dataclass(frozen=True, slots=True)
+class IsDeadComponent(TagComponent):
     pass
 
-@dataclass
-class PendingDeathComponent:
+@dataclass(frozen=True, slots=True)
+class PendingDeathComponent(TagComponent):
     pass
 
-@dataclass
-class InBattleComponent:
+@dataclass(frozen=True, slots=True)
+class InBattleComponent(TagComponent):
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AbilitiesComponent:
     data: dict[int, AbstractAbility] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocalizationComponent:
     name_key: str
     flair_key: str
@@ -77,6 +91,6 @@ class LocalizationComponent:
     heal_key: str
     useless_heal_key: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlayerDataComponent:
-    name: str
\ No newline at end of file
+    name: str
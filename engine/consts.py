@@ -18,4 +18,5 @@ class Keybinds(Enum):
 class DataPaths(Enum):
     DATA_FOLDER = "data"
     ENEMIES = "enemies.yaml"
-    PLAYER_CLASSES = "player_classes.yaml"
\ No newline at end of file
+    PLAYER_CLASSES = "player_classes.yaml"
+    BLUEPRINT_CACHE = "blueprints.cache"
\ No newline at end of file
@@ -1,5 +1,4 @@
 import asyncio
-import time
 import os
 import sys
 
@@ -10,65 +9,91 @@ from global_state.game_consts import PlayerClass
 from .engine_event_parser import EngineEventParser
 from .battle_resolver import BattleResolver
 from .world import World
+from .tick_scheduler import TickScheduler
 from events.events import ApplicationExitEvent
+from events.event_queue import EventQueue
 
 class GameEngine:
-    def __init__(self, ui_to_engine_queue: asyncio.Queue, engine_to_ui_queue: asyncio.Queue):
-        self.tick_count = 0
+    def __init__(self, ui_to_engine_queue: EventQueue, engine_to_ui_queue: EventQueue, owns_config: bool = True, owns_process: bool = True):
+        self.scheduler = TickScheduler(lambda: g.config.main.tick_speed)
+        self.owns_config = owns_config
+        # A server hosts many engines in one process, stopping one must not exit it
+        self.owns_process = owns_process
         self.closing = False
-        self._running = False
         self.battle_running = False
         self.engine_to_ui_queue = engine_to_ui_queue
         self.event_parser = EngineEventParser(ui_to_engine_queue, self)
         enemy_filepath = os.path.join(DataPaths.DATA_FOLDER.value, DataPaths.ENEMIES.value)
         player_filepath = os.path.join(DataPaths.DATA_FOLDER.value, DataPaths.PLAYER_CLASSES.value)
-        self.entity_factory = EntityFactory(enemy_filepath, player_filepath)
+        cache_filepath = os.path.join(DataPaths.DATA_FOLDER.value, DataPaths.BLUEPRINT_CACHE.value)
+        self.entity_factory = EntityFactory(enemy_filepath, player_filepath, cache_filepath)
+        if ui_to_engine_queue.metrics:
+            ui_to_engine_queue.metrics.add_source("ticks", self.scheduler.snapshot)
 
-    async def tick(self):
-            while not self.closing:
-                if not self._running:
-                    await asyncio.sleep(0.1)
-                    continue
-
-                next_tick = time.perf_counter()
-                self.tick_count += 1
+    @property
+    def tick_count(self) -> int:
+        return self.scheduler.tick_count
 
-                next_tick += 1/g.config.main.tick_speed
-                sleep_duration = max(0, next_tick - time.perf_counter())
-
-                await asyncio.sleep(sleep_duration)
-            #Logger output here, possible savegame
-            self.engine_to_ui_queue.put_nowait(ApplicationExitEvent())
+    async def tick(self):
+        await self.scheduler.run()
+        #Logger output here, possible savegame
+        await self.send(ApplicationExitEvent())
 
     def create_player(self, name, player_class: PlayerClass):
          self.player_id  = self.entity_factory.create_player(self.world, player_class, name)
          g.logger.debug(f"Player {name} has been created successfully with class {player_class.name.lower()}")
-         g.loc.add_unlocalizable("player_name", name)
 
     def resume(self):
-        self._running = True
+        self.scheduler.resume()
 
     def pause(self):
-        self._running = False
+        self.scheduler.pause()
 
     def is_running(self):
-        return self._running
+        return self.scheduler.is_running()
 
     def stop(self):
         self.closing = True
-        g.config.save()
-        sys.exit(0)
+        self.scheduler.stop()
+        if self.owns_config:
+            g.config.save()
+        if self.owns_process:
+            sys.exit(0)
 
     def initialize_world(self):
         self.world = World()
         self.entity_factory.ability_factory.create_singletons(self.world)
 
-    def send(self, event):
-        self.engine_to_ui_queue.put_nowait(event)
+    def reload_blueprints(self):
+        try:
+            self.entity_factory.reload_enemy_blueprints()
+        except Exception as e:
+            g.logger.warning(f"Failed to reload enemy blueprints, keeping the current ones: {e}")
+
+    async def watch_blueprints(self, interval: float = 1.0):
+        """Polls the enemy file and reloads it whenever its mtime changes"""
+        filepath = self.entity_factory.enemy_filepath
+        last_mtime = os.stat(filepath).st_mtime_ns
+        while not self.closing:
+            await asyncio.sleep(interval)
+            try:
+                mtime = os.stat(filepath).st_mtime_ns
+            except OSError:
+                continue
+            if mtime != last_mtime:
+                last_mtime = mtime
+                self.reload_blueprints()
+
+    async def send(self, event):
+        # Waits while the UI is behind, that's what keeps a fast battle from flooding it
+        await self.engine_to_ui_queue.put(event)
 
     def start_game(self):
         self.battle_resolver = BattleResolver(self, self.world, self.player_id, self.entity_factory)
-        self.battle_task = asyncio.create_task(self.battle_resolver.run_battle(2))
+        if g.config.main.battle_mode == "atb":
+            self.battle_task = asyncio.create_task(self.battle_resolver.run_realtime_battle(2))
+        else:
+            self.battle_task = asyncio.create_task(self.battle_resolver.run_battle(2))
         self.battle_running = True
 
     def stop_game(self):
@@ -5,34 +5,36 @@ import asyncio
 if TYPE_CHECKING:
     from .engine import GameEngine
 
-from events.events import GameStartEvent, PlayerActionEvent, GameStopEvent, EnginePauseEvent, EngineResumeEvent, EngineStopEvent
+from events.events import GameStartEvent, PlayerActionEvent, GameStopEvent, EnginePauseEvent, EngineResumeEvent, EngineStopEvent, ReloadBlueprintsEvent
+from events.event_bus import EventBus
+from events.event_queue import EventQueue
 
 class EngineEventParser:
-    def __init__(self, ui_to_engine_queue: asyncio.Queue, controller: GameEngine):
+    def __init__(self, ui_to_engine_queue: EventQueue, controller: GameEngine):
         self.ui_to_engine_queue = ui_to_engine_queue
         self.engine = controller
+        self.bus = EventBus(metrics=ui_to_engine_queue.metrics)
+        self.bus.subscribe(GameStartEvent, self.start_game)
+        self.bus.subscribe(PlayerActionEvent, self.player_action)
+        self.bus.subscribe(GameStopEvent, lambda event: self.engine.stop_game())
+        self.bus.subscribe(EnginePauseEvent, lambda event: self.engine.pause())
+        self.bus.subscribe(EngineResumeEvent, lambda event: self.engine.resume())
+        self.bus.subscribe(EngineStopEvent, lambda event: self.engine.stop())
+        self.bus.subscribe(ReloadBlueprintsEvent, lambda event: self.engine.reload_blueprints())
 
     async def process_events(self):
         while not self.engine.closing:
-            # Use queue.get_nowait() so the engine doesn't block if there are no UI events
-            event = await self.ui_to_engine_queue.get()
-            # Process the player's action
-            match event:
-                case GameStartEvent():
-                    name = event.player_name
-                    p_class = event.player_class
-                    self.engine.initialize_world()
-                    self.engine.create_player(name=name, player_class=p_class)
-                    self.engine.start_game()
-                case PlayerActionEvent():
-                    if self.engine.battle_running:
-                        asyncio.create_task(self.engine.battle_resolver.execute_player_action(event))
-                case GameStopEvent():
-                    self.engine.stop_game()
-                case EnginePauseEvent():
-                    self.engine.pause()
-                case EngineResumeEvent():
-                    self.engine.resume()
-                case EngineStopEvent():
-                    self.engine.stop()
+            event_list = [await self.ui_to_engine_queue.get()]
+            while not self.ui_to_engine_queue.empty():
+                event_list.append(self.ui_to_engine_queue.get_nowait())
+            self.bus.dispatch_many(event_list)
 
+    def start_game(self, event: GameStartEvent):
+        self.engine.initialize_world()
+        self.engine.create_player(name=event.player_name, player_class=event.player_class)
+        self.engine.start_game()
+
+    def player_action(self, event: PlayerActionEvent):
+        # Process the player's action
+        if self.engine.battle_running:
+            asyncio.create_task(self.engine.battle_resolver.execute_player_action(event))
@@ -1,64 +1,126 @@
 from __future__ import annotations
 
-import yaml
-from random import choices
+from itertools import repeat
 from typing import List, TYPE_CHECKING, Optional
 
-from .blueprints import EntityBlueprint
+from .blueprints import EntityBlueprint, EntityTemplate, BlueprintCache, load_yaml
+from .blueprints.entity_blueprint import freeze_data
 from global_state.game_consts import EntityType, PlayerClass, Defaults
 from .world import World
 from .ability_factory import AbilityFactory
 from .components.living_entity_components import StatsComponent, LocalizationComponent, IsEnemyComponent, IsPlayerComponent, IsAliveComponent, AbilitiesComponent, BuffsComponent, PlayerDataComponent
 
+from util import AliasSampler, OverrideSampler
+
 import globals as g
 
 class EntityFactory:
-    def __init__(self, enemy_filepath: str, player_filepath: str):
+    def __init__(self, enemy_filepath: str, player_filepath: str, cache_filepath: Optional[str] = None):
         self.ability_factory = AbilityFactory()
         self._player_class_blueprints = {}
         self._enemy_blueprints = {}
         self.enemy_entities = {}
         self._weights = []
-        self._make_enemy_blueprints(enemy_filepath)
-        self._make_player_blueprints(player_filepath)
+        self._templates: dict[tuple[EntityType, int | str], EntityTemplate] = {}
+        self._enemy_sampler: Optional[AliasSampler[int]] = None
+        self._override_samplers: dict[frozenset, OverrideSampler[int]] = {}
+        # Frozen yaml entry per enemy id, used to find what changed on reload
+        self._enemy_sources: dict[int, tuple] = {}
+        self.enemy_filepath = enemy_filepath
+        self.player_filepath = player_filepath
+
+        self._cache = BlueprintCache(cache_filepath, [enemy_filepath, player_filepath]) if cache_filepath else None
+        cached = self._cache.load() if self._cache else None
+        if cached is not None:
+            self._enemy_blueprints, self._weights, self._player_class_blueprints, self._enemy_sources = cached
+        else:
+            self._make_enemy_blueprints(enemy_filepath)
+            self._make_player_blueprints(player_filepath)
+            if self._cache:
+                self._cache.save(self._get_cache_payload())
+        self._build_enemy_sampler()
+
+    def _get_cache_payload(self) -> tuple:
+        return (self._enemy_blueprints, self._weights, self._player_class_blueprints, self._enemy_sources)
+
+    def _make_enemy(self, id: int, data: dict) -> tuple[EntityBlueprint, int]:
+        name_key = data.get('name')
+
+        if not name_key:
+            raise KeyError(f"Name for the enemy with id {id} has not been found")
+        name_key = f"entities.{name_key}"
+        g.logger.info(name_key)
+        health = data.get('health')
+        if not health:
+            raise KeyError(f"Unable to get health for enemy {name_key}")
+        
+        attack = data.get('attack')
+        if not attack:
+            raise KeyError(f"Unable to get attack for enemy {name_key}")
+        
+        speed = data.get('speed', 100)
+        
+        probability = data.get('probability', 0)
+        if not probability:
+            g.logger.warning(f"Probability for enemy {name_key} has not been found. It will not be encountered")
+
+        ap = data.get('start_ap', 1)
+        max_ap = data.get('max_ap', 3)
+
+        ability_list = []
+        abilities = data.get('abilities')
+        if abilities:
+            ability_list = self.ability_factory.get_ability_list(abilities)
+
+        return (EntityBlueprint(EntityType.ENEMY, id, name_key, health, ap, max_ap, attack, speed, ability_list), probability)
 
     def _make_enemy_blueprints(self, filepath: str) -> None:
-        def make_enemy(id: int, data: dict) -> tuple[EntityBlueprint, int]:
-            name_key = data.get('name')
-
-            if not name_key:
-                raise KeyError(f"Name for the enemy with id {id} has not been found")
-            name_key = f"entities.{name_key}"
-            g.logger.info(name_key)
-            health = data.get('health')
-            if not health:
-                raise KeyError(f"Unable to get health for enemy {name_key}")
-            
-            attack = data.get('attack')
-            if not attack:
-                raise KeyError(f"Unable to get attack for enemy {name_key}")
-            
-            speed = data.get('speed', 100)
-            
-            probability = data.get('probability', 0)
-            if not probability:
-                print(f"Probability for enemy {name_key} has not been found. It will not be encountered")
+        data: dict = load_yaml(filepath)
+        for id, entry in data.items():
+            enemy_blueprint, probability = self._make_enemy(id, entry)
+            self._enemy_blueprints[id] = enemy_blueprint
+            self._weights.append(probability)
+            self._enemy_sources[id] = freeze_data(entry)
 
-            ap = data.get('start_ap', 1)
-            max_ap = data.get('max_ap', 3)
+    def reload_enemy_blueprints(self) -> set[int]:
+        """
+        Re-reads the enemy file and rebuilds only the entries whose data changed.
+        Blueprints, weights and templates are updated in place, the sampler is rebuilt only if weights changed.
+        Entities that are already spawned keep their components.
+        Returns the ids of changed, added and removed blueprints.
+        """
+        data: dict = load_yaml(self.enemy_filepath)
+        new_sources = {id: freeze_data(entry) for id, entry in data.items()}
+        changed = {id for id, source in new_sources.items() if self._enemy_sources.get(id) != source}
+        removed = self._enemy_sources.keys() - new_sources.keys()
+        if not changed and not removed:
+            return set()
 
-            abilities = data.get('abilities')
-            if abilities:
-                ability_list = self.ability_factory.get_ability_list(abilities)
+        # Everything is validated before touching the current state, a broken edit changes nothing
+        rebuilt = {id: self._make_enemy(id, data[id]) for id in changed}
+
+        weight_by_id = dict(zip(self._enemy_blueprints, self._weights))
+        weights_changed = bool(removed)
+        for id in removed:
+            del self._enemy_blueprints[id]
+            del self._enemy_sources[id]
+            del weight_by_id[id]
+            self._templates.pop((EntityType.ENEMY, id), None)
+        for id, (blueprint, probability) in rebuilt.items():
+            weights_changed = weights_changed or weight_by_id.get(id) != probability
+            self._enemy_blueprints[id] = blueprint
+            self._enemy_sources[id] = new_sources[id]
+            weight_by_id[id] = probability
+            self._templates.pop((EntityType.ENEMY, id), None)
+        self._weights[:] = [weight_by_id[id] for id in self._enemy_blueprints]
 
-            return (EntityBlueprint(EntityType.ENEMY, id, name_key, health, ap, max_ap, attack, speed, ability_list), probability)
+        if weights_changed:
+            self._build_enemy_sampler()
+        if self._cache:
+            self._cache.save(self._get_cache_payload())
 
-        with open(filepath, 'r', encoding="utf-8") as f:
-            data: dict = yaml.safe_load(f)
-            for id, entry in data.items():
-                enemy_blueprint, probability = make_enemy(id, entry)
-                self._enemy_blueprints[id] = enemy_blueprint
-                self._weights.append(probability)
+        g.logger.info(f"Reloaded enemy blueprints {sorted(changed)}, removed {sorted(removed)}")
+        return changed | removed
 
     def _make_player_blueprints(self, filepath: str) -> None:
         def make_player(id: int | str, data: dict) -> tuple[PlayerClass, EntityBlueprint]:
@@ -106,11 +168,26 @@ class EntityFactory:
                 ),
             )
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            data: dict = yaml.safe_load(f)
-            for id, entry in data.items():
-                player_class, blueprint = make_player(id, entry)
-                self._player_class_blueprints[player_class] = blueprint
+        data: dict = load_yaml(filepath)
+        for id, entry in data.items():
+            player_class, blueprint = make_player(id, entry)
+            self._player_class_blueprints[player_class] = blueprint
+
+    def _build_enemy_sampler(self) -> None:
+        """Precomputes the alias table over enemy blueprint ids, so every weighted draw is O(1)"""
+        self._enemy_sampler = AliasSampler(list(self._enemy_blueprints), self._weights)
+        self._override_samplers.clear()
+
+    def _get_enemy_sampler(self, weight_overrides: Optional[dict[int, float]] = None) -> AliasSampler[int] | OverrideSampler[int]:
+        """Returns the base sampler, or a cached view with per-encounter weights (biome, tier) replaced"""
+        if not weight_overrides:
+            return self._enemy_sampler
+        override_key = frozenset(weight_overrides.items())
+        sampler = self._override_samplers.get(override_key)
+        if sampler is None:
+            sampler = self._enemy_sampler.with_overrides(weight_overrides)
+            self._override_samplers[override_key] = sampler
+        return sampler
 
     def create_player(self, world: World, player_class: PlayerClass, name: str) -> int:
         blueprint = self._player_class_blueprints.get(player_class)
@@ -118,56 +195,69 @@ class EntityFactory:
             raise ValueError(f"No blueprint found for player class: {player_class}")
         return self.create_entity(world, blueprint, name)
 
-    def create_entity(self, world: World, blueprint: EntityBlueprint, name: Optional[str] = None) -> int:
-        def make_localization(name_key, unloc_name = None) -> LocalizationComponent:
-            name = unloc_name if unloc_name else name_key
-            return LocalizationComponent(name, f"{name_key}_flair", f"{name_key}_attack", f"{name_key}_miss", f"{name_key}_heal", f"{name_key}_useless_heal")
+    def _get_template(self, blueprint: EntityBlueprint) -> EntityTemplate:
+        """Builds the shared part of the blueprint's components once, then reuses it"""
+        template_key = (blueprint.type, blueprint.id)
+        template = self._templates.get(template_key)
+        if template is not None:
+            return template
 
-        id = world.create_entity()
-        component_list = []
+        name_key = blueprint.name_key
         if blueprint.type == EntityType.PLAYER:
-            component_list.append(IsPlayerComponent())
-            component_list.append(PlayerDataComponent(name))
-        elif blueprint.type == EntityType.ENEMY:
-            component_list.append(IsEnemyComponent())
-        component_list.append(StatsComponent(health=blueprint.health, max_health=blueprint.health, attack=blueprint.attack, attack_offset=Defaults.ATTACK_OFFSET.value, ap=blueprint.ap, max_ap=blueprint.max_ap, speed=blueprint.speed))
-        if blueprint.type == EntityType.PLAYER:
-            component_list.append(make_localization(blueprint.name_key, unloc_name="unloc.player_name"))
-        else:
-            component_list.append(make_localization(blueprint.name_key))
-        component_list.append(BuffsComponent())
-        component_list.append(IsAliveComponent())
-        if blueprint.abilities:
-            component_list.append(self.ability_factory.make_abilities(world, blueprint.abilities))
+            tags = (IsPlayerComponent(), IsAliveComponent())
+            name = "unloc.player_name"
         else:
-            component_list.append(AbilitiesComponent())
-        
-        world.add_components(
-            id,
-            *component_list
-        )
-        return id
+            tags = (IsEnemyComponent(), IsAliveComponent())
+            name = name_key
+        localization = LocalizationComponent(name, f"{name_key}_flair", f"{name_key}_attack", f"{name_key}_miss", f"{name_key}_heal", f"{name_key}_useless_heal")
+        stats = (blueprint.health, blueprint.health, blueprint.attack, Defaults.ATTACK_OFFSET.value, blueprint.ap, blueprint.max_ap, blueprint.speed)
+
+        template = EntityTemplate(tags, localization, stats)
+        self._templates[template_key] = template
+        return template
+
+    def create_entity(self, world: World, blueprint: EntityBlueprint, name: Optional[str] = None) -> int:
+        return self.create_entities(world, blueprint, 1, name)[0]
 
-    def generate_enemy_ids(self, world: World, amount:int, simple_enemy_first: bool = True) -> List[int]:
+    def create_entities(self, world: World, blueprint: EntityBlueprint, amount: int, name: Optional[str] = None) -> range:
+        """Spawns `amount` entities from one blueprint. IDs are allocated as a block and components are inserted per type"""
+        if amount <= 0:
+            raise ValueError("Impossible to create less than one entity!")
+        template = self._get_template(blueprint)
+        ids = world.create_entities(amount)
+
+        # Tags and localization are never mutated, so every entity points to the same instance
+        for tag in template.tags:
+            world.add_component_column(type(tag), ids, repeat(tag))
+        world.add_component_column(LocalizationComponent, ids, repeat(template.localization))
+        if blueprint.type == EntityType.PLAYER:
+            world.add_component_column(PlayerDataComponent, ids, [PlayerDataComponent(name) for _ in ids])
+
+        stats = template.stats
+        world.add_component_column(StatsComponent, ids, [StatsComponent(*stats) for _ in ids])
+        world.add_component_column(BuffsComponent, ids, [BuffsComponent() for _ in ids])
+        # Abilities are flyweights, the component is read-only and shared by every owner with the same list
+        abilities = self.ability_factory.make_abilities(world, blueprint.abilities or [])
+        world.add_component_column(AbilitiesComponent, ids, repeat(abilities))
+        return ids
+
+    def generate_enemy_ids(self, world: World, amount:int, simple_enemy_first: bool = True, weight_overrides: Optional[dict[int, float]] = None) -> List[int]:
+        """weight_overrides maps enemy blueprint id to a replacement probability for this encounter only"""
         if amount <= 0:
             raise ValueError("Impossible to create less than one enemy!")
         
-        enemy_blueprints: List[EntityBlueprint] = list(self._enemy_blueprints.values())
-        if not enemy_blueprints:
+        if not self._enemy_blueprints:
             raise ValueError("Enemy list is empty!")
         
+        sampler = self._get_enemy_sampler(weight_overrides)
+        enemy_ids = []
         if simple_enemy_first:
-            first_enemy_id = self.create_entity(world, self._enemy_blueprints.get(Defaults.ENEMY_ID.value))
-            if first_enemy_id is None:
+            first_enemy_blueprint = self._enemy_blueprints.get(Defaults.ENEMY_ID.value)
+            if first_enemy_blueprint is None:
                 raise ValueError(f"Simple enemy with ID {Defaults.ENEMY_ID.value} not found!")
-            
-            if amount == 1:
-                return [first_enemy_id]
-            
+            enemy_ids.append(self.create_entity(world, first_enemy_blueprint))
             amount -= 1
-            enemy_ids = [self.create_entity(world, enemy_blueprint) for enemy_blueprint in choices(enemy_blueprints, self._weights, k=amount)]
-            enemy_ids.insert(0, first_enemy_id)
-            return enemy_ids
-        
-        return [self.create_entity(world, enemy_blueprint) for enemy_blueprint in choices(enemy_blueprints, self._weights, k=amount)]
-    
+
+        for blueprint_id in sampler.sample_many(amount):
+            enemy_ids.append(self.create_entity(world, self._enemy_blueprints[blueprint_id]))
+        return enemy_ids
@@ -67,7 +67,7 @@ def process_heal(world: World, source_id: int, target_id: int, amount: int) -> i
 
 def apply_buff(world: World, source_id: int, target_id: int, ability_id: int, ability_key: str, buff_type: Stats, bonus: float, turns: int):
     buffs: BuffsComponent = world.get_component(target_id, BuffsComponent)
-    buffs.buff_dict[ability_id] = BuffContainer(buff_key = ability_key, turns_left=turns, buff_type=buff_type, buff_bonus=bonus)
+    buffs.buff_dict[(source_id, ability_id)] = BuffContainer(buff_key = ability_key, turns_left=turns, buff_type=buff_type, buff_bonus=bonus)
 
 def subscribe_for_fight(world: World, *entity_ids: int):
     for entity_id in entity_ids:
@@ -111,6 +111,31 @@ def end_turn(world: World, entity_id: int, action_value: int) -> None:
         speed.action_value = max(0, speed.action_value-action_value)
 
 
+def drain_action_values(world: World, amount: float) -> list[int]:
+    """Active-time battles: moves every living fighter's gauge closer to its turn.
+    Gauges that already ran out wait for their owner to act and are left as they are.
+    Returns the ids whose gauge is empty, most overdue first"""
+    speeds = world.get_component_column(SpeedComponent)
+    in_battle = world.get_component_column(InBattleComponent)
+    alive = world.get_component_column(IsAliveComponent)
+    ready = []
+    for entity_id, speed in speeds.items():
+        if entity_id not in in_battle or entity_id not in alive:
+            continue
+        if speed.action_value > 0:
+            speed.action_value -= amount
+            if speed.action_value > 0:
+                continue
+        ready.append(entity_id)
+    if len(ready) > 1:
+        ready.sort(key=lambda entity_id: speeds[entity_id].action_value)
+    return ready
+
+def reset_action_value(world: World, entity_id: int) -> None:
+    speed: SpeedComponent = world.get_component(entity_id, SpeedComponent)
+    if speed:
+        speed.action_value = speed.base_action_value
+
 def get_valid_target_set(world: World, entity_id: int, scope: Scope) -> set:
     # Determine the allegiance
     if world.has_component(entity_id, IsEnemyComponent):
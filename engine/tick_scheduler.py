@@ -0,0 +1,115 @@
+"""
+Fixed-timestep scheduler behind GameEngine.tick.
+
+Deadlines are absolute (start + n * interval), so sleep overshoot doesn't add up over time.
+A late loop runs up to `max_catch_up` ticks back to back. Anything further behind is dropped
+and counted, so a stall doesn't turn into a burst of hundreds of ticks.
+With nothing registered there is nothing to tick, so the loop sleeps like it does while paused.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from events.metrics import Histogram
+
+TickSystem = Callable[[float], None]
+
+
+@dataclass(order=True)
+class _RegisteredSystem:
+    order: int
+    sequence: int
+    system: TickSystem = field(compare=False)
+    name: str = field(compare=False)
+
+
+class TickScheduler:
+    def __init__(self, get_rate: Callable[[], float], max_catch_up: int = 5):
+        self.get_rate = get_rate
+        self.max_catch_up = max_catch_up
+        self.tick_count = 0
+        self.dropped_ticks = 0
+        self._systems: list[_RegisteredSystem] = []
+        self._sequence = 0
+        self._running = False
+        self._closing = False
+        self._wake = asyncio.Event()
+        # Time spent running the systems of one tick, and how late the tick started
+        self.tick_duration = Histogram()
+        self.jitter = Histogram()
+
+    def register(self, system: TickSystem, order: int = 0, name: str = None) -> None:
+        """Systems run every tick with the fixed step in seconds, lower order first, ties in registration order"""
+        self._sequence += 1
+        self._systems.append(_RegisteredSystem(order, self._sequence, system, name or getattr(system, "__name__", repr(system))))
+        self._systems.sort()
+        self._wake.set()
+
+    def unregister(self, system: TickSystem) -> None:
+        self._systems = [entry for entry in self._systems if entry.system != system]
+
+    def resume(self) -> None:
+        self._running = True
+        self._wake.set()
+
+    def pause(self) -> None:
+        self._running = False
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _active(self) -> bool:
+        return self._running and bool(self._systems)
+
+    def stop(self) -> None:
+        self._closing = True
+        self._wake.set()
+
+    async def run(self) -> None:
+        while not self._closing:
+            if not self._active():
+                # Paused or idle, nothing wakes the loop until resume, register or stop
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            interval = 1 / self.get_rate()
+            deadline = time.perf_counter()
+            while self._active() and not self._closing:
+                now = time.perf_counter()
+                self.jitter.record(now - deadline)
+                steps = 0
+                while now >= deadline and steps < self.max_catch_up:
+                    self._step(interval)
+                    deadline += interval
+                    steps += 1
+                    now = time.perf_counter()
+                if now >= deadline:
+                    behind = int((now - deadline) / interval) + 1
+                    self.dropped_ticks += behind
+                    deadline += behind * interval
+
+                rate_interval = 1 / self.get_rate()
+                if rate_interval != interval:
+                    # tick_speed changed, keep the phase and switch the step
+                    deadline += rate_interval - interval
+                    interval = rate_interval
+                await asyncio.sleep(deadline - time.perf_counter())
+
+    def _step(self, interval: float) -> None:
+        started_at = time.perf_counter()
+        self.tick_count += 1
+        for entry in self._systems:
+            entry.system(interval)
+        self.tick_duration.record(time.perf_counter() - started_at)
+
+    def snapshot(self) -> dict:
+        return {
+            "rate": self.get_rate(),
+            "ticks": self.tick_count,
+            "dropped_ticks": self.dropped_ticks,
+            "systems": [entry.name for entry in self._systems],
+            "tick_duration": self.tick_duration.summary(),
+            "jitter": self.jitter.summary()
+        }
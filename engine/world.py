@@ -1,4 +1,4 @@
-from typing import Set, Dict, Any, Type, Tuple, List
+from typing import Set, Dict, Any, Type, Tuple, List, Iterable, Sequence
 from collections import defaultdict
 
 # Define generic types for clarity.
@@ -48,6 +48,17 @@ class World:
         self._entities.add(eid)
         return eid
     
+    def create_entities(self, amount: int) -> range:
+        """
+        Allocates a contiguous block of `amount` entity IDs at once.
+        Returns the range of the new IDs.
+        """
+        start = self._next_id
+        self._next_id += amount
+        entity_ids = range(start, self._next_id)
+        self._entities.update(entity_ids)
+        return entity_ids
+
     def _entity_exists(self, entity_id: int) -> None:
         """
         Internal helper to check if an entity exists.
@@ -80,6 +91,24 @@ class World:
         for component in components_data:
             self.add_component(entity_id, component)
 
+    def add_component_column(self, component_type: ComponentType, entity_ids: Sequence[int], components_data: Iterable[ComponentData]):
+        """
+        Adds one component type to many entities at once, pairing entity_ids with components_data.
+        Existence is checked once for the whole batch instead of once per component.
+
+        Args:
+            component_type: The class of the components being added.
+            entity_ids: The IDs of the entities, e.g. the range returned by create_entities.
+                Read twice, for the check and for the pairing, so one-shot iterables are copied first.
+            components_data: Component instances in the same order as entity_ids.
+        """
+        if not isinstance(entity_ids, Sequence):
+            entity_ids = list(entity_ids)
+        if not self._entities.issuperset(entity_ids):
+            missing = set(entity_ids) - self._entities
+            raise ValueError(f"Entities {sorted(missing)} do not exist in the world.")
+        self._world[component_type].update(zip(entity_ids, components_data))
+
     def get_component(self, entity_id: int, component_type: ComponentType) -> ComponentData | None:
         """
         Retrieves a component instance for a given entity and component type.
@@ -97,6 +126,19 @@ class World:
         # Using .get() on _world[component_type] is safe because defaultdict ensures _world[component_type] exists
         return self._world[component_type].get(entity_id)
 
+    def get_component_column(self, component_type: ComponentType) -> Dict[int, ComponentData]:
+        """
+        Returns every component of one type, keyed by entity ID. Meant for systems that walk
+        all components of a type each tick; the dictionary is live, do not add or remove keys.
+        
+        Args:
+            component_type: The class of the components to retrieve.
+            
+        Returns:
+            A dictionary of entity ID to component instance, empty if no entity has the type.
+        """
+        return self._world.get(component_type, {})
+
     def remove_component(self, entity_id: int, component_type: ComponentType):
         """
         Removes a component of a specific type from an entity.
@@ -0,0 +1,184 @@
+"""
+Compact binary encoding of events for sending them between processes.
+
+Every value starts with a one byte tag, fixed size numbers are struct packed (little endian).
+Events and event containers are encoded as a record tag, a type id and their fields in declaration order.
+Type ids come from sorted class names, so both sides agree as long as they run the same code.
+"""
+from dataclasses import fields, is_dataclass
+from enum import Enum
+import struct
+import sys
+
+from events import events as event_module
+from events import event_containers as container_module
+from global_state import game_consts
+from util.key_wrapper import LocKey
+
+NONE, TRUE, FALSE, INT, FLOAT, STR, LIST, DICT, LOC_KEY, ENUM, RECORD, TUPLE = range(12)
+
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+
+def _is_module_level(cls: type) -> bool:
+    # dataclass(slots=True) replaces the class, the discarded original can still show up in __subclasses__
+    return getattr(sys.modules.get(cls.__module__), cls.__qualname__, None) is cls
+
+
+def _get_record_types() -> list[type]:
+    found = []
+    pending = [event_module.Event]
+    while pending:
+        cls = pending.pop()
+        found.append(cls)
+        pending.extend(cls.__subclasses__())
+    found += [obj for obj in vars(container_module).values() if isinstance(obj, type) and is_dataclass(obj)]
+    found = {cls for cls in found if _is_module_level(cls)}
+    return sorted(found, key=lambda cls: f"{cls.__module__}.{cls.__qualname__}")
+
+
+def _get_enum_types() -> list[type]:
+    enums = [obj for obj in vars(game_consts).values() if isinstance(obj, type) and issubclass(obj, Enum) and obj is not Enum]
+    return sorted(enums, key=lambda cls: cls.__qualname__)
+
+
+class EventCodec:
+    """Encodes and decodes events. Build one per process, after every Event subclass was imported"""
+    def __init__(self):
+        self.record_types = _get_record_types()
+        self.record_ids = {cls: i for i, cls in enumerate(self.record_types)}
+        self.record_fields = [tuple(f.name for f in fields(cls)) for cls in self.record_types]
+        self.enum_types = _get_enum_types()
+        self.enum_ids = {cls: i for i, cls in enumerate(self.enum_types)}
+
+    def encode(self, event: event_module.Event) -> bytes:
+        out = bytearray()
+        self._write(out, event)
+        return bytes(out)
+
+    def encode_many(self, event_list: list) -> bytes:
+        """Several events in one buffer, e.g. one pipe message per drained queue"""
+        out = bytearray(_U32.pack(len(event_list)))
+        for event in event_list:
+            self._write(out, event)
+        return bytes(out)
+
+    def decode(self, data: bytes) -> event_module.Event:
+        value, _ = self._read(memoryview(data), 0)
+        return value
+
+    def decode_many(self, data: bytes) -> list:
+        view = memoryview(data)
+        amount, = _U32.unpack_from(view, 0)
+        offset = _U32.size
+        event_list = []
+        for _ in range(amount):
+            event, offset = self._read(view, offset)
+            event_list.append(event)
+        return event_list
+
+    def _write(self, out: bytearray, value) -> None:
+        # bool before int, bool is an int subclass
+        if value is None:
+            out.append(NONE)
+        elif value is True:
+            out.append(TRUE)
+        elif value is False:
+            out.append(FALSE)
+        elif isinstance(value, Enum):
+            out.append(ENUM)
+            out += _U8.pack(self.enum_ids[type(value)])
+            self._write_str(out, value.name)
+        elif isinstance(value, int):
+            out.append(INT)
+            out += _I64.pack(value)
+        elif isinstance(value, float):
+            out.append(FLOAT)
+            out += _F64.pack(value)
+        elif isinstance(value, str):
+            out.append(STR)
+            self._write_str(out, value)
+        elif isinstance(value, LocKey):
+            out.append(LOC_KEY)
+            self._write_str(out, value.key)
+        elif type(value) in self.record_ids:
+            record_id = self.record_ids[type(value)]
+            out.append(RECORD)
+            out += _U8.pack(record_id)
+            for name in self.record_fields[record_id]:
+                self._write(out, getattr(value, name))
+        elif isinstance(value, (list, tuple)):
+            out.append(LIST if isinstance(value, list) else TUPLE)
+            out += _U32.pack(len(value))
+            for item in value:
+                self._write(out, item)
+        elif isinstance(value, dict):
+            out.append(DICT)
+            out += _U32.pack(len(value))
+            for k, v in value.items():
+                self._write(out, k)
+                self._write(out, v)
+        else:
+            raise TypeError(f"Unable to encode {type(value).__name__} value {value!r}")
+
+    def _write_str(self, out: bytearray, value: str) -> None:
+        data = value.encode("utf-8")
+        out += _U32.pack(len(data))
+        out += data
+
+    def _read_str(self, view: memoryview, offset: int) -> tuple[str, int]:
+        length, = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        return str(view[offset:offset + length], "utf-8"), offset + length
+
+    def _read(self, view: memoryview, offset: int) -> tuple:
+        tag = view[offset]
+        offset += 1
+        if tag == NONE:
+            return None, offset
+        if tag == TRUE:
+            return True, offset
+        if tag == FALSE:
+            return False, offset
+        if tag == INT:
+            return _I64.unpack_from(view, offset)[0], offset + _I64.size
+        if tag == FLOAT:
+            return _F64.unpack_from(view, offset)[0], offset + _F64.size
+        if tag == STR:
+            return self._read_str(view, offset)
+        if tag == LOC_KEY:
+            key, offset = self._read_str(view, offset)
+            return LocKey(key), offset
+        if tag == ENUM:
+            enum_type = self.enum_types[view[offset]]
+            name, offset = self._read_str(view, offset + 1)
+            return enum_type[name], offset
+        if tag == RECORD:
+            record_id = view[offset]
+            offset += 1
+            values = []
+            for _ in self.record_fields[record_id]:
+                value, offset = self._read(view, offset)
+                values.append(value)
+            return self.record_types[record_id](*values), offset
+        if tag == LIST or tag == TUPLE:
+            amount, = _U32.unpack_from(view, offset)
+            offset += _U32.size
+            items = []
+            for _ in range(amount):
+                item, offset = self._read(view, offset)
+                items.append(item)
+            return (items if tag == LIST else tuple(items)), offset
+        if tag == DICT:
+            amount, = _U32.unpack_from(view, offset)
+            offset += _U32.size
+            result = {}
+            for _ in range(amount):
+                k, offset = self._read(view, offset)
+                v, offset = self._read(view, offset)
+                result[k] = v
+            return result, offset
+        raise ValueError(f"Unknown tag {tag} at offset {offset - 1}")
@@ -0,0 +1,108 @@
+from typing import Callable, Optional, Iterable
+import time
+
+from .events import Event
+from .metrics import EventMetrics
+
+Handler = Callable[[Event], None]
+BatchHandler = Callable[[list[Event]], None]
+
+
+class EventBus:
+    """
+    Routes events to handlers through a type -> handlers dictionary, so the cost of a dispatch
+    doesn't depend on how many event types exist. Handlers can be added and removed at any time.
+
+    Batch handlers receive every consecutive event of their type from one dispatch_many call as a list,
+    which keeps the relative order of different event types intact.
+    Subclasses of a subscribed type are routed to its handlers unless they have their own.
+    With EventMetrics attached, the time spent in handlers is recorded per event type.
+    """
+    def __init__(self, default_handler: Optional[Handler] = None, metrics: Optional[EventMetrics] = None):
+        self._handlers: dict[type, list[Handler]] = {}
+        self._batch_handlers: dict[type, list[BatchHandler]] = {}
+        self._resolved: dict[type, tuple[list[Handler], list[BatchHandler]]] = {}
+        self.default_handler = default_handler
+        self.metrics = metrics
+
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._resolved.clear()
+
+    def subscribe_batch(self, event_type: type, handler: BatchHandler) -> None:
+        self._batch_handlers.setdefault(event_type, []).append(handler)
+        self._resolved.clear()
+
+    def unsubscribe(self, event_type: type, handler: Handler | BatchHandler) -> None:
+        for handler_map in (self._handlers, self._batch_handlers):
+            handlers = handler_map.get(event_type)
+            if handlers and handler in handlers:
+                handlers.remove(handler)
+                if not handlers:
+                    del handler_map[event_type]
+        self._resolved.clear()
+
+    def _resolve(self, event_type: type) -> tuple[list[Handler], list[BatchHandler]]:
+        resolved = self._resolved.get(event_type)
+        if resolved is None:
+            resolved = ([], [])
+            for cls in event_type.__mro__:
+                if cls in self._handlers or cls in self._batch_handlers:
+                    resolved = (self._handlers.get(cls, []), self._batch_handlers.get(cls, []))
+                    break
+            self._resolved[event_type] = resolved
+        return resolved
+
+    def dispatch(self, event: Event) -> None:
+        if self.metrics:
+            started_at = time.perf_counter()
+            self._dispatch(event)
+            self.metrics.record_handler(type(event), time.perf_counter() - started_at)
+        else:
+            self._dispatch(event)
+
+    def _dispatch(self, event: Event) -> None:
+        handlers, batch_handlers = self._resolve(type(event))
+        if not handlers and not batch_handlers:
+            if self.default_handler:
+                self.default_handler(event)
+            return
+        for handler in handlers:
+            handler(event)
+        for handler in batch_handlers:
+            handler([event])
+
+    def dispatch_many(self, events: Iterable[Event]) -> None:
+        run: list[Event] = []
+        run_type: Optional[type] = None
+        for event in events:
+            event_type = type(event)
+            if run and event_type is not run_type:
+                self._flush(run)
+                run = []
+            run_type = event_type
+            if self._resolve(event_type)[1]:
+                run.append(event)
+            else:
+                self.dispatch(event)
+        if run:
+            self._flush(run)
+
+    def _flush(self, run: list[Event]) -> None:
+        if self.metrics:
+            started_at = time.perf_counter()
+            self._flush_run(run)
+            # Batch handlers don't split per event, so the run's time is spread evenly over it
+            per_event = (time.perf_counter() - started_at) / len(run)
+            for _ in run:
+                self.metrics.record_handler(type(run[0]), per_event)
+        else:
+            self._flush_run(run)
+
+    def _flush_run(self, run: list[Event]) -> None:
+        handlers, batch_handlers = self._resolve(type(run[0]))
+        for event in run:
+            for handler in handlers:
+                handler(event)
+        for handler in batch_handlers:
+            handler(run)
@@ -4,7 +4,7 @@ from global_state.game_consts import Scope
 
 import globals as g
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EntityContainer:
     entity_id: int
     key: str
@@ -14,7 +14,7 @@ class EntityContainer:
     max_ap: int
     attack: int
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AbilityContainer:
     ability_id: int
     ap: int
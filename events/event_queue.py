@@ -0,0 +1,92 @@
+"""
+Bounded queue for the engine <-> UI event streams.
+
+put() waits while the queue is full, so a producer that outpaces its consumer gets slowed
+down instead of piling events up. A StatsChangeEvent supersedes the snapshots of the same
+entities that are still queued, only the newest one gets delivered. Every other event,
+BattleLogEvent included, is delivered in the order it was put.
+
+Events are stamped when they are put. With EventMetrics attached, the time spent waiting
+and the depth after every put are recorded under the queue's name.
+"""
+import asyncio
+import time
+from typing import Optional
+
+from .events import StatsChangeEvent
+from .event_containers import EntityContainer
+from .metrics import EventMetrics
+
+
+class _PendingStats:
+    """Queued StatsChangeEvent, entities drop out of it as newer snapshots arrive"""
+    __slots__ = ("entities",)
+
+    def __init__(self, event: StatsChangeEvent):
+        self.entities: dict[int, EntityContainer] = {entity.entity_id: entity for entity in event.entities}
+
+
+class EventQueue(asyncio.Queue):
+    def __init__(self, maxsize: int = 0, name: str = "events", metrics: Optional[EventMetrics] = None):
+        super().__init__(maxsize)
+        self.name = name
+        self.metrics = metrics
+
+    def _init(self, maxsize: int) -> None:
+        super()._init(maxsize)
+        # entity_id -> queue entry of the stats holding its latest snapshot
+        self._pending_stats: dict[int, tuple[float, _PendingStats]] = {}
+
+    async def put(self, item) -> None:
+        # Coalesce first, a superseded snapshot may be the slot we would wait for
+        if isinstance(item, StatsChangeEvent):
+            self._drop_superseded(item)
+        await super().put(item)
+
+    def put_nowait(self, item) -> None:
+        if isinstance(item, StatsChangeEvent):
+            # Raise before coalescing, the dropped snapshots would be lost with the rejected event
+            if self.full() and not self._frees_slot(item):
+                raise asyncio.QueueFull
+            self._drop_superseded(item)
+        super().put_nowait(item)
+
+    def _put(self, item) -> None:
+        # Entries are (enqueued_at, event), events are frozen so the stamp can't go on them
+        if isinstance(item, StatsChangeEvent):
+            entry = (time.perf_counter(), _PendingStats(item))
+            for entity_id in entry[1].entities:
+                self._pending_stats[entity_id] = entry
+        else:
+            entry = (time.perf_counter(), item)
+        self._queue.append(entry)
+        if self.metrics:
+            self.metrics.set_depth(self.name, len(self._queue))
+
+    def _get(self):
+        enqueued_at, item = self._queue.popleft()
+        if isinstance(item, _PendingStats):
+            for entity_id in item.entities:
+                del self._pending_stats[entity_id]
+            item = StatsChangeEvent(list(item.entities.values()))
+        if self.metrics:
+            self.metrics.record_latency(type(item), time.perf_counter() - enqueued_at)
+        return item
+
+    def _frees_slot(self, event: StatsChangeEvent) -> bool:
+        """Whether the event supersedes every entity of some queued StatsChangeEvent"""
+        entity_ids = {entity.entity_id for entity in event.entities}
+        entries = {id(entry): entry for entity_id in entity_ids if (entry := self._pending_stats.get(entity_id))}
+        return any(entity_ids.issuperset(entry[1].entities) for entry in entries.values())
+
+    def _drop_superseded(self, event: StatsChangeEvent) -> None:
+        for entity in event.entities:
+            entry = self._pending_stats.pop(entity.entity_id, None)
+            if entry is None:
+                continue
+            pending = entry[1]
+            del pending.entities[entity.entity_id]
+            if not pending.entities:
+                # Fully superseded, the slot goes back to the producers
+                self._queue.remove(entry)
+                self.task_done()
@@ -7,72 +7,80 @@ if TYPE_CHECKING:
     from global_state.game_consts import PlayerClass
     from .event_containers import EntityContainer, AbilityContainer
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Event:
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameStartEvent(Event):
     player_name: str
     player_class: PlayerClass
     save_state: Optional[Dict] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StartBattleEvent(Event):
     heroes: List[EntityContainer]
     enemies: List[EntityContainer]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlayerActionEvent(Event):
     ability_id: int
     entity_id: int
     target_id: Optional[int] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BattleLogEvent(Event):
     message_key: str
     data_dict: Optional[Dict[str,Any]] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UiUpdateEvent(Event):
     ability_key: str
     tooltip_key: str
     data_dict: Optional[Dict[str,Any]] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RefreshLogEvent(Event):
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EntityDeathEvent(Event):
     entity_id: int
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatsChangeEvent(Event):
     entities: List[EntityContainer]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StartPlayerTurnEvent(Event):
     entity_id: int
     abilities: List[AbilityContainer]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EndPlayerTurnEvent(Event):
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameStopEvent(Event):
     pass
 
+@dataclass(frozen=True, slots=True)
 class EnginePauseEvent(Event):
     pass
 
+@dataclass(frozen=True, slots=True)
 class EngineResumeEvent(Event):
     pass
 
+@dataclass(frozen=True, slots=True)
 class EngineStopEvent(Event):
     pass
 
+@dataclass(frozen=True, slots=True)
+class ReloadBlueprintsEvent(Event):
+    pass
+
+@dataclass(frozen=True, slots=True)
 class ApplicationExitEvent(Event):
     pass
     
\ No newline at end of file
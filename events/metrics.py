@@ -0,0 +1,135 @@
+"""
+Event pipeline instrumentation: how long events wait in the queues, how deep the queues get
+and how long handlers take. Meant for diagnosing UI stalls, everything is recorded in-process
+and can be read with snapshot() or written out with dump().
+"""
+import json
+import time
+from bisect import bisect_left
+from typing import Callable
+
+# Upper bucket bounds in seconds, anything slower lands in the overflow bucket
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram, percentiles are reported as the upper bound of their bucket"""
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "buckets": {("inf" if i == len(self.bounds) else str(self.bounds[i])): c for i, c in enumerate(self.counts) if c}
+        }
+
+
+class Gauge:
+    __slots__ = ("value", "peak", "samples", "total")
+
+    def __init__(self):
+        self.value = 0
+        self.peak = 0
+        self.samples = 0
+        self.total = 0
+
+    def set(self, value: int) -> None:
+        self.value = value
+        self.samples += 1
+        self.total += value
+        if value > self.peak:
+            self.peak = value
+
+    def summary(self) -> dict:
+        return {
+            "value": self.value,
+            "peak": self.peak,
+            "mean": self.total / self.samples if self.samples else 0.0
+        }
+
+
+class EventMetrics:
+    """
+    Collects latency per event type (enqueue until the parser takes the event, its handlers
+    run right after with no await in between), queue depth per queue and handler time per event type.
+    """
+    def __init__(self):
+        self.started_at = time.time()
+        self.latency: dict[str, Histogram] = {}
+        self.handler_time: dict[str, Histogram] = {}
+        self.queue_depth: dict[str, Gauge] = {}
+        # Other subsystems with their own stats, included in snapshots under their name
+        self.sources: dict[str, Callable[[], dict]] = {}
+
+    def record_latency(self, event_type: type, seconds: float) -> None:
+        histogram = self.latency.get(event_type.__name__)
+        if histogram is None:
+            histogram = self.latency[event_type.__name__] = Histogram()
+        histogram.record(seconds)
+
+    def record_handler(self, event_type: type, seconds: float) -> None:
+        histogram = self.handler_time.get(event_type.__name__)
+        if histogram is None:
+            histogram = self.handler_time[event_type.__name__] = Histogram()
+        histogram.record(seconds)
+
+    def set_depth(self, queue_name: str, depth: int) -> None:
+        gauge = self.queue_depth.get(queue_name)
+        if gauge is None:
+            gauge = self.queue_depth[queue_name] = Gauge()
+        gauge.set(depth)
+
+    def add_source(self, name: str, snapshot: Callable[[], dict]) -> None:
+        self.sources[name] = snapshot
+
+    def snapshot(self) -> dict:
+        snapshot = {
+            "uptime": time.time() - self.started_at,
+            "latency": {name: histogram.summary() for name, histogram in sorted(self.latency.items())},
+            "handler_time": {name: histogram.summary() for name, histogram in sorted(self.handler_time.items())},
+            "queue_depth": {name: gauge.summary() for name, gauge in sorted(self.queue_depth.items())}
+        }
+        for name, source in self.sources.items():
+            snapshot[name] = source()
+        return snapshot
+
+    def dump(self, filepath: str) -> None:
+        with open(filepath, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, indent=2)
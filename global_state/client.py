@@ -1,46 +1,69 @@
 from engine.engine import GameEngine
-from config.config import Config
-from logger.log_screen import Logger
+from global_state.engine_process import EngineProcess
+from global_state.consts import ENGINE_TO_UI_QUEUE_SIZE, UI_TO_ENGINE_QUEUE_SIZE, METRICS_FILE
+from events.event_queue import EventQueue
+from events.metrics import EventMetrics
+from global_state.context import create_context
 from ui.ui_controller import UiController
-from translator import LocalizationManager
-
-import globals as g
 
 import asyncio
+import atexit
 
 class Client:
     def __init__(self, argv):
         keep_log = "--keep-log" in argv
+        self.watch_data = "--watch-data" in argv
+        self.engine_process = "--engine-process" in argv
 
         # Parse log level from args
         log_level = "DEBUG"
+        metrics_filepath = None
         for i, arg in enumerate(argv):
             if arg in ("--log", "--log-level") and i + 1 < len(argv):
                 log_level = argv[i + 1]
+            if arg == "--metrics":
+                has_path = i + 1 < len(argv) and not argv[i + 1].startswith("--")
+                metrics_filepath = argv[i + 1] if has_path else METRICS_FILE
 
-        self.engine_to_ui_queue = asyncio.Queue()
-        self.ui_to_engine_queue = asyncio.Queue()
+        # Event metrics, read them with self.metrics.snapshot(). Written out on exit when a file was given
+        self.metrics = EventMetrics() if metrics_filepath else None
+        if metrics_filepath:
+            atexit.register(self.metrics.dump, metrics_filepath)
 
-        self.logger = Logger(log_level, keep_log)
-        g.logger = self.logger
+        self.engine_to_ui_queue = EventQueue(ENGINE_TO_UI_QUEUE_SIZE, "engine_to_ui", self.metrics)
+        self.ui_to_engine_queue = EventQueue(UI_TO_ENGINE_QUEUE_SIZE, "ui_to_engine", self.metrics)
 
-        self.config = Config()
-        g.config = self.config
+        # The client's session is also the process default, for threads and anything outside its tasks
+        self.context = create_context(log_level, keep_log, process_default=True)
+        self.context.client = self
+        self.logger = self.context.logger
+        self.config = self.context.config
+        self.loc = self.context.loc
 
-        self.loc = LocalizationManager(lang=g.config.main.language)
-        g.loc = self.loc
-        
         self.ui = UiController(self.engine_to_ui_queue, self.ui_to_engine_queue)
 
-        self.engine = GameEngine(self.ui_to_engine_queue, self.engine_to_ui_queue)
+        if self.engine_process:
+            self.engine = EngineProcess(self.ui_to_engine_queue, self.engine_to_ui_queue, log_level, keep_log, self.watch_data)
+        else:
+            self.engine = GameEngine(self.ui_to_engine_queue, self.engine_to_ui_queue)
 
     async def run(self):
-        await asyncio.gather(
-            self.engine.tick(),
-            self.ui.app.run_async(),
-            self.ui.event_parser.process_events(),
-            self.engine.event_parser.process_events()
-        )
+        tasks = [
+            self.ui.run_app(),
+            self.ui.event_parser.process_events()
+        ]
+        if self.engine_process:
+            tasks.append(self.engine.run())
+        else:
+            tasks += [self.engine.tick(), self.engine.event_parser.process_events()]
+            if self.watch_data:
+                tasks.append(self.engine.watch_blueprints())
+        try:
+            await asyncio.gather(*tasks)
+        except SystemExit:
+            # The engine ends the process from its own task and that SystemExit has already left the
+            # loop. Finishing quietly here lets asyncio.run shut the app down and restore the terminal
+            pass
 
     def launch(self):
         asyncio.run(self.run())
@@ -2,9 +2,11 @@
 BASE_SETTINGS_PATH = "settings"
 MAIN_CONFIG_PATH = "main.cfg"
 KEY_CONFIG_PATH = "keys.cfg"
+BATTLE_MODES = ["turns", "atb"] # Turn order by action value, or active-time battles driven by engine ticks
 
 #LOGGER
 LOG_FILE = "latest.log"
+ENGINE_LOG_FILE = "engine.log" # Written by the engine child process, see --engine-process
 MAX_LOG_FILE_SIZE = 5 * 1024 * 1024  # 5 MB
 
 #LOCALIZATION
@@ -13,4 +15,11 @@ DEFAULT_LANG = "en"
 ALWAYS_LOADED = {"ui"}
 
 BASIC_ABILITY_MAP = {}
-UNIQUE_ABILITY_MAP = {}
\ No newline at end of file
+UNIQUE_ABILITY_MAP = {}
+
+#EVENTS
+ENGINE_TO_UI_QUEUE_SIZE = 256
+UI_TO_ENGINE_QUEUE_SIZE = 64
+METRICS_FILE = "metrics.json"
+LOG_BACKLOG_LIMIT = 32 # Battle log entries waiting for the typewriter before the UI stops taking events
+BATTLE_LOG_HISTORY = 100_000 # Battle log entries kept for scrolling back, older ones are dropped
@@ -0,0 +1,75 @@
+"""
+Per-session state: logger, config, localization and the client.
+
+The `globals` module resolves g.logger, g.config, g.loc and g.client through the active
+SessionContext, so every subsystem keeps using `import globals as g`. The context lives in
+a ContextVar: asyncio tasks inherit it from the task that created them, so one session's
+tasks never see another's. Threads start without one and fall back to the process default.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional, Iterator, TYPE_CHECKING
+
+from global_state.consts import LOG_FILE
+
+if TYPE_CHECKING:
+    from logger.log_screen import Logger
+    from config.config import Config
+    from translator import LocalizationManager
+    from global_state.client import Client
+
+
+@dataclass
+class SessionContext:
+    logger: Optional[Logger] = None
+    config: Optional[Config] = None
+    loc: Optional[LocalizationManager] = None
+    client: Optional[Client] = None
+
+
+SESSION_FIELDS = frozenset(("logger", "config", "loc", "client"))
+
+_session: ContextVar[Optional[SessionContext]] = ContextVar("session", default=None)
+_process_default: Optional[SessionContext] = None
+
+
+def current_context() -> Optional[SessionContext]:
+    return _session.get() or _process_default
+
+
+def activate(context: SessionContext, process_default: bool = False) -> None:
+    """Makes the context current here and in every task started from here on.
+    The process default is what threads without a context of their own see"""
+    global _process_default
+    _session.set(context)
+    if process_default:
+        _process_default = context
+
+
+@contextmanager
+def use_context(context: SessionContext) -> Iterator[SessionContext]:
+    token = _session.set(context)
+    try:
+        yield context
+    finally:
+        _session.reset(token)
+
+
+def create_context(log_level: str = "DEBUG", keep_log: bool = False, process_default: bool = False,
+                   log_file: str = LOG_FILE, log_prefix: str = "", persist_config: bool = True) -> SessionContext:
+    """Builds and activates a context. The parts are created one by one since each of them
+    already logs through g.logger and reads g.config while being set up.
+    log_file and log_prefix tell apart contexts that share a process or a log file.
+    Without persist_config the settings files are only read, for contexts that don't own them"""
+    from logger.log_screen import Logger
+    from config.config import Config
+    from translator import LocalizationManager
+
+    context = SessionContext()
+    activate(context, process_default)
+    context.logger = Logger(log_level, keep_log, log_file, log_prefix)
+    context.config = Config(persist_config)
+    context.loc = LocalizationManager(lang=context.config.main.language)
+    return context
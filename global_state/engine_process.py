@@ -0,0 +1,110 @@
+"""
+Runs GameEngine in a child process. Events cross the process boundary through a pipe,
+encoded with EventCodec, so heavy engine work doesn't compete with UI rendering.
+"""
+import asyncio
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from typing import Callable
+
+import globals as g
+from global_state.context import create_context
+from events.codec import EventCodec
+from events.events import EngineStopEvent
+from events.event_queue import EventQueue
+from global_state.consts import ENGINE_TO_UI_QUEUE_SIZE, UI_TO_ENGINE_QUEUE_SIZE, ENGINE_LOG_FILE
+
+
+async def pump_queue_to_pipe(queue: asyncio.Queue, conn: Connection, codec: EventCodec, on_sent: Callable = None) -> None:
+    """Sends everything that piled up in the queue as one pipe message.
+    The send runs in a thread: it blocks while the pipe is full, and the peer only drains the pipe
+    as fast as its own loop takes the events, so blocking this loop could stall both sides"""
+    while True:
+        event_list = [await queue.get()]
+        while not queue.empty():
+            event_list.append(queue.get_nowait())
+        await asyncio.to_thread(conn.send_bytes, codec.encode_many(event_list))
+        if on_sent:
+            on_sent(event_list)
+
+
+def start_pipe_reader(conn: Connection, codec: EventCodec, queue: asyncio.Queue, on_close: Callable[[], None]) -> threading.Thread:
+    """Reads and decodes pipe messages in a thread, then hands the events to the loop's queue.
+    A thread keeps this portable, Windows event loops can't watch pipe handles.
+    While the queue is full the thread stops reading, so the pipe pushes back on the sender"""
+    loop = asyncio.get_running_loop()
+
+    async def put_all(event_list: list) -> None:
+        for event in event_list:
+            await queue.put(event)
+
+    def read() -> None:
+        try:
+            while True:
+                try:
+                    data = conn.recv_bytes()
+                except (EOFError, OSError):
+                    loop.call_soon_threadsafe(on_close)
+                    return
+                asyncio.run_coroutine_threadsafe(put_all(codec.decode_many(data)), loop).result()
+        except RuntimeError:
+            # The loop was closed first, the process is shutting down anyway
+            pass
+
+    thread = threading.Thread(target=read, name="pipe-reader", daemon=True)
+    thread.start()
+    return thread
+
+
+def run_engine_process(conn: Connection, log_level: str, keep_log: bool, watch_data: bool) -> None:
+    """Child process entry point"""
+    # Own log file, the UI process writes and rotates LOG_FILE without coordinating with this one
+    create_context(log_level, keep_log=keep_log, process_default=True, log_file=ENGINE_LOG_FILE, log_prefix="[engine]")
+    asyncio.run(_run_engine(conn, watch_data))
+
+
+async def _run_engine(conn: Connection, watch_data: bool) -> None:
+    from engine.engine import GameEngine
+
+    ui_to_engine_queue = EventQueue(UI_TO_ENGINE_QUEUE_SIZE, "ui_to_engine")
+    engine_to_ui_queue = EventQueue(ENGINE_TO_UI_QUEUE_SIZE, "engine_to_ui")
+    # The UI process owns the config file, the child would only write back stale values
+    engine = GameEngine(ui_to_engine_queue, engine_to_ui_queue, owns_config=False)
+    codec = EventCodec()
+
+    # UI process is gone, shut down the same way a regular exit does
+    start_pipe_reader(conn, codec, ui_to_engine_queue, on_close=lambda: ui_to_engine_queue.put_nowait(EngineStopEvent()))
+    tasks = [
+        engine.tick(),
+        engine.event_parser.process_events(),
+        pump_queue_to_pipe(engine_to_ui_queue, conn, codec)
+    ]
+    if watch_data:
+        tasks.append(engine.watch_blueprints())
+    await asyncio.gather(*tasks)
+
+
+class EngineProcess:
+    """UI side of a GameEngine running in a child process. Bridges the client's queues to the pipe"""
+    def __init__(self, ui_to_engine_queue: EventQueue, engine_to_ui_queue: EventQueue, log_level: str, keep_log: bool = False, watch_data: bool = False):
+        self.ui_to_engine_queue = ui_to_engine_queue
+        self.engine_to_ui_queue = engine_to_ui_queue
+        self.codec = EventCodec()
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=run_engine_process, args=(child_conn, log_level, keep_log, watch_data), name="engine", daemon=True)
+
+    async def run(self) -> None:
+        self.process.start()
+        g.logger.info(f"Engine process started with pid {self.process.pid}, logging to {ENGINE_LOG_FILE}")
+        start_pipe_reader(self.conn, self.codec, self.engine_to_ui_queue, on_close=self._on_engine_closed)
+        await pump_queue_to_pipe(self.ui_to_engine_queue, self.conn, self.codec, on_sent=self._on_sent)
+
+    def _on_sent(self, event_list: list) -> None:
+        # Mirrors GameEngine.stop for the in-process engine
+        if any(isinstance(event, EngineStopEvent) for event in event_list):
+            g.config.save()
+            raise SystemExit(0)
+
+    def _on_engine_closed(self) -> None:
+        g.logger.warning(f"Engine process exited with code {self.process.exitcode}, see {ENGINE_LOG_FILE}")
@@ -5,6 +5,9 @@ class Defaults(Enum):
     ENEMY_ID = 100
     PLAYER_HEAL_VALUE = 20
     ACTION_VALUE_SCALE = 10000
+    ATB_DRAIN_PER_SECOND = 50 # Action value drained per second in active-time battles, a speed 100 fighter acts every 2 seconds
+    ATB_DECISION_WINDOW = 10 # Seconds the player has to pick an action before the turn is lost
+    ATB_ACTION_BUDGET = 0.5 # Share of a tick enemy turns may take, the rest act on the next tick
 
 class PlayerClass(Enum):
     WARRIOR = auto()
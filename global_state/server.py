@@ -0,0 +1,261 @@
+"""
+Hosts many game sessions in one asyncio process, one per telnet or SSH connection.
+Every connection gets its own queues, UiController and GameEngine, plus its own session
+context (logger, config, localization), so language and key changes stay with the player
+and are never written to the host's settings files.
+The prompt_toolkit server runs each connection in its own app session, so get_app() resolves
+per connection as well.
+"""
+import asyncio
+import codecs
+import io
+import socket
+from contextlib import contextmanager
+from typing import Optional, Callable, Iterator
+
+from prompt_toolkit.contrib.telnet.server import TelnetConnection
+from prompt_toolkit.input import PipeInput
+from prompt_toolkit.input.vt100_parser import Vt100Parser
+from prompt_toolkit.key_binding import KeyPress
+
+from engine.engine import GameEngine
+from events.event_queue import EventQueue
+from global_state.consts import ENGINE_TO_UI_QUEUE_SIZE, UI_TO_ENGINE_QUEUE_SIZE
+from global_state.context import create_context
+from ui.ui_controller import UiController
+
+import globals as g
+
+
+class Session:
+    def __init__(self, name: str, refresh_rate: Optional[float] = None):
+        self.name = name
+        self.engine_to_ui_queue = EventQueue(ENGINE_TO_UI_QUEUE_SIZE, "engine_to_ui")
+        self.ui_to_engine_queue = EventQueue(UI_TO_ENGINE_QUEUE_SIZE, "ui_to_engine")
+        self.ui = UiController(self.engine_to_ui_queue, self.ui_to_engine_queue, refresh_rate)
+        # The server owns the config file and the process
+        self.engine = GameEngine(self.ui_to_engine_queue, self.engine_to_ui_queue, owns_config=False, owns_process=False)
+
+    async def run(self) -> None:
+        """Runs until the player exits the game or the connection drops"""
+        app_task = asyncio.create_task(self.ui.run_app())
+        engine_tasks = [
+            asyncio.create_task(self.engine.tick()),
+            asyncio.create_task(self.engine.event_parser.process_events())
+        ]
+        ui_parser_task = asyncio.create_task(self.ui.event_parser.process_events())
+        try:
+            await asyncio.wait([app_task, *engine_tasks], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.close()
+            for task in (*engine_tasks, ui_parser_task):
+                task.cancel()
+            # A dropped connection has already ended the app with EOFError
+            if self.ui.app.future and not self.ui.app.future.done():
+                self.ui.app.exit()
+            await asyncio.gather(app_task, *engine_tasks, ui_parser_task, return_exceptions=True)
+
+    def close(self) -> None:
+        if self.engine.battle_running:
+            self.engine.stop_game()
+        self.engine.stop()
+        # Already done by exit_game when the player left through the menu
+        if not self.ui.closing:
+            self.ui.closing = True
+            g.loc.unsubscribe(self.ui)
+        self.ui.broadcast_cleanup()
+
+
+class MemoryInput(PipeInput):
+    """
+    Input fed straight from the connection's data callback. prompt_toolkit's pipe input costs two
+    file descriptors per session and reads them with select(), which stops working past fd 1024
+    """
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._keys: list[KeyPress] = []
+        self._parser = Vt100Parser(self._keys.append)
+        self._callbacks: list[Callable[[], None]] = []
+        self._closed = False
+
+    def send_bytes(self, data: bytes) -> None:
+        self.send_text(self._decoder.decode(data))
+
+    def send_text(self, data: str) -> None:
+        self._parser.feed(data)
+        self._notify()
+
+    def _notify(self) -> None:
+        if self._callbacks:
+            asyncio.get_running_loop().call_soon(self._callbacks[-1])
+
+    def read_keys(self) -> list[KeyPress]:
+        keys = self._keys[:]
+        self._keys.clear()
+        return keys
+
+    def flush_keys(self) -> list[KeyPress]:
+        self._parser.flush()
+        return self.read_keys()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        # The app reads once more, sees the input closed and ends with EOFError
+        self._closed = True
+        self._notify()
+
+    def fileno(self) -> int:
+        # prompt_toolkit only asks for it to watch the input in the event loop, which attach() replaces,
+        # and in Application.run_system_command, which the game never calls
+        raise io.UnsupportedOperation("MemoryInput is fed by the telnet connection and has no file descriptor")
+
+    def typeahead_hash(self) -> str:
+        return f"memory-{id(self)}"
+
+    @contextmanager
+    def raw_mode(self) -> Iterator[None]:
+        yield
+
+    @contextmanager
+    def cooked_mode(self) -> Iterator[None]:
+        yield
+
+    @contextmanager
+    def attach(self, input_ready_callback: Callable[[], None]) -> Iterator[None]:
+        self._callbacks.append(input_ready_callback)
+        try:
+            yield
+        finally:
+            self._callbacks.remove(input_ready_callback)
+
+    @contextmanager
+    def detach(self) -> Iterator[None]:
+        callbacks = self._callbacks[:]
+        self._callbacks.clear()
+        try:
+            yield
+        finally:
+            self._callbacks[:] = callbacks
+
+
+class SessionTelnetServer:
+    """
+    Telnet listener that gives every connection a MemoryInput instead of an OS pipe.
+    prompt_toolkit's TelnetServer creates the pipe inside its private accept handler, so the listener
+    lives here and only TelnetConnection is reused, which takes the input as a constructor argument
+    """
+    def __init__(self, host: str, port: int, interact: Callable, encoding: str = "utf-8", enable_cpr: bool = True, backlog: int = 128):
+        self.host = host
+        self.port = port
+        self.interact = interact
+        self.encoding = encoding
+        self.enable_cpr = enable_cpr
+        self.backlog = backlog
+        self.connections: set[TelnetConnection] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def run(self) -> None:
+        """Serves until cancelled, then waits for the open connections to wind down"""
+        loop = asyncio.get_running_loop()
+        listen_socket = socket.create_server((self.host, self.port), backlog=self.backlog)
+        listen_socket.setblocking(False)
+        loop.add_reader(listen_socket, self._accept, listen_socket)
+        try:
+            await asyncio.Future()
+        finally:
+            loop.remove_reader(listen_socket)
+            listen_socket.close()
+            for task in self._tasks:
+                task.cancel()
+            if self._tasks:
+                await asyncio.wait(self._tasks)
+
+    def _accept(self, listen_socket: socket.socket) -> None:
+        try:
+            conn, addr = listen_socket.accept()
+        except BlockingIOError:
+            # Another wakeup took the connection already
+            return
+        conn.setblocking(True)
+        task = asyncio.get_running_loop().create_task(self._serve(conn, addr))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _serve(self, conn: socket.socket, addr) -> None:
+        connection = TelnetConnection(
+            conn, addr, self.interact, self,
+            encoding=self.encoding, style=None, vt100_input=MemoryInput(), enable_cpr=self.enable_cpr
+        )
+        self.connections.add(connection)
+        try:
+            await connection.run_application()
+        except EOFError:
+            # The client hung up
+            pass
+        finally:
+            self.connections.discard(connection)
+
+
+class GameServer:
+    def __init__(self, host: str = "127.0.0.1", telnet_port: Optional[int] = 2323, ssh_port: Optional[int] = None, ssh_host_key: Optional[str] = None, refresh_rate: Optional[float] = None, log_level: str = "INFO"):
+        self.host = host
+        self.log_level = log_level
+        # Every session redraws this often even when idle, the main cost per session. Defaults to the config value
+        self.refresh_rate = refresh_rate
+        self.telnet_port = telnet_port
+        self.ssh_port = ssh_port
+        self.ssh_host_key = ssh_host_key
+        self.sessions: set[Session] = set()
+        self._session_count = 0
+
+    async def interact(self, connection=None) -> None:
+        """Called by the telnet and SSH servers inside the connection's app session"""
+        self._session_count += 1
+        name = f"session-{self._session_count}"
+        server_logger = g.logger
+        # Active for this connection's task and every task it starts. Sessions log into the server's
+        # file, the server clears it on start, every line is tagged with the session it came from
+        # The settings files belong to the host: players start from them, but their changes stay in the session
+        create_context(self.log_level, keep_log=True, log_prefix=f"[{name}]", persist_config=False)
+        session = Session(name, self.refresh_rate)
+        self.sessions.add(session)
+        server_logger.info(f"{session.name} opened, {len(self.sessions)} active")
+        try:
+            await session.run()
+        finally:
+            self.sessions.discard(session)
+            server_logger.info(f"{session.name} closed, {len(self.sessions)} active")
+
+    async def run(self) -> None:
+        tasks = []
+        if self.telnet_port is not None:
+            # Full screen apps don't need cursor position reports, and simple clients don't answer them
+            server = SessionTelnetServer(host=self.host, port=self.telnet_port, interact=self.interact, enable_cpr=False)
+            tasks.append(server.run())
+            g.logger.info(f"Telnet server listening on {self.host}:{self.telnet_port}")
+        if self.ssh_port is not None:
+            tasks.append(self._run_ssh())
+        await asyncio.gather(*tasks)
+
+    async def _run_ssh(self) -> None:
+        # asyncssh is only needed for SSH, telnet works without it.
+        # SSH sessions still use prompt_toolkit's pipe input, so they are limited by select() to a few hundred
+        try:
+            import asyncssh
+            from prompt_toolkit.contrib.ssh import PromptToolkitSSHServer
+        except ImportError as e:
+            raise RuntimeError("SSH sessions need the asyncssh package") from e
+        if not self.ssh_host_key:
+            raise RuntimeError("SSH sessions need a host key, pass it with --ssh-host-key")
+
+        await asyncssh.create_server(
+            lambda: PromptToolkitSSHServer(lambda ssh_session: self.interact(ssh_session)),
+            self.host,
+            self.ssh_port,
+            server_host_keys=[self.ssh_host_key]
+        )
+        g.logger.info(f"SSH server listening on {self.host}:{self.ssh_port}")
+        await asyncio.Future()
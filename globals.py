@@ -1,13 +1,23 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from global_state.context import current_context, SESSION_FIELDS
+
 if TYPE_CHECKING:
     from logger.log_screen import Logger
     from config.config import Config
     from translator import LocalizationManager
     from global_state.client import Client
 
-client: Client = None
-logger: Logger = None
-config: Config = None
-loc: LocalizationManager = None
\ No newline at end of file
+    client: Client
+    logger: Logger
+    config: Config
+    loc: LocalizationManager
+
+
+def __getattr__(name: str):
+    # Resolved per session, see global_state.context. None while no context is active
+    if name in SESSION_FIELDS:
+        context = current_context()
+        return getattr(context, name) if context else None
+    raise AttributeError(f"module 'globals' has no attribute '{name}'")
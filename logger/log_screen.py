@@ -2,6 +2,7 @@ from prompt_toolkit.layout import HSplit, Window
 from prompt_toolkit.layout.controls import FormattedTextControl
 from datetime import datetime
 import inspect
+from typing import Callable, Optional
 
 from util.text_renderer import parse_text
 
@@ -12,13 +13,15 @@ import os
 class Logger:
     MAX_ENTRIES = 30
 
-    def __init__(self, level: str, keep_log=False):
-        
+    def __init__(self, level: str, keep_log=False, log_file: str = LOG_FILE, prefix: str = ""):
+        self.log_file = log_file
+        self.prefix = f"{prefix} " if prefix else "" # Tags every line, for loggers sharing a file or a process
         level = level.upper()
         self._entries: list[str] = []
         self._displayed_entries: list[str] = []
         self.write_info = True
         self.write_debug = True
+        self.on_update: Optional[Callable[[], None]] = None # Set by whoever displays the log
 
         self.log_control = FormattedTextControl(
             text=self._get_display_text()
@@ -32,7 +35,7 @@ class Logger:
 
     def clear_log_file(self):
         try:
-            open(LOG_FILE, "w", encoding="utf-8").close()
+            open(self.log_file, "w", encoding="utf-8").close()
                 
         except Exception as e:
             self.warning(f"Failed to clear log file: {e}")
@@ -57,7 +60,7 @@ class Logger:
     def _format(self, text:str, level:int) -> str:
         stack = inspect.stack()
         caller_frame = stack[2+level] #Real function, not debug, warning or info
-        return f"[{datetime.now().strftime('%H:%M:%S')}] - [{caller_frame.function}] {text}"
+        return f"{self.prefix}[{datetime.now().strftime('%H:%M:%S')}] - [{caller_frame.function}] {text}"
 
     def debug(self, text: str, level=0):
         if self.write_debug:
@@ -80,14 +83,16 @@ class Logger:
             self._displayed_entries.pop(0)
 
         self.log_control.text = self._get_display_text()
+        if self.on_update:
+            self.on_update()
 
         self._write_to_file(processed_text)
 
     def _write_to_file(self, line: str):
         try:
-            if os.path.exists(LOG_FILE) and os.path.getsize(LOG_FILE) > MAX_LOG_FILE_SIZE:
-                os.rename(LOG_FILE, LOG_FILE + ".1")  # simple rotation
-            with open(LOG_FILE, "a", encoding="utf-8") as f:
+            if os.path.exists(self.log_file) and os.path.getsize(self.log_file) > MAX_LOG_FILE_SIZE:
+                os.rename(self.log_file, self.log_file + ".1")  # simple rotation
+            with open(self.log_file, "a", encoding="utf-8") as f:
                 f.write(self._strip_formatting(line) + "\n")
         except Exception as e:
             # Avoid recursive logging
@@ -1,7 +1,8 @@
 import sys
 
 from global_state.client import Client
-import globals
 
-globals.client = Client(sys.argv)
-globals.client.launch()
+# The guard keeps spawned child processes (--engine-process) from starting another client
+if __name__ == "__main__":
+    client = Client(sys.argv)
+    client.launch()
@@ -0,0 +1,38 @@
+"""
+Serves the game to many players at once.
+Usage: python server.py [--host 127.0.0.1] [--port 2323] [--ssh-port 2222 --ssh-host-key path] [--refresh-rate fps] [--log INFO]
+Connect with `telnet 127.0.0.1 2323` or `ssh -p 2222 127.0.0.1`.
+"""
+import sys
+import asyncio
+
+from global_state.server import GameServer
+from global_state.context import create_context
+
+
+def main(argv: list[str]) -> None:
+    options = {"--host": "127.0.0.1", "--port": "2323", "--ssh-port": None, "--ssh-host-key": None, "--refresh-rate": None, "--log": "INFO"}
+    for i, arg in enumerate(argv):
+        if arg in options and i + 1 < len(argv):
+            options[arg] = argv[i + 1]
+
+    # The server's own session, every connection gets its own on top of it.
+    # Nothing changes the settings here, so they aren't written back on shutdown
+    create_context(options["--log"], keep_log="--keep-log" in argv, process_default=True, persist_config=False)
+
+    server = GameServer(
+        host=options["--host"],
+        telnet_port=int(options["--port"]),
+        ssh_port=int(options["--ssh-port"]) if options["--ssh-port"] else None,
+        log_level=options["--log"],
+        ssh_host_key=options["--ssh-host-key"],
+        refresh_rate=float(options["--refresh-rate"]) if options["--refresh-rate"] else None
+    )
+    try:
+        asyncio.run(server.run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv)
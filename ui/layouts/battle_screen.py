@@ -27,16 +27,19 @@ class BattleScreen(AbstractScreen):
         self.build_stats(heroes, enemies)
         
         self.action_title = TextItem(key="ui.actions", is_selectable=False)
+        # The rows change in place: deaths drop their row, turns swap the action list
+        self.stats_box = HSplit(self.stats_menu.get_windows())
         self.upper_frame = Frame(HSplit([
             self.title.window,
             self.separator,
-            *self.stats_menu.get_windows()
+            self.stats_box
             ]),
             title=g.loc.translate("ui.battlefield"))
-        self.battle_log = LogWindow("ui.battle_log", 10)
+        self.battle_log = LogWindow("ui.battle_log", 10, frame_rate=self.controller.refresh_rate)
         self.tooltip = TextItem(key="ui.battle_tooltip")
         self.closed_action_menu = MenuContainer([TextItem(key="ui.enemy_turn", active = False)])
         self.action_menu = self.closed_action_menu
+        self.action_box = HSplit(self.action_menu.get_windows())
         self.selecting_target = False
         self.ability_id = None
 
@@ -57,27 +60,31 @@ class BattleScreen(AbstractScreen):
                      active = ability.available,
                      handler=lambda a=ability: self.prepare_action(a),
                      container=ability) for id, ability in enumerate(abilities)])
-        self.regenerate_container()
+        self.action_box.children = self.action_menu.get_windows()
 
     def close_abilities(self):
         self.action_menu = self.closed_action_menu
-        self.regenerate_container()
-
-
-    def _regenerate_frame(self):
-        self._rebuild_stats()
-        self.upper_frame = Frame(HSplit([
-            self.title.window,
-            self.separator,
-            *self.stats_menu.get_windows()
-            ]),
-            title=g.loc.translate("ui.battlefield"))
-        
-    def _rebuild_stats(self):
-        all_items = self.heroes + self.enemies
-        all_items.insert(len(self.heroes), self.separator)
-        self.all_stats = all_items
-        self.stats_menu = MenuContainer(all_items, is_selectable=False, refreshes_index=True)
+        self.action_box.children = self.action_menu.get_windows()
+
+    def remove_entities(self, entity_ids: list[int]) -> None:
+        """Drops the rows of the given entities, the rest of the layout stays as it is"""
+        removed = []
+        for entity_id in entity_ids:
+            stat_item = self.entity_map.pop(entity_id, None)
+            if not stat_item:
+                continue
+            if stat_item in self.heroes:
+                self.heroes.remove(stat_item)
+            elif stat_item in self.enemies:
+                self.enemies.remove(stat_item)
+            removed.append(stat_item)
+        if not removed:
+            return
+        self.stats_menu.remove_items(removed)
+        windows = {id(item.window) for item in removed}
+        self.stats_box.children = [child for child in self.stats_box.children if id(child) not in windows]
+        if self.selecting_target:
+            self.stats_menu.refresh_selection()
 
     def _get_default_keybindings(self) -> NormalizedKeyBindings:
         keys = g.config.keys
@@ -86,19 +93,31 @@ class BattleScreen(AbstractScreen):
         def _(evt):
             if self.selecting_target:
                 self.stats_menu.previous()
-                self.refresh_stats()
+                self.stats_menu.refresh_selection()
             else:
                 self.action_menu.previous()
-                self.action_menu.refresh_text()
+                self.action_menu.refresh_selection()
 
         @kb.add(keys.arr_down)
         def _(evt):
             if self.selecting_target:
                 self.stats_menu.next()
-                self.refresh_stats()
+                self.stats_menu.refresh_selection()
             else:
                 self.action_menu.next()
-                self.action_menu.refresh_text()
+                self.action_menu.refresh_selection()
+
+        @kb.add(keys.scroll_up)
+        def _(evt):
+            self.battle_log.scroll_by(self.battle_log.max_entries - 1)
+
+        @kb.add(keys.scroll_down)
+        def _(evt):
+            self.battle_log.scroll_by(1 - self.battle_log.max_entries)
+
+        @kb.add(keys.scroll_end)
+        def _(evt):
+            self.battle_log.scroll_to_end()
 
         @kb.add(keys.enter_key)
         def _(evt):
@@ -130,13 +149,12 @@ class BattleScreen(AbstractScreen):
         return kb
 
     def _build_container(self) -> HSplit:
-        """Builds the layout container from the current state of its children."""
-        self._regenerate_frame()
+        """Builds the layout container once, later changes go into stats_box and action_box."""
         return HSplit([
             self.upper_frame,
             self.battle_log.window,
             self.action_title.window,
-            *self.action_menu.get_windows(),
+            self.action_box,
             self.separator,
             self.tooltip.window
         ])
@@ -178,7 +196,7 @@ class BattleScreen(AbstractScreen):
             g.logger.warning(f"Entity_id is 'None'. Are you sure this is your turn?")
             return
         g.logger.debug(f"Received entity_id {target_id} with ability id {ability_id} for {entity_id}")
-        self.controller.ui_to_engine_queue.put_nowait(PlayerActionEvent(ability_id, entity_id, target_id))
+        self.controller.send_to_engine(PlayerActionEvent(ability_id, entity_id, target_id))
         pass
 
     def cleanup(self):
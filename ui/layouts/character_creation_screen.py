@@ -41,12 +41,12 @@ class CharacterCreationScreen(AbstractScreen):
         @kb.add(keys.arr_up)
         def _(evt):
             self.menu_items.previous()
-            self.refresh_all()
+            self.menu_items.refresh_selection()
 
         @kb.add(keys.arr_down)
         def _(evt):
             self.menu_items.next()
-            self.refresh_all()
+            self.menu_items.refresh_selection()
 
         @kb.add(keys.enter_key)
         def _(evt):
@@ -62,9 +62,11 @@ class CharacterCreationScreen(AbstractScreen):
         name = self.name_selector.get_text()
         player_class_str = self.class_selector.get_option()
         player_class = self.class_map[player_class_str]
-        self.controller.ui_to_engine_queue.put_nowait(EngineResumeEvent())
+        # Registered on the UI side, the engine may live in another process
+        g.loc.add_unlocalizable("player_name", name)
+        self.controller.send_to_engine(EngineResumeEvent())
         event = GameStartEvent(name, player_class)
-        self.controller.ui_to_engine_queue.put_nowait(event)
+        self.controller.send_to_engine(event)
 
     def _build_container(self) -> HSplit:
         """Builds the layout container from the current state of its children."""
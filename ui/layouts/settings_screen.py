@@ -72,7 +72,7 @@ class SettingsScreen(AbstractScreen):
         from .title_screen import TitleScreen
         g.config.save()
         self.controller.battle_screen = None
-        self.controller.ui_to_engine_queue.put_nowait(GameStopEvent())
+        self.controller.send_to_engine(GameStopEvent())
         self.controller.broadcast_cleanup()
         self.controller.switch_screen(TitleScreen(self.controller, None))
 
@@ -98,12 +98,12 @@ class SettingsScreen(AbstractScreen):
         @kb.add(keys.arr_up)
         def _(evt):
             self.menu_items.previous()
-            self.refresh_all()
+            self.menu_items.refresh_selection()
 
         @kb.add(keys.arr_down)
         def _(evt):
             self.menu_items.next()
-            self.refresh_all()
+            self.menu_items.refresh_selection()
 
         @kb.add(keys.tab_key)
         def _(evt):
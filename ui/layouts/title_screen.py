@@ -16,7 +16,7 @@ from util import NormalizedKeyBindings
 class TitleScreen(AbstractScreen):
     def __init__(self, controller: "UiController", parent: Optional[AbstractScreen]):
         super().__init__(controller, parent)
-        self.controller.ui_to_engine_queue.put_nowait(EnginePauseEvent())
+        self.controller.send_to_engine(EnginePauseEvent())
         self.selected_index = 0
         
         
@@ -45,12 +45,12 @@ class TitleScreen(AbstractScreen):
         @kb.add(keys.arr_up)
         def _(evt):
             self.menu_items.previous()
-            self.refresh_all()
+            self.menu_items.refresh_selection()
 
         @kb.add(keys.arr_down)
         def _(evt):
             self.menu_items.next()
-            self.refresh_all()
+            self.menu_items.refresh_selection()
 
         @kb.add(keys.enter_key)
         def _(evt):
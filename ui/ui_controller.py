@@ -1,26 +1,36 @@
 from prompt_toolkit import Application
 from prompt_toolkit.layout import Layout
-from prompt_toolkit.key_binding import merge_key_bindings, DynamicKeyBindings
+from prompt_toolkit.key_binding import merge_key_bindings, DynamicKeyBindings, KeyBindingsBase
 from prompt_toolkit.filters import Condition
 from typing import Optional
+from weakref import WeakKeyDictionary
+from collections import deque
 import asyncio
+import signal
 
 from ui.layouts import TitleScreen, AbstractScreen, BattleScreen
 from .ui_event_parser import UiEventParser
 
-from events.events import EngineStopEvent
+from events.events import Event, EngineStopEvent, ReloadBlueprintsEvent
+from events.event_queue import EventQueue
 import globals as g
 from util import NormalizedKeyBindings
 
 
 class UiController:
-    def __init__(self, engine_to_ui_queue: asyncio.Queue, ui_to_engine_queue: asyncio.Queue):
+    def __init__(self, engine_to_ui_queue: EventQueue, ui_to_engine_queue: EventQueue, refresh_rate: Optional[float] = None):
         self.keybind_override = False
         self.log_displayed = False
         self.event_parser = UiEventParser(engine_to_ui_queue, self)
         self.ui_to_engine_queue = ui_to_engine_queue
+        # Events waiting for room in the bounded ui_to_engine_queue, see send_to_engine
+        self._outbox: deque[Event] = deque()
+        self._outbox_task: Optional[asyncio.Task] = None
         self.battle_screen: Optional[BattleScreen] = None
         self.closing = False
+        self.refresh_rate = refresh_rate or g.config.main.refresh_rate
+        # Screen bindings -> (key map version, global and screen bindings merged)
+        self._merged_kb: WeakKeyDictionary[KeyBindingsBase, tuple[int, KeyBindingsBase]] = WeakKeyDictionary()
 
         self.build_global_keybindings()
 
@@ -34,11 +44,23 @@ class UiController:
             key_bindings=DynamicKeyBindings(self.get_keybindings),
             full_screen=True,
             cursor=None,
-            refresh_interval=1/g.config.main.refresh_rate
+            # Nothing redraws on a timer: widgets invalidate when they change and the
+            # invalidations are coalesced into at most one frame per refresh period
+            min_redraw_interval=1 / self.refresh_rate,
+            # Resizes arrive through SIGWINCH, or NAWS and SSH window changes for remote sessions
+            terminal_size_polling_interval=None if hasattr(signal, "SIGWINCH") else 0.5
         )
-        g.logger.info(f"Window refresh rate set to {g.config.main.refresh_rate} FPS")
+        g.logger.on_update = self._log_updated
+        g.logger.info(f"Window refresh rate set to {self.refresh_rate} FPS")
         g.loc.subscribe(self, self.current_screen.refresh_all)
 
+    async def run_app(self):
+        return await self.app.run_async()
+
+    def _log_updated(self):
+        if self.log_displayed:
+            self.app.invalidate()
+
     def redraw_layout(self):
         self.layout = Layout(
             self.current_screen.container
@@ -54,12 +76,42 @@ class UiController:
     def exit_game(self):
         self.closing = True
         g.loc.unsubscribe(self)
-        self.ui_to_engine_queue.put_nowait(EngineStopEvent())
+        g.logger.on_update = None
+        self.send_to_engine(EngineStopEvent())
+
+    def send_to_engine(self, event: Event) -> None:
+        """
+        Key handlers can't wait, but the queue to the engine is bounded. Events go straight in while
+        there's room, otherwise they wait in the outbox for a free slot. Nothing is dropped and the
+        engine gets everything in the order it was sent, EngineStopEvent included.
+        """
+        if not self._outbox and not self.ui_to_engine_queue.full():
+            self.ui_to_engine_queue.put_nowait(event)
+            return
+        self._outbox.append(event)
+        if self._outbox_task is None or self._outbox_task.done():
+            self._outbox_task = asyncio.get_running_loop().create_task(self._flush_outbox())
+
+    async def _flush_outbox(self) -> None:
+        while self._outbox:
+            await self.ui_to_engine_queue.put(self._outbox[0])
+            # Only dropped once it's in, send_to_engine keeps queueing behind it until then
+            self._outbox.popleft()
 
     def get_keybindings(self):
-        
-        kb = self.global_kb if self.log_displayed else merge_key_bindings([self.global_kb, self.current_screen.get_keybindings()])
-        return kb
+        """
+        Called by DynamicKeyBindings several times per key press. A new merged set would also
+        have a new identity and throw away prompt_toolkit's binding caches, so they're kept
+        until the screen swaps its bindings or the keys are rebound.
+        """
+        if self.log_displayed:
+            return self.global_kb
+        screen_kb = self.current_screen.get_keybindings()
+        version = g.config.keys.version
+        cached = self._merged_kb.get(screen_kb)
+        if cached is None or cached[0] != version:
+            cached = self._merged_kb[screen_kb] = (version, merge_key_bindings([self.global_kb, screen_kb]))
+        return cached[1]
     
     def build_global_keybindings(self):
         """
@@ -67,11 +119,16 @@ class UiController:
         This ensures that any changes to keybinds are applied.
         """
         self.global_kb = NormalizedKeyBindings()
+        self._merged_kb.clear()
 
         @self.global_kb.add(g.config.keys.log_key, filter=Condition(lambda: not self.keybind_override))
         def _(event):
             self.toggle_log()
 
+        @self.global_kb.add(g.config.keys.reload_key, filter=Condition(lambda: not self.keybind_override))
+        def _(event):
+            self.send_to_engine(ReloadBlueprintsEvent())
+
     def toggle_log(self):
         self.log_displayed = not self.log_displayed
         self.layout.container = g.logger.container if self.log_displayed else self.current_screen.container
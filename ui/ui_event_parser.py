@@ -2,9 +2,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from events.events import StartBattleEvent, StatsChangeEvent, BattleLogEvent, StartPlayerTurnEvent, EndPlayerTurnEvent, EntityDeathEvent, ApplicationExitEvent
+from events.event_bus import EventBus
+from events.event_queue import EventQueue
 from .layouts.battle_screen import BattleScreen
 
 from .widgets.stats_item import StatsItem
+from global_state.consts import LOG_BACKLOG_LIMIT
 
 import globals as g
 
@@ -13,49 +16,52 @@ if TYPE_CHECKING:
     from .ui_controller import UiController
 
 class UiEventParser:
-    def __init__(self, engine_to_ui_queue: asyncio.Queue, controller: UiController):
+    def __init__(self, engine_to_ui_queue: EventQueue, controller: UiController):
         self.engine_to_ui_queue = engine_to_ui_queue
         self.controller = controller
+        self.bus = EventBus(default_handler=lambda event: g.logger.warning(f"Unknown event: {event}"), metrics=engine_to_ui_queue.metrics)
+        self.bus.subscribe(StartBattleEvent, self.start_battle)
+        self.bus.subscribe_batch(StatsChangeEvent, self.replace_entities)
+        self.bus.subscribe(StartPlayerTurnEvent, self.start_player_turn)
+        self.bus.subscribe(EndPlayerTurnEvent, lambda event: self.end_player_turn())
+        self.bus.subscribe(BattleLogEvent, self.add_battle_log)
+        self.bus.subscribe_batch(EntityDeathEvent, self.handle_deaths)
+        self.bus.subscribe(ApplicationExitEvent, lambda event: self.controller.exit_game())
 
     async def process_events(self):
         while not self.controller.closing:
-            event = await self.engine_to_ui_queue.get()
-            match event:
-                case StartBattleEvent():
-                    self.start_battle(event)
-                case StatsChangeEvent():
-                    self.replace_entities(event)
-                case StartPlayerTurnEvent():
-                    self.start_player_turn(event)
-                case EndPlayerTurnEvent():
-                    self.end_player_turn()
-                case BattleLogEvent():
-                    self.add_battle_log(event)
-                case EntityDeathEvent():
-                    self.handle_death(event.entity_id)
-                case ApplicationExitEvent():
-                    self.controller.exit_game()
-                case _:
-                    g.logger.warning(f"Unknown event: {event}")
-
-            
-
+            # Stop taking events while the typewriter is behind, the bounded queue then holds the engine back
+            screen = self.controller.battle_screen
+            if isinstance(screen, BattleScreen):
+                if self.bus.metrics:
+                    self.bus.metrics.set_depth("battle_log", screen.battle_log.backlog())
+                await screen.battle_log.wait_for_backlog(LOG_BACKLOG_LIMIT)
+            event_list = [await self.engine_to_ui_queue.get()]
+            while not self.engine_to_ui_queue.empty():
+                event_list.append(self.engine_to_ui_queue.get_nowait())
+            self.bus.dispatch_many(event_list)
+            self.controller.app.invalidate()
 
     def start_battle(self, event:StartBattleEvent):
         screen = BattleScreen(self.controller, self.controller.current_screen, event.heroes, event.enemies)
         self.controller.battle_screen = screen
         self.controller.switch_screen(screen)
 
-    def replace_entities(self, event:StatsChangeEvent):
+    def replace_entities(self, event_list: list[StatsChangeEvent]):
+        """Applies a run of stat changes, then re-renders the rows whose stats actually changed"""
         screen = self.controller.battle_screen
         if not isinstance(screen, BattleScreen):
             g.logger.warning("Tried to give entity stats while not on battle screen, skipping")
             return
-        for entity in event.entities:
-            g.logger.debug(f"Changing stats for {entity} with entity id {entity.entity_id}")
-            stat_item: StatsItem = screen.entity_map[entity.entity_id]
-            stat_item.entity = entity
-        screen.refresh_stats()
+        changed: dict[int, StatsItem] = {}
+        for event in event_list:
+            for entity in event.entities:
+                stat_item: StatsItem = screen.entity_map[entity.entity_id]
+                if stat_item.update_entity(entity):
+                    g.logger.debug(f"Changing stats for {entity} with entity id {entity.entity_id}")
+                    changed[entity.entity_id] = stat_item
+        if changed:
+            screen.stats_menu.refresh_items(changed.values())
 
     def start_player_turn(self, event:StartPlayerTurnEvent):
         screen = self.controller.battle_screen
@@ -78,24 +84,16 @@ class UiEventParser:
         if not isinstance(screen, BattleScreen):
             g.logger.warning("Tried to append battle log while not on battle screen, skipping")
             return
-        asyncio.create_task(screen.battle_log.log(event))
+        screen.battle_log.log_nowait(event)
 
 
-    def handle_death(self, entity_id):
+    def handle_deaths(self, event_list: list[EntityDeathEvent]):
+        """Removes the rows of a run of deaths in one go"""
         screen = self.controller.battle_screen
         if not isinstance(screen, BattleScreen):
             g.logger.warning("Tried to process death event while not on battle screen, skipping")
             return
-        stat_item = screen.entity_map.get(entity_id)
-        if not stat_item:
-            return
-        if stat_item in screen.heroes:
-            screen.heroes.remove(stat_item)
-        elif stat_item in screen.enemies:
-            screen.enemies.remove(stat_item)
-        del screen.entity_map[entity_id]
-        
-        screen.regenerate_container()
+        screen.remove_entities([event.entity_id for event in event_list])
 
             
 
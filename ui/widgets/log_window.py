@@ -1,42 +1,100 @@
 
-from prompt_toolkit.layout import HSplit, FormattedTextControl, Window
+from prompt_toolkit.layout import FormattedTextControl, Window
 from prompt_toolkit.application import get_app
 from prompt_toolkit.widgets import Frame
-from prompt_toolkit.formatted_text import to_formatted_text, FormattedText
+from prompt_toolkit.formatted_text import to_formatted_text, StyleAndTextTuples
+from bisect import bisect_right
 from collections import deque
 from dataclasses import dataclass
-from typing import List
+from itertools import accumulate
+from typing import Callable, List, Optional, Union
 import asyncio
+import time
 
 from events.events import BattleLogEvent, RefreshLogEvent
 from util import parse_text
+from util.text_renderer import key_cache_token
+from util.ring_buffer import RingBuffer
+from global_state.consts import BATTLE_LOG_HISTORY
 
 import globals as g
 
+class RevealedText:
+    """
+    Text for a FormattedTextControl that shows the first `shown` characters of pre-parsed fragments.
+    Revealing more only moves the cut, nothing is rebuilt per character.
+    """
+    __slots__ = ("fragments", "ends", "length", "shown", "_visible")
+
+    def __init__(self, fragments: StyleAndTextTuples):
+        self.fragments = fragments
+        self.ends = list(accumulate(len(fragment[1]) for fragment in fragments))
+        self.length = self.ends[-1] if self.ends else 0
+        self.shown = 0
+        self._visible: tuple[int, StyleAndTextTuples] = (0, [])
+
+    def reveal(self, amount: int) -> None:
+        self.shown = min(self.length, self.shown + amount)
+
+    def __call__(self) -> StyleAndTextTuples:
+        shown, visible = self._visible
+        if shown != self.shown:
+            # Whole fragments before the cut, then whatever part of the cut one is visible
+            index = bisect_right(self.ends, self.shown)
+            visible = self.fragments[:index]
+            start = self.ends[index - 1] if index else 0
+            if index < len(self.fragments) and self.shown > start:
+                style, text = self.fragments[index][:2]
+                visible.append((style, text[:self.shown - start]))
+            self._visible = (self.shown, visible)
+        return visible
+
+
 @dataclass
 class LogWindow:
+    """
+    A log window showing `max_entries` lines of a scrollable history.
+
+    The history only keeps the log events, lines are rendered for the visible slice alone and
+    drawn by a single control, so neither memory per entry nor the cost of a frame depends on
+    how long the history is.
+    """
     title_key: str
-    max_entries: int
+    max_entries: int # Lines on screen, the history behind them is history_size long
     placeholder_text: str = "ui.empty"
     typewriter_delay: float = 0.05
     fast_typeriter_delay: float = 0.005
-    """
-    A simple log window that displays the last `max_entries` log messages.
-    """
+    pause_after: float = 0.5 # Time to read the entry before the next one starts
+    frame_rate: Optional[float] = None
+    history_size: int = BATTLE_LOG_HISTORY
+
     def __post_init__(self):
-        # initialize control + window
-        localized_placeholder_text = g.loc.translate(self.placeholder_text)
-        self.logs:deque[BattleLogEvent] = deque(maxlen=self.max_entries)
-        self.controls = [FormattedTextControl(text=localized_placeholder_text, focusable=False) for _ in range(self.max_entries)]
-        self.log_windows = [Window(content=control, height=1, cursorline=False, always_hide_cursor=True) for control in self.controls]
-        self.window = Frame(HSplit(self.log_windows), title=g.loc.translate(self.title_key))
+        self.frame_rate = self.frame_rate or g.config.main.refresh_rate
+        self.logs: RingBuffer[BattleLogEvent] = RingBuffer(self.history_size)
+        self.scroll = 0 # Entries below the view, 0 follows new ones
+        self.control = FormattedTextControl(text=self._get_text, focusable=False)
+        self.window = Frame(
+            Window(content=self.control, height=self.max_entries, wrap_lines=False, always_hide_cursor=True),
+            title=g.loc.translate(self.title_key)
+        )
         self.writing = False
+        # Rendered lines of the view, oldest first, and the newest entry while it's typewritten
+        self._lines: deque[StyleAndTextTuples] = deque(maxlen=self.max_entries)
+        self._typing: Union[StyleAndTextTuples, Callable[[], StyleAndTextTuples], None] = None
+        self._placeholder: StyleAndTextTuples = []
+        self._key_token = None
+        self._written = asyncio.Event()
+        self._written.set()
         self._log_queue: asyncio.Queue[BattleLogEvent] = asyncio.Queue()
+        self._consumed = asyncio.Event()
         self._log_task = asyncio.create_task(self._process_log_queue())
 
     async def accept_new_log(self, event_list: List[BattleLogEvent]):
-        self.logs:deque[BattleLogEvent] = deque(event_list, max_len=self.max_entries)
-        self.refresh_log()
+        self.logs = RingBuffer(self.history_size)
+        for event in event_list:
+            self.logs.append(event)
+        self.scroll = 0
+        await self._update_log()
 
     async def log(self, event: BattleLogEvent) -> None:
         """
@@ -44,6 +102,30 @@ class LogWindow:
         """
         await self._log_queue.put(event)
 
+    def log_nowait(self, event: BattleLogEvent) -> None:
+        self._log_queue.put_nowait(event)
+
+    def backlog(self) -> int:
+        return self._log_queue.qsize()
+
+    async def wait_for_backlog(self, limit: int) -> None:
+        """Waits until fewer than `limit` entries are left for the typewriter"""
+        while self._log_queue.qsize() >= limit and not self._log_task.done():
+            self._consumed.clear()
+            await self._consumed.wait()
+
+    def scroll_by(self, amount: int) -> None:
+        """Moves the view `amount` entries back in the history, negative amounts move towards the end"""
+        scroll = min(max(self.scroll + amount, 0), max(len(self.logs) - self.max_entries, 0))
+        if scroll == self.scroll:
+            return
+        self.scroll = scroll
+        self._render_view()
+        get_app().invalidate()
+
+    def scroll_to_end(self) -> None:
+        self.scroll_by(-self.scroll)
+
     async def _process_log_queue(self) -> None:
         """
         Continuously processes log events one by one.
@@ -55,106 +137,104 @@ class LogWindow:
                     self.logs.append(event)
                     await self._update_log(write_new=True)
                 elif isinstance(event, RefreshLogEvent):
-                    self.window.title = g.loc.translate(self.title_key)
                     await self._update_log()
             except Exception as e:
                 g.logger.warning(f"Error while processing log event: {e}")
             finally:
                 self._log_queue.task_done()
+                self._consumed.set()
 
     async def _update_log(self, write_new: bool = False) -> None:
-        while self.writing:
-            await asyncio.sleep(0.1)
-
-        # --- Step 1: Clear all controls for a clean slate ---
-        localized_placeholder_text = g.loc.translate(self.placeholder_text)
-        for control in self.controls:
-            control.text = parse_text(localized_placeholder_text)
-
-        # --- Step 2: Determine which logs and controls to update instantly ---
-        
-        # The total number of logs we will have on screen
-        total_logs_to_display = len(self.logs)
-        
-        # The UI control index where the first log should appear
-        start_render_index = self.max_entries - total_logs_to_display
-        
-        # The list of logs that will be rendered instantly (not typewritten)
-        entries_to_render_instantly = list(self.logs)
-        if write_new:
-            # If writing a new one, don't include the very last log in the instant render
-            entries_to_render_instantly = entries_to_render_instantly[:-1]
-
-        # --- Step 3: Render the instant logs in the correct position ---
-        
-        # The slice of controls that corresponds to the instant-render logs
-        # It starts at the calculated start_render_index and has a length
-        # equal to the number of logs we're rendering instantly.
-        num_instant_logs = len(entries_to_render_instantly)
-        instant_controls_slice = self.controls[start_render_index : start_render_index + num_instant_logs]
-        
-        # Create the message texts for these logs
-        messages = [parse_text(g.loc.translate(entry.message_key), format_template=entry.data_dict) for entry in entries_to_render_instantly]
-        
-        # Zip and update the controls
-        for control, message in zip(instant_controls_slice, messages):
-            control.text = message
-            
-        get_app().invalidate()
+        await self._written.wait()
+
+        # Rendered lines are kept until the language (RefreshLogEvent) or the key bindings change,
+        # a new entry only renders itself and scrolls the others up
+        key_token = key_cache_token()
+        if write_new and self.scroll:
+            # Scrolled back, the view stays on the same entries
+            self.scroll = min(self.scroll + 1, max(len(self.logs) - self.max_entries, 0))
+            if key_token != self._key_token:
+                self._render_view()
+            else:
+                self._update_title()
+        elif not write_new or key_token != self._key_token:
+            self._render_view()
+        elif self.logs:
+            self._lines.append(self._render(self.logs[-1]))
 
-        # --- Step 4: If there's a new log, typewrite it into the last position ---
         if write_new and self.logs:
-            # The last control is always at index -1
-            last_control = self.controls[-1]
-            await self._typewrite(self.logs[-1], last_control)
-
-    
-
-    async def _typewrite(
-        self,
-        event: BattleLogEvent,
-        control: FormattedTextControl
-    ) -> None:
+            # Typewritten instead of shown at once, the pacing holds even while scrolled back
+            await self._typewrite(self._render(self.logs[-1]) if self.scroll else self._lines[-1])
+        else:
+            get_app().invalidate()
+
+    def _render_view(self) -> None:
+        self._key_token = key_cache_token()
+        self._placeholder = to_formatted_text(parse_text(g.loc.translate(self.placeholder_text)))
+        end = len(self.logs) - self.scroll
+        self._lines = deque((self._render(entry) for entry in self.logs.slice(end - self.max_entries, end)), maxlen=self.max_entries)
+        self._update_title()
+
+    def _update_title(self) -> None:
+        title = g.loc.translate(self.title_key)
+        self.window.title = f"{title} (-{self.scroll})" if self.scroll else title
+
+    def _render(self, entry: BattleLogEvent) -> StyleAndTextTuples:
+        return to_formatted_text(parse_text(g.loc.translate(entry.message_key), format_template=entry.data_dict))
+
+    def _get_text(self) -> StyleAndTextTuples:
+        """The view's lines, newest at the bottom and placeholders filling the top"""
+        lines = list(self._lines)
+        if self._typing is not None and not self.scroll and lines:
+            lines[-1] = to_formatted_text(self._typing)
+        text: StyleAndTextTuples = []
+        for _ in range(self.max_entries - len(lines)):
+            text.extend(self._placeholder)
+            text.append(("", "\n"))
+        for line in lines:
+            text.extend(line)
+            text.append(("", "\n"))
+        return text[:-1]
+
+    async def _typewrite(self, fragments: StyleAndTextTuples) -> None:
         """
-        Writes the content of an ANSI object to a FormattedTextControl
-        with a typewriter effect.
-
-        Args:
-            ansi_object: The ANSI object containing the styled text to write.
-            control: The FormattedTextControl to write to.
-            delay: The time in seconds to wait between each character.
-            clear_before_start: If True, clears the control's text before starting.
+        Reveals the newest entry with a typewriter effect.
+
+        Runs once per frame and shows as many new characters as the time since the last frame
+        allows, so there's at most one redraw per frame no matter how fast the text goes.
         """
         self.writing = True
+        self._written.clear()
         app = get_app()
-        localized_str = g.loc.translate(event.message_key)
-        ansi_object = parse_text(localized_str, format_template=event.data_dict)
-
-        current_output_parts: list[tuple[str, str]] = []
+        text = RevealedText(fragments)
 
-        control.text = FormattedText([]) # Clear the control
+        self._typing = text
         app.invalidate()
-        self.writing = True
-        await asyncio.sleep(0.01) # Small delay for initial clear to render
-
-        # CORRECTED LINE: Use to_formatted_text to get the iterable FormattedText object
-        parsed_formatted_text = to_formatted_text(ansi_object)
-        for style, text_segment in parsed_formatted_text:
-            for char in text_segment:
-                current_output_parts.append((style, char))
-                control.text = FormattedText(current_output_parts)
-                app.invalidate() # Force a redraw of the UI
-                await asyncio.sleep(self.typewriter_delay if not self._log_queue.qsize() > 0 else self.fast_typeriter_delay)
-        await asyncio.sleep(0.5)
-
-        # Optional: ensure the final text is set exactly from the ANSI object
-        # This also works correctly with parsed_formatted_text as it's a FormattedText object.
-        control.text = parsed_formatted_text
+
+        frame = 1 / self.frame_rate
+        progress = 0.0
+        last_frame = time.perf_counter()
+        while text.shown < text.length:
+            await asyncio.sleep(frame)
+            now = time.perf_counter()
+            # Speeds up while more entries are waiting
+            progress += (now - last_frame) / (self.typewriter_delay if not self._log_queue.qsize() > 0 else self.fast_typeriter_delay)
+            last_frame = now
+            if progress >= 1:
+                text.reveal(int(progress))
+                progress -= int(progress)
+                if not self.scroll:
+                    app.invalidate()
+        await asyncio.sleep(self.pause_after)
+
+        self._typing = None
         app.invalidate()
         self.writing = False
+        self._written.set()
 
     def cleanup(self):
         """Cancels the background processing task."""
         if self._log_task and not self._log_task.done():
             self._log_task.cancel()
-            g.logger.debug("LogWindow's background task cancelled.")
\ No newline at end of file
+            self._consumed.set() # Nothing is going to drain the backlog anymore
+            g.logger.debug("LogWindow's background task cancelled.")
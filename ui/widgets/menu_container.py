@@ -1,6 +1,6 @@
 
 from dataclasses import dataclass
-from typing import Optional, Any, Union, Callable
+from typing import Optional, Any, Union, Callable, Iterable
 from .text_item import TextItem
 from prompt_toolkit.layout import Window
 
@@ -17,6 +17,7 @@ class MenuContainer:
             self.selected_index = self._find_next_interactive(-1, 1)
         except StopIteration:
             self.selected_index = 0
+        self._drawn_selection: Optional[TextItem] = None # The row last rendered as selected
         self.selectable = self.is_selectable
 
     def _find_next_interactive(self, start, direction=1):
@@ -45,6 +46,19 @@ class MenuContainer:
         self._selectable = val
         self.refresh_text()
 
+    def remove_items(self, items: list[TextItem]) -> None:
+        """Takes the items out in place, the selection stays on the same item when it's still there"""
+        current = self.items[self.selected_index] if self.items else None
+        removed = {id(item) for item in items}
+        self.items[:] = [item for item in self.items if id(item) not in removed]
+        if current is not None and id(current) not in removed:
+            self.selected_index = next(i for i, item in enumerate(self.items) if item is current)
+            return
+        try:
+            self.selected_index = self._find_next_interactive(-1, 1)
+        except StopIteration:
+            self.selected_index = 0
+
     def next(self):
         self.selected_index = self._find_next_interactive(self.selected_index, 1)
 
@@ -52,9 +66,28 @@ class MenuContainer:
         self.selected_index = self._find_next_interactive(self.selected_index, -1)
 
     def refresh_text(self):
+        """Renders every row, for when the language or what the rows show has changed"""
         for i, item in enumerate(self.items):
             if isinstance(item, TextItem):
                 item.refresh_text(i == self.selected_index and self.selectable)
+        self._drawn_selection = self.get_current_item() if self.selectable else None
+
+    def refresh_items(self, items: Iterable[TextItem]):
+        """Renders just the given rows, for when only what they show has changed"""
+        current = self.get_current_item() if self.selectable else None
+        for item in items:
+            item.refresh_text(item is current)
+
+    def refresh_selection(self):
+        """Renders only the rows the selection left and moved to since the last refresh"""
+        current = self.get_current_item() if self.selectable else None
+        if current is self._drawn_selection:
+            return
+        if self._drawn_selection is not None:
+            self._drawn_selection.refresh_text(False)
+        if current is not None:
+            current.refresh_text(True)
+        self._drawn_selection = current
 
     def toggle_input(self, value: bool):
         self.enable_input = value
@@ -63,6 +96,8 @@ class MenuContainer:
                 item.active = value
 
     def get_current_item(self) -> Optional[TextItem]:
+        if not self.items:
+            return None
         item = self.items[self.selected_index]
         return item if isinstance(item, TextItem) else None
 
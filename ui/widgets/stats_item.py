@@ -16,11 +16,25 @@ class StatsItem(MenuItem):
         # Need to call parent's __post_init__ to initialize control & window
         super().__post_init__()
         self.handler = self.return_entity_id
+        self._name: tuple[str, str, str] = ("", "", "") # Language, entity key, translated name
         self.template_dict: dict = self._update_dict_info()
 
+    def update_entity(self, entity: EntityContainer) -> bool:
+        """Takes the entity's new stats, returns whether anything the row shows has changed"""
+        if entity == self.entity:
+            return False
+        self.entity = entity
+        return True
+
+    def _get_name(self) -> str:
+        language = g.loc.current_lang
+        if self._name[0] != language or self._name[1] != self.entity.key:
+            self._name = (language, self.entity.key, g.loc.translate(self.entity.key))
+        return self._name[2]
+
     def _update_dict_info(self):
         return {
-            "NAME": g.loc.translate(self.entity.key),
+            "NAME": self._get_name(),
             "HP": self.entity.health,
             "MAX_HP": self.entity.max_health,
             "AP": self.entity.ap,
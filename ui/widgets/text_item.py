@@ -4,6 +4,7 @@ from typing import Callable
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.layout import Window, WindowAlign
 from prompt_toolkit.layout.dimension import D
+from prompt_toolkit.application import get_app
 
 from util import parse_text
 import asyncio
@@ -71,5 +72,7 @@ class TextItem:
             self.key = new_key
             await asyncio.sleep(delay)
             self.key = old_key
+            # Nothing else may be redrawing by now
+            get_app().invalidate()
         old_key = self.key
         asyncio.create_task(_temp_key(old_key, new_key, time_amount))
\ No newline at end of file
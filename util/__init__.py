@@ -1,5 +1,6 @@
 from .key_mapper import NormalizedKeyBindings, CYRILLIC_TO_LATIN, QWERTY_CYRILLIC_MAP
 from .text_renderer import parse_text, get_len
-from .key_wrapper import wrap_key
+from .key_wrapper import wrap_key, LocKey
+from .alias_sampler import AliasSampler, OverrideSampler
 
-__all__ = ["NormalizedKeyBindings", "CYRILLIC_TO_LATIN", "QWERTY_CYRILLIC_MAP", "parse_text", "get_len", "wrap_key"]
\ No newline at end of file
+__all__ = ["NormalizedKeyBindings", "CYRILLIC_TO_LATIN", "QWERTY_CYRILLIC_MAP", "parse_text", "get_len", "wrap_key", "LocKey", "AliasSampler", "OverrideSampler"]
\ No newline at end of file
@@ -0,0 +1,113 @@
+from random import random
+from typing import Generic, TypeVar, Hashable, Optional, Sequence, Mapping
+
+T = TypeVar("T", bound=Hashable)
+
+
+class AliasSampler(Generic[T]):
+    """
+    Walker/Vose alias table. Building is O(n), every weighted draw is O(1).
+    Items with zero weight are never drawn.
+    """
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if len(items) != len(weights):
+            raise ValueError(f"Got {len(items)} items but {len(weights)} weights")
+        if any(w < 0 for w in weights):
+            raise ValueError("Weights can't be negative")
+        self.items: list[T] = list(items)
+        self.weights: list[float] = [float(w) for w in weights]
+        self.index: dict[T, int] = {item: i for i, item in enumerate(self.items)}
+        self.total: float = sum(self.weights)
+        self._prob: list[float] = []
+        self._alias: list[int] = []
+        self._build()
+
+    def _build(self) -> None:
+        n = len(self.items)
+        self._prob = [0.0] * n
+        self._alias = list(range(n))
+        if not n or self.total <= 0:
+            return
+
+        scaled = [w * n / self.total for w in self.weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large[-1]
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            if scaled[l] < 1.0:
+                small.append(large.pop())
+
+        # Leftovers are only rounding noise, they keep their own column
+        heaviest = max(range(n), key=self.weights.__getitem__)
+        for i in large + small:
+            if self.weights[i] > 0:
+                self._prob[i] = 1.0
+            else:
+                self._alias[i] = heaviest
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self) -> T:
+        if self.total <= 0:
+            raise ValueError("Unable to sample, all weights are zero")
+        column = int(random() * len(self._prob))
+        if random() < self._prob[column]:
+            return self.items[column]
+        return self.items[self._alias[column]]
+
+    def sample_many(self, amount: int) -> list[T]:
+        return [self.sample() for _ in range(amount)]
+
+    def with_overrides(self, overrides: Mapping[T, float]) -> "OverrideSampler[T]":
+        """
+        Returns a view that draws with some weights replaced, e.g. for a biome or tier.
+        Costs O(len(overrides)), the base table is reused as is.
+        """
+        return OverrideSampler(self, overrides)
+
+
+class OverrideSampler(Generic[T]):
+    """
+    Mixture of the untouched part of a base AliasSampler and a small table of overridden items.
+    Draws from the base table are rejected when they hit an overridden item.
+    """
+    # Below this share of untouched base weight, rejection gets slow and a full table is built instead
+    MIN_BASE_SHARE = 0.25
+
+    def __init__(self, base: AliasSampler[T], overrides: Mapping[T, float]):
+        unknown = [item for item in overrides if item not in base.index]
+        if unknown:
+            raise KeyError(f"Overridden items {unknown} are not in the base sampler")
+        self.base = base
+        self.overridden: frozenset = frozenset(overrides)
+        self.override_sampler = AliasSampler(list(overrides), list(overrides.values()))
+
+        replaced_weight = sum(base.weights[base.index[item]] for item in overrides)
+        self.base_weight = max(0.0, base.total - replaced_weight)
+        self.total = self.base_weight + self.override_sampler.total
+
+        self._fallback: Optional[AliasSampler[T]] = None
+        if base.total > 0 and self.base_weight / base.total < self.MIN_BASE_SHARE:
+            weights = [overrides.get(item, w) for item, w in zip(base.items, base.weights)]
+            self._fallback = AliasSampler(base.items, weights)
+
+    def sample(self) -> T:
+        if self.total <= 0:
+            raise ValueError("Unable to sample, all weights are zero")
+        if self._fallback is not None:
+            return self._fallback.sample()
+        if random() * self.total < self.override_sampler.total:
+            return self.override_sampler.sample()
+        while True:
+            item = self.base.sample()
+            if item not in self.overridden:
+                return item
+
+    def sample_many(self, amount: int) -> list[T]:
+        return [self.sample() for _ in range(amount)]
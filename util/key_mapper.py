@@ -15,9 +15,9 @@ class NormalizedKeyBindings(KeyBindings):
     def add(self, *keys, **kwargs):
         norm_keys = set(keys)
         for key in keys:
-            for cyr, lat in CYRILLIC_TO_LATIN.items():
-                if key == lat:
-                    norm_keys.add(cyr)
+            # The same physical key on a Russian layout
+            if key in QWERTY_CYRILLIC_MAP:
+                norm_keys.add(QWERTY_CYRILLIC_MAP[key])
         def decorator(handler):
             for k in norm_keys:
                 KeyBindings.add(self, k, **kwargs)(handler)  # ✅ Use class name
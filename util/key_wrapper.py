@@ -1,5 +1,27 @@
 import globals as g
 from typing import Callable
 
+
+class LocKey:
+    """Deferred translation of a localization key, resolved when the text gets rendered.
+    Unlike a lambda it can be compared and sent to another process"""
+    __slots__ = ("key",)
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def __call__(self) -> str:
+        return g.loc.translate(self.key)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, LocKey) and other.key == self.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"LocKey({self.key!r})"
+
+
 def wrap_key(loc_key: str) -> Callable:
-    return lambda key=loc_key: g.loc.translate(key)
\ No newline at end of file
+    return LocKey(loc_key)
@@ -0,0 +1,50 @@
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class RingBuffer(Generic[T]):
+    """
+    Append-only buffer that keeps the newest `capacity` items, the oldest ones are overwritten.
+    Indexed oldest first in O(1), unlike a deque which walks its blocks to reach the middle.
+    """
+    __slots__ = ("capacity", "_items", "_start")
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"RingBuffer capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._items: list[T] = []
+        self._start = 0 # Slot of the oldest item once the buffer is full
+
+    def append(self, item: T) -> None:
+        if len(self._items) < self.capacity:
+            self._items.append(item)
+        else:
+            self._items[self._start] = item
+            self._start = (self._start + 1) % self.capacity
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> T:
+        size = len(self._items)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("RingBuffer index out of range")
+        return self._items[(self._start + index) % size]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.slice(0, len(self._items)))
+
+    def slice(self, start: int, stop: int) -> list[T]:
+        """Items from start to stop, oldest first, at most two list slices"""
+        size = len(self._items)
+        start, stop = max(start, 0), min(stop, size)
+        if start >= stop:
+            return []
+        first, last = (self._start + start) % size, (self._start + stop) % size
+        if first < last:
+            return self._items[first:last]
+        return self._items[first:] + self._items[:last]
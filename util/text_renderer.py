@@ -1,17 +1,22 @@
-from prompt_toolkit import ANSI
-
+import re
+from functools import lru_cache
+from itertools import count
 from typing import Optional, Dict
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+from prompt_toolkit.formatted_text import FormattedText
 
 import globals as g
 
-COLORS = {
-    "[reset]": "\033[0m",
-    "[red]": "\033[31m",
-    "[green]": "\033[32m",
-    "[yellow]": "\033[33m",
-    "[blue]": "\033[34m",
-    "[bold]": "\033[1m",
-    "[underline]": "\033[4m",
+# Markup tag -> what it changes in the current style, None resets everything
+STYLE_TAGS = {
+    "reset": None,
+    "red": ("color", "ansired"),
+    "green": ("color", "ansigreen"),
+    "yellow": ("color", "ansiyellow"),
+    "blue": ("color", "ansiblue"),
+    "bold": ("bold", "bold"),
+    "underline": ("underline", "underline"),
     }
 
 KEY_ALIAS = {
@@ -24,35 +29,112 @@ KEY_ALIAS = {
     # Add more if needed
 }
 
-_cached_keys = None
+RENDER_CACHE_SIZE = 4096
+
+_TAG = re.compile(r"\[([a-z_]+)\]")
+
+
+class _KeyTable:
+    """Display names of one session's key bindings, the version changes on every rebind"""
+    __slots__ = ("version", "values", "__weakref__")
+
+    def __init__(self, version: int, values: dict[str, str]):
+        self.version = version
+        self.values = values
+
+
+# Every session has its own key config
+_cached_keys: WeakKeyDictionary = WeakKeyDictionary()
+_key_tables: WeakValueDictionary[int, _KeyTable] = WeakValueDictionary()
+_versions = count(1)
+
+def invalidate_key_cache(keys=None):
+    if keys is None:
+        _cached_keys.clear()
+    else:
+        _cached_keys.pop(keys, None)
 
-def invalidate_key_cache():
-    global _cached_keys
-    _cached_keys = None
+def _key_table(keys) -> _KeyTable:
+    table = _cached_keys.get(keys)
+    if table is None:
+        values = {key_tag: KEY_ALIAS.get(key_val.lower(), key_val).upper() for key_tag, key_val in keys.get_all_values().items()}
+        table = _cached_keys[keys] = _KeyTable(next(_versions), values)
+        _key_tables[table.version] = table
+    return table
+
+def key_cache_token() -> Optional[int]:
+    """Changes whenever the session's key bindings do, for widgets keeping rendered text around"""
+    config = g.config
+    return _key_table(config.keys).version if config is not None else None
 
 def get_len(raw_text, extra_offset=0):
     return parse_text(raw_text, extra_offset, get_len=True)
 
 def parse_text(raw_text: str, extra_offset=0, get_len=False, format_template: Optional[Dict] = None, prefix=""):
-    global _cached_keys
-    if format_template:
+    """
+    Turns markup like "[red]Press [log_key][reset]" into prompt_toolkit fragments. Results are
+    cached on the text, the resolved template values and the key bindings they were made with.
+    The returned FormattedText is shared between callers, don't modify it.
+    """
+    resolved = tuple((k, v() if callable(v) else v) for k, v in format_template.items()) if format_template else ()
+    config = g.config
+    key_version = _key_table(config.keys).version if config is not None else 0
+    try:
+        fragments = _render(raw_text, resolved, key_version, extra_offset)
+    except TypeError:
+        # Unhashable template values, nothing to cache on
+        fragments = _render.__wrapped__(raw_text, resolved, key_version, extra_offset)
+    if get_len:
+        return sum(len(text) for _, text in fragments)
+    if prefix:
+        return FormattedText([("", prefix), *fragments])
+    return fragments
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render(raw_text: str, resolved: tuple, key_version: int, extra_offset: int) -> FormattedText:
+    if resolved:
         try:
-            resolved = {k: v() if callable(v) else v for k, v in format_template.items()}
-            raw_text = raw_text.format(**resolved)
+            raw_text = raw_text.format(**dict(resolved))
         except ValueError as e:
             g.logger.warning(f"Error parsing {raw_text} - {e}")
-    if g.config is not None:
-        if _cached_keys is None:
-            _cached_keys = g.config.keys.get_all_values()
-
-        for key_tag, key_val in _cached_keys.items():
-            display_val = KEY_ALIAS.get(key_val.lower(), key_val).upper()
-            raw_text = raw_text.replace(f"[{key_tag}]", display_val)
-
-    for tag, code in COLORS.items():
-        raw_text = raw_text.replace(tag, code)
     if extra_offset:
         raw_text = ' '*extra_offset + raw_text + ' '*extra_offset
-    if get_len:
-        return len(raw_text)
-    return ANSI(prefix+raw_text)
\ No newline at end of file
+    table = _key_tables.get(key_version)
+    return _tokenize(raw_text, table.values if table else {})
+
+def _tokenize(text: str, key_values: dict[str, str]) -> FormattedText:
+    """One pass over the tags: key tags become the key's name, style tags start a new fragment, anything else stays as written"""
+    fragments = []
+    pieces = []
+    style = {"color": "", "bold": "", "underline": ""}
+    current = ""
+    position = 0
+    for match in _TAG.finditer(text):
+        tag = match.group(1)
+        if tag in key_values:
+            pieces.append(text[position:match.start()])
+            pieces.append(key_values[tag])
+            position = match.end()
+            continue
+        if tag not in STYLE_TAGS:
+            continue
+        pieces.append(text[position:match.start()])
+        position = match.end()
+
+        change = STYLE_TAGS[tag]
+        if change is None:
+            style = {"color": "", "bold": "", "underline": ""}
+        else:
+            style[change[0]] = change[1]
+        new = " ".join(part for part in style.values() if part)
+        if new != current:
+            run = "".join(pieces)
+            if run:
+                fragments.append((current, run))
+            pieces = []
+            current = new
+    pieces.append(text[position:])
+    run = "".join(pieces)
+    if run:
+        fragments.append((current, run))
+    return FormattedText(fragments)